@@ -29,6 +29,38 @@ echo ""
 echo "目標使用者: $TARGET_USER"
 echo ""
 
+# 安裝 NTP 同步輔助腳本（root 擁有、內容固定，一次 sudo 完成啟用 NTP + 重啟 timesyncd）
+# 不直接授權 sudo bash -c：那等同於完整 root 權限
+NTP_HELPER="/usr/local/sbin/qtdashboard-ntp-sync"
+
+echo "正在安裝 NTP 同步輔助腳本: $NTP_HELPER"
+
+NTP_HELPER_TMP="$(mktemp)"
+cat > "$NTP_HELPER_TMP" << 'HELPER_EOF'
+#!/bin/sh
+# QTdashboard NTP 同步輔助腳本（由 setup_sudoers.sh 安裝）
+#   start: 啟用 NTP 並重啟 systemd-timesyncd 強制同步
+#   rtc:   將系統時間寫入 RTC
+set -e
+case "$1" in
+    start)
+        timedatectl set-ntp true
+        systemctl restart systemd-timesyncd
+        ;;
+    rtc)
+        hwclock -w
+        ;;
+    *)
+        echo "usage: $0 start|rtc" >&2
+        exit 2
+        ;;
+esac
+HELPER_EOF
+install -o root -g root -m 0755 "$NTP_HELPER_TMP" "$NTP_HELPER"
+rm -f "$NTP_HELPER_TMP"
+echo "✓ 輔助腳本已安裝"
+echo ""
+
 # 建立 sudoers.d 設定檔
 SUDOERS_FILE="/etc/sudoers.d/qtdashboard"
 
@@ -55,6 +87,10 @@ $TARGET_USER ALL=(ALL) NOPASSWD: /usr/bin/chronyc
 # systemd 時間同步服務
 $TARGET_USER ALL=(ALL) NOPASSWD: /bin/systemctl restart systemd-timesyncd
 $TARGET_USER ALL=(ALL) NOPASSWD: /usr/bin/systemctl restart systemd-timesyncd
+
+# NTP 同步輔助腳本（一次完成 set-ntp + 重啟 timesyncd，以及寫入 RTC）
+$TARGET_USER ALL=(ALL) NOPASSWD: $NTP_HELPER start
+$TARGET_USER ALL=(ALL) NOPASSWD: $NTP_HELPER rtc
 EOF
 
 # 設定正確的權限（sudoers 檔案必須是 0440）
@@ -71,6 +107,38 @@ else
     exit 1
 fi
 
+# 建立 polkit 規則：允許透過 D-Bus 啟用 NTP 並重啟 systemd-timesyncd（免 sudo）
+POLKIT_RULES_DIR="/etc/polkit-1/rules.d"
+POLKIT_FILE="$POLKIT_RULES_DIR/50-qtdashboard.rules"
+
+if [ -d "$POLKIT_RULES_DIR" ]; then
+    echo ""
+    echo "正在建立 polkit 規則: $POLKIT_FILE"
+    cat > "$POLKIT_FILE" << EOF
+// QTdashboard 時間同步權限
+// 此檔案由 setup_sudoers.sh 自動產生
+polkit.addRule(function(action, subject) {
+    if (subject.user != "$TARGET_USER") {
+        return polkit.Result.NOT_HANDLED;
+    }
+    if (action.id == "org.freedesktop.timedate1.set-ntp") {
+        return polkit.Result.YES;
+    }
+    if (action.id == "org.freedesktop.systemd1.manage-units" &&
+        action.lookup("unit") == "systemd-timesyncd.service" &&
+        action.lookup("verb") == "restart") {
+        return polkit.Result.YES;
+    }
+    return polkit.Result.NOT_HANDLED;
+});
+EOF
+    chmod 0644 "$POLKIT_FILE"
+    echo "✓ polkit 規則已建立"
+else
+    echo ""
+    echo "找不到 $POLKIT_RULES_DIR，略過 polkit 規則（時間同步將改用 sudo timedatectl）"
+fi
+
 echo ""
 echo "=============================================="
 echo "✓ 設定完成！"
@@ -81,6 +149,7 @@ echo "  - sudo reboot       (系統重啟)"
 echo "  - sudo shutdown     (系統關機)"
 echo "  - sudo ntpdate      (NTP 時間同步)"
 echo "  - sudo timedatectl  (時間設定)"
+echo "  - sudo $NTP_HELPER start|rtc  (NTP 同步 / 寫入 RTC)"
 echo ""
 echo "現在 QTdashboard 可以:"
 echo "  ✓ 從控制面板直接重啟/關機"
@@ -88,4 +157,6 @@ echo "  ✓ 啟動時自動同步網路時間"
 echo ""
 echo "如需移除這些權限，執行:"
 echo "  sudo rm $SUDOERS_FILE"
+echo "  sudo rm -f $NTP_HELPER"
+echo "  sudo rm -f $POLKIT_FILE"
 echo ""
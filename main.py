@@ -4,9 +4,19 @@ import time
 import platform
 import gc
 import json
+import logging
+import socket
+import threading
 import subprocess
 from collections import deque
 
+# orjson（C 實作）可選：有安裝時用於 MQTT 遙測編碼與訊息解析，否則退回標準 json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # === 螢幕電源管理設定 ===
 try:
     subprocess.run(['xset', 's', 'off'], capture_output=True)        # 關閉螢幕保護
@@ -43,22 +53,22 @@ def get_spotify_cache_path():
 def get_mqtt_config_path():
     return os.path.join(PROJECT_ROOT, "mqtt_config.json")
 
-from PyQt6.QtWidgets import QWidget, QApplication, QStackedWidget, QStackedLayout, QLabel, QGridLayout, QHBoxLayout, QVBoxLayout, QSizePolicy
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, pyqtSlot, QPoint, QPropertyAnimation, QEasingCurve, QRectF
-from PyQt6.QtGui import QPainter, QColor, QPen, QPainterPath, QLinearGradient, QKeyEvent
+from PyQt6.QtWidgets import QWidget, QApplication, QStackedWidget, QLabel, QGridLayout, QHBoxLayout, QVBoxLayout, QSizePolicy
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QThreadPool, pyqtSlot, QPoint, QPropertyAnimation, QEasingCurve, QRectF
+from PyQt6.QtGui import QPainter, QColor, QPen, QPainterPath, QLinearGradient, QKeyEvent, QPixmapCache, QFont
 
-from ui.control_panel import TurnSignalBar, ControlPanel
+from ui.control_panel import TurnSignalBar, ControlPanel, pending_restart, exec_restart
 from ui.mqtt_settings import MQTTSettingsSignals, MQTTSettingsDialog
 from ui.telegram_settings import TelegramSettingsDialog
 from ui.analog_gauge import AnalogGauge
 from ui.gauge_card import DigitalGaugeCard, QuadGaugeCard, QuadGaugeDetailView
-from ui.common import GaugeStyle, RadarOverlay, ClickableLabel, MarqueeLabel, ToastManager
+from ui.common import GaugeStyle, RadarOverlay, BrightnessOverlay, CardDeck, ClickableLabel, MarqueeLabel, ToastManager
 from ui.splash_screen import SplashScreen
 from ui.door_card import DoorStatusCard
 from ui.trip_card import OdometerCard, OdometerCardWide, TripCard, TripCardWide, TripInfoCardWide
 from ui.music_card import MusicCard, MusicCardWide
 from ui.navigation_card import NavigationCard
-from ui.threads import GPSMonitorThread, RadarMonitorThread
+from ui.threads import GPSMonitorThread, RadarMonitorThread, NetworkMonitorThread, TelemetryPublisher, BackgroundTask
 from ui.scalable_window import ScalableWindow
 from ui.numeric_keypad import NumericKeypad
 from ui.theme import get_theme_manager, T, reapply_t_function
@@ -111,9 +121,6 @@ class Dashboard(QWidget):
     # 導航相關 Signal
     signal_update_navigation = pyqtSignal(dict)  # 傳遞導航資料字典
     
-    # 網路狀態 Signal
-    signal_update_network = pyqtSignal(bool)  # 傳遞網路狀態 (is_connected)
-    
     # 手煞車 Signal
     signal_update_parking_brake = pyqtSignal(bool)  # 傳遞手煞車狀態 (is_engaged)
     
@@ -129,16 +136,127 @@ class Dashboard(QWidget):
     # Toast notification Signal (可從背景執行緒安全觸發)
     signal_show_toast = pyqtSignal(str, str, int)
 
+    # 儀表板共用樣式表：背景 + 中央標籤 + 指示點，依 objectName / 動態屬性套用。
+    # 只在 Dashboard 上設定一次，Qt 解析一次後以 selector 比對各 widget；
+    # 狀態切換改設屬性再 repolish，不必重新解析整段 QSS。
+    # 中央標籤的字型由 _make_font() 在建立時設定，QSS 只負責顏色與背景，
+    # repolish 時不必再做字型比對。
+    _DASHBOARD_QSS = """
+        QWidget {{
+            background-color: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                stop:0 {bg_dark}, stop:0.5 #15151a, stop:1 {bg_dark});
+        }}
+        QLabel#parkingBrakeLabel {{
+            color: #f66;
+            background: transparent;
+            border: none;
+        }}
+        QLabel#parkingBrakeLabel[engaged="true"] {{
+            background: rgba(255, 100, 100, 0.2);
+            border: 2px solid #f66;
+            border-radius: 25px;
+        }}
+        QLabel#cruiseLabel {{
+            color: #ffffff;
+            background: transparent;
+        }}
+        QLabel#cruiseLabel[engaged="true"] {{ color: #4ade80; }}
+        QLabel#gearLabel {{
+            color: {success};
+            background: rgba(30, 30, 40, 0.8);
+            border: 4px solid #456;
+            border-radius: 20px;
+        }}
+        QLabel#gearLabel[tone="blue"] {{ color: #6af; }}
+        QLabel#gearLabel[tone="red"] {{ color: #f66; }}
+        QLabel#gearLabel[tone="orange"] {{ color: #fa6; }}
+        QLabel#gearLabel[tone="green"] {{ color: #4ade80; }}
+        QLabel#gearLabel[tone="purple"] {{ color: #f6f; }}
+        QLabel#gearLabel[tone="yellow"] {{ color: #ff6; }}
+        QLabel#speedLabel {{
+            color: {text_primary};
+            background: transparent;
+        }}
+        QLabel#unitLabel {{
+            color: {text_secondary};
+            background: transparent;
+        }}
+        QLabel[role="dot"] {{ color: #444; font-size: 18px; }}
+        QLabel[role="rowDot"] {{ color: #444; font-size: 16px; }}
+        QLabel[role="dot"][active="true"], QLabel[role="rowDot"][active="true"] {{ color: #6af; }}
+    """
+    # 智能 GC 間隔：靜止時每小時一次，行駛中延後 1 分鐘重試
+    _GC_INTERVAL_MS = 60 * 60 * 1000
+    _GC_RETRY_MS = 60 * 1000
+
+    # 遙測內容沒變時最多隔這麼久（秒）仍重送一次，讓 retained 訊息的 timestamp 保持新鮮
+    _TELEMETRY_KEEPALIVE_SEC = 300
+    # 狀態欄位（引擎、檔位、車門、手煞車、定速）沒變時，retained 訊息最多隔這麼久（秒）才更新一次
+    _TELEMETRY_RETAIN_INTERVAL_SEC = 300
+
+    # 方向燈 CAN 狀態 → (左燈, 右燈)；None 表示維持原狀態
+    TURN_TABLE = {
+        "left_on": (True, False),
+        "left_off": (False, None),
+        "right_on": (False, True),
+        "right_off": (None, False),
+        "both_on": (True, True),
+        "both_off": (False, False),
+        "off": (False, False),
+    }
+
+    # 門代碼 → DoorStatusCard 屬性名稱（遙測與 set_door_status 共用）
+    DOOR_ATTRS = (
+        ('FL', 'door_fl_closed'), ('FR', 'door_fr_closed'),
+        ('RL', 'door_rl_closed'), ('RR', 'door_rr_closed'),
+        ('BK', 'door_bk_closed'),
+    )
+    _DOOR_ATTR_BY_CODE = dict(DOOR_ATTRS)
+
+    # set_speed/set_rpm/set_temperature/set_fuel：變化小於門檻的重複值不轉送到 slot，
+    # 但至少每 0.5 秒轉送一次（行程距離積分與各 slot 的時間基準仍需要持續輸入）
+    _FORWARD_REFRESH_SEC = 0.5
+    _SPEED_FORWARD_THRESHOLD = 0.25  # km/h
+    _RPM_FORWARD_THRESHOLD = 0.01    # x1000 rpm（10 rpm）
+    _PERCENT_FORWARD_THRESHOLD = 0.5  # 水溫 / 油量百分比
+
+    # 里程積分心跳間隔：行駛中 100ms，靜止時放慢到 500ms
+    _PHYSICS_INTERVAL_MS = 100
+    _PHYSICS_IDLE_INTERVAL_MS = 500
+
+    # 亮度覆蓋層遮罩 alpha（索引 = 亮度等級；1 = 25% 黑, 2 = 50% 黑）
+    _BRIGHTNESS_ALPHA = (0, int(0.25 * 255), int(0.50 * 255))
+
+    # 檔位 → 顏色屬性（對應 _DASHBOARD_QSS 的 QLabel#gearLabel[tone=...]）
+    _GEAR_TONES = {
+        "P": "blue", "1": "blue", "2": "blue", "3": "blue", "4": "blue", "5": "blue",
+        "R": "red", "N": "orange", "D": "green", "S": "purple", "L": "yellow",
+    }
+
+    # GPS 圖示/速度標籤樣式模板（顏色依目前主題於套用時填入）
+    _GPS_ICON_QSS = "color: {}; font-size: 18px; font-weight: bold; background: transparent;"
+    _GPS_SPEED_QSS = "color: {}; font-size: 16px; font-weight: bold; background: transparent;"
+    # GPS 顯示狀態 → (圖示文字, 主題色 key, tooltip, 是否清空速度)
+    _GPS_STATES = {
+        "not_found": ("GPS!", "GPS_NOT_FOUND", "GPS: 未偵測到裝置", True),
+        "external_fresh": ("GPS*", "GPS_EXTERNAL_FRESH", "GPS: External (MQTT) - 即時", False),
+        "external_stale": ("GPS*", "GPS_EXTERNAL_STALE", "GPS: External (MQTT) - 最後位置", False),
+        "internal": ("GPS", "GPS_INTERNAL", "GPS: Fixed (3D)", False),
+        "searching": ("GPS", "TEXT_DISABLED", "GPS: Searching...", True),
+    }
+
     def __init__(self, skip_gps=False):
         super().__init__()
         self._dashboard_started_at = time.time()
+        # 詳細除錯輸出開關：建立時讀一次環境變數，CAN/MQTT 熱路徑只看這個 bool
+        self._perf_log = os.environ.get('PERF_MONITOR', '').lower() in ('1', 'true', 'yes')
 
         # === 初始化主題系統（載入強調色設定）===
         _ = get_theme_manager()
         
         # === 禁用 Python 自動 GC ===
         # 在桌面環境下，自動 GC 可能會與桌面合成器競爭資源導致凍結
-        # 改由 _incremental_gc() 每 5 分鐘在背景手動執行
+        # 改由 _incremental_gc() 在車輛靜止時手動執行（啟動完成後凍結長駐物件）
         gc.disable()
         print("[GC] 已禁用自動垃圾回收，改為手動控制")
         
@@ -155,6 +273,8 @@ class Dashboard(QWidget):
         self._skip_gps = skip_gps  # 標記是否跳過 GPS 初始化
         self._speed_limit_flashing = False
         self._speed_limit_timer = 0
+        self._speed_limit_query_active = False  # 由 heartbeat 每 5 秒查詢速限（GPS 失鎖時暫停）
+        self._heartbeat_count = 0
         
         # 連接 Signals 到 Slots
         self.signal_update_rpm.connect(self._slot_set_rpm)
@@ -176,9 +296,6 @@ class Dashboard(QWidget):
         # 連接導航 Signal
         self.signal_update_navigation.connect(self._slot_update_navigation)
         
-        # 連接網路狀態 Signal
-        self.signal_update_network.connect(self._update_network_status)
-        
         # 連接手煞車 Signal
         self.signal_update_parking_brake.connect(self._slot_update_parking_brake)
         
@@ -201,13 +318,13 @@ class Dashboard(QWidget):
         # 適配 1920x480 螢幕
         self.setFixedSize(1920, 480)
         
-        # Carbon fiber like background
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 {T('BG_DARK')}, stop:0.5 #15151a, stop:1 {T('BG_DARK')});
-            }}
-        """)
+        # Carbon fiber like background + 中央標籤/指示點共用樣式
+        self.setStyleSheet(self._DASHBOARD_QSS.format(
+            bg_dark=T('BG_DARK'),
+            success=T('SUCCESS'),
+            text_primary=T('TEXT_PRIMARY'),
+            text_secondary=T('TEXT_SECONDARY'),
+        ))
         
         # 下拉面板相關
         self.control_panel = None
@@ -216,6 +333,13 @@ class Dashboard(QWidget):
         self.panel_touch_start = None
         self.panel_drag_active = False
 
+        # datagrab 模組參考與校正狀態快取（GPS 速度熱路徑不再每次 import / 查詢）
+        import vehicle.datagrab as datagrab
+        self._dg = datagrab
+        self._speed_calibration_enabled = datagrab.is_speed_calibration_enabled()
+        self._gps_style_key = None  # 上次套用的 (GPS 狀態, 顏色)
+        self._last_gps_speed_key = None  # 上次顯示的 GPS 速度標籤內容
+
         # 速度同步模式（calibrated -> fixed -> gps）
         self.speed_sync_modes = ["calibrated", "fixed", "gps"]
         self.speed_sync_mode = "calibrated"
@@ -259,7 +383,7 @@ class Dashboard(QWidget):
 
     def _perf_logging_enabled(self):
         """True when verbose runtime diagnostics are explicitly enabled."""
-        return os.environ.get('PERF_MONITOR', '').lower() in ('1', 'true', 'yes')
+        return self._perf_log
     
     def _update_gps_status(self, is_fixed):
         """更新 GPS 狀態圖示"""
@@ -268,12 +392,12 @@ class Dashboard(QWidget):
         
         # GPS 穩定時啟動速限查詢計時器，否則暫停
         if is_fixed:
-            if hasattr(self, 'speed_limit_query_timer') and not self.speed_limit_query_timer.isActive():
-                self.speed_limit_query_timer.start()
+            if not self._speed_limit_query_active:
+                self._speed_limit_query_active = True
                 print("[SpeedLimit] GPS fixed, starting query timer")
         else:
-            if hasattr(self, 'speed_limit_query_timer') and self.speed_limit_query_timer.isActive():
-                self.speed_limit_query_timer.stop()
+            if self._speed_limit_query_active:
+                self._speed_limit_query_active = False
                 # 立即隱藏速限
                 self.current_speed_limit = None
                 self.current_speed_limit_dual = None
@@ -310,80 +434,73 @@ class Dashboard(QWidget):
         """根據 GPS 狀態和來源應用樣式"""
         # 優先判斷：無裝置
         if self.gps_device_found == False:
-            self.gps_icon_label.setText("GPS!")
-            self.gps_icon_label.setStyleSheet(f"color: {T('GPS_NOT_FOUND')}; font-size: 18px; font-weight: bold; background: transparent;")
-            self.gps_icon_label.setToolTip("GPS: 未偵測到裝置")
-            self.gps_speed_label.setText("--")
-            self.gps_speed_label.setStyleSheet(f"color: {T('GPS_NOT_FOUND')}; font-size: 16px; font-weight: bold; background: transparent;")
+            state = "not_found"
         elif self.is_gps_fixed:
             if self.is_using_external_gps:
-                if self.is_external_gps_fresh:
-                    # 黃色 (External GPS - 即時)
-                    self.gps_icon_label.setText("GPS*")
-                    self.gps_icon_label.setStyleSheet(f"color: {T('GPS_EXTERNAL_FRESH')}; font-size: 18px; font-weight: bold; background: transparent;")
-                    self.gps_icon_label.setToolTip("GPS: External (MQTT) - 即時")
-                    self.gps_speed_label.setStyleSheet(f"color: {T('GPS_EXTERNAL_FRESH')}; font-size: 16px; font-weight: bold; background: transparent;")
-                else:
-                    # 灰色 (External GPS - 過時但可用)
-                    self.gps_icon_label.setText("GPS*")
-                    self.gps_icon_label.setStyleSheet(f"color: {T('GPS_EXTERNAL_STALE')}; font-size: 18px; font-weight: bold; background: transparent;")
-                    self.gps_icon_label.setToolTip("GPS: External (MQTT) - 最後位置")
-                    self.gps_speed_label.setStyleSheet(f"color: {T('GPS_EXTERNAL_STALE')}; font-size: 16px; font-weight: bold; background: transparent;")
+                # 黃色 (External GPS - 即時) / 灰色 (External GPS - 過時但可用)
+                state = "external_fresh" if self.is_external_gps_fresh else "external_stale"
             else:
                 # 綠色 (Internal Fix)
-                self.gps_icon_label.setText("GPS")
-                self.gps_icon_label.setStyleSheet(f"color: {T('GPS_INTERNAL')}; font-size: 18px; font-weight: bold; background: transparent;")
-                self.gps_icon_label.setToolTip("GPS: Fixed (3D)")
-                self.gps_speed_label.setStyleSheet(f"color: {T('GPS_INTERNAL')}; font-size: 16px; font-weight: bold; background: transparent;")
+                state = "internal"
         else:
             # 灰色 (No Fix - 搜尋中)
-            self.gps_icon_label.setText("GPS")
-            self.gps_icon_label.setStyleSheet(f"color: {T('TEXT_DISABLED')}; font-size: 18px; font-weight: bold; background: transparent;")
-            self.gps_icon_label.setToolTip("GPS: Searching...")
-            self.gps_speed_label.setText("--")
-            self.gps_speed_label.setStyleSheet(f"color: {T('TEXT_DISABLED')}; font-size: 16px; font-weight: bold; background: transparent;")
+            state = "searching"
         
-        # Force Style Update
-        self.gps_icon_label.style().unpolish(self.gps_icon_label)
-        self.gps_icon_label.style().polish(self.gps_icon_label)
-        self.gps_icon_label.update()
+        text, color_key, tooltip, clear_speed = self._GPS_STATES[state]
+        color = T(color_key)
+        # 狀態與主題色都沒變 → 不重設（setStyleSheet 會觸發 QSS 重新解析與 repolish）
+        if (state, color) == self._gps_style_key:
+            return
+        self._gps_style_key = (state, color)
+        
+        self.gps_icon_label.setText(text)
+        self.gps_icon_label.setStyleSheet(self._GPS_ICON_QSS.format(color))
+        self.gps_icon_label.setToolTip(tooltip)
+        if clear_speed:
+            self.gps_speed_label.setText("--")
+            self._last_gps_speed_key = None  # 文字已被覆寫，下一筆速度需重新顯示
+        self.gps_speed_label.setStyleSheet(self._GPS_SPEED_QSS.format(color))
 
     def _update_gps_speed(self, speed_kmh):
         """更新 GPS 速度"""
         self.current_gps_speed = speed_kmh
         
-        # 更新左上角的 GPS 速度顯示
-        if self.is_gps_fixed:
-            # 檢查是否在校正模式
-            import vehicle.datagrab as datagrab
-            try:
-                calibration_enabled = datagrab.is_speed_calibration_enabled()
-            except:
-                calibration_enabled = False
-            
-            if calibration_enabled:
-                # 校正模式：顯示速度和校正係數
-                correction = datagrab.get_speed_correction()
-                self.gps_speed_label.setText(f"{int(speed_kmh)}({correction:.2f})")
-                self.gps_speed_label.setFixedWidth(90)  # 加寬以容納校正係數
+        # 更新左上角的 GPS 速度顯示（顯示內容沒變就不重設文字與寬度）
+        calibration_enabled = self._speed_calibration_enabled
+        key = (int(speed_kmh), round(self.speed_correction, 2) if calibration_enabled else None,
+               self.is_gps_fixed, calibration_enabled)
+        if key != self._last_gps_speed_key:
+            self._last_gps_speed_key = key
+            if self.is_gps_fixed:
+                # 校正模式狀態由控制面板切換時通知，校正係數由 _maybe_update_speed_correction 維護
+                if calibration_enabled:
+                    # 校正模式：顯示速度和校正係數
+                    self.gps_speed_label.setText(f"{int(speed_kmh)}({self.speed_correction:.2f})")
+                    self.gps_speed_label.setFixedWidth(90)  # 加寬以容納校正係數
+                else:
+                    # 一般模式：只顯示速度
+                    self.gps_speed_label.setText(f"{int(speed_kmh)}")
+                    self.gps_speed_label.setFixedWidth(50)
             else:
-                # 一般模式：只顯示速度
-                self.gps_speed_label.setText(f"{int(speed_kmh)}")
+                self.gps_speed_label.setText("--")
                 self.gps_speed_label.setFixedWidth(50)
-        else:
-            self.gps_speed_label.setText("--")
-            self.gps_speed_label.setFixedWidth(50)
         
         # 檢查是否應該顯示 GPS 速度
         # 條件: 速度同步開啟(datagrab.gps_speed_mode) AND GPS 定位完成 AND OBD速度 >= 20
-        import vehicle.datagrab as datagrab
-        use_gps = (datagrab.gps_speed_mode and 
+        use_gps = (self._dg.gps_speed_mode and 
                    self.is_gps_fixed and 
                    self.speed >= 20.0)
                    
         if use_gps:
-            # 直接更新顯示，覆蓋 CAN 速度
-            self.speed_label.setText(f"{int(speed_kmh)}")
+            # 直接更新顯示，覆蓋 CAN 速度（整數值沒變就不重設文字）
+            speed_text = str(int(speed_kmh))
+            if self.speed_label.text() != speed_text:
+                self.speed_label.setText(speed_text)
+    
+    def _on_speed_calibration_toggled(self, enabled):
+        """控制面板切換速度校正模式時更新快取"""
+        self._speed_calibration_enabled = enabled
+        self.speed_correction = self._dg.get_speed_correction()
     
     def _update_gps_position(self, lat, lon):
         """更新 GPS 座標（速限由計時器每 5 秒查詢一次）"""
@@ -455,8 +572,18 @@ class Dashboard(QWidget):
         
         self.speed_limit_circle_label.setText(str(limit))
     
+    def _heartbeat_tick(self):
+        """0.5 秒 heartbeat：依計數分派較慢的週期工作"""
+        self._heartbeat_count += 1
+        tick = self._heartbeat_count
+        self._update_speed_limit_flash()
+        if tick % 2 == 0:
+            self.update_time_display()
+        if tick % 10 == 0 and self._speed_limit_query_active:
+            self._update_speed_limit()
+
     def _update_speed_limit_flash(self):
-        """速限閃爍計時器 callback"""
+        """速限閃爍 callback（由 _heartbeat_tick 每 0.5 秒呼叫）"""
         if not self._speed_limit_flashing:
             return
 
@@ -575,11 +702,7 @@ class Dashboard(QWidget):
         center_layout.addWidget(self.gps_icon_label)
         center_layout.addStretch()
         
-        # 更新時間
-        self.time_timer = QTimer()
-        self.time_timer.timeout.connect(self.update_time_display)
-        # Timer 啟動延遲到 start_dashboard() 調用時
-        # self.time_timer.start(1000)
+        # 更新時間（由 start_dashboard() 啟動的 heartbeat_timer 每秒更新）
         self.update_time_display()
         
         # === 右側區域：漸層條（從1/4到最右）+ 圖標疊在上面 ===
@@ -625,11 +748,10 @@ class Dashboard(QWidget):
         self.left_gradient_pos = 0.0
         self.right_gradient_pos = 0.0
         
-        # 動畫計時器 - 用於平滑的漸層效果
+        # 動畫計時器 - 保留給原本的平滑漸層動畫（見 update_gradient_animation 中已註解的代碼）
+        # 目前刻意不啟動：方向燈為靜態開關，CAN 訊號一到就在 slot 中直接更新樣式
         self.animation_timer = QTimer()
         self.animation_timer.timeout.connect(self.update_gradient_animation)
-        # Timer 啟動延遲到 start_dashboard() 調用時
-        # self.animation_timer.start(16)  # 約 60 FPS
         
         return status_bar
     
@@ -748,8 +870,13 @@ class Dashboard(QWidget):
         
         # === 創建下拉控制面板（初始隱藏在螢幕上方）===
         self.control_panel = ControlPanel(self)
+        self.control_panel.speed_calibration_toggled.connect(self._on_speed_calibration_toggled)
         self.control_panel.setGeometry(0, -300, 1920, 300)
         self.control_panel.raise_()  # 確保在最上層
+        # 展開/收起共用同一個動畫物件，只更新起訖值
+        self.panel_animation = QPropertyAnimation(self.control_panel, b"geometry", self)
+        self.panel_animation.setDuration(300)  # 300ms
+        self.panel_animation.finished.connect(self._on_panel_animation_finished)
         
         # === 主儀表板區域（三欄式佈局）===
         dashboard_container = QWidget()
@@ -840,10 +967,10 @@ class Dashboard(QWidget):
             dot = QLabel("●")
             dot.setFixedSize(12, 12)
             dot.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            dot.setStyleSheet("color: #444; font-size: 18px;")
+            dot.setProperty("role", "dot")
+            dot.setProperty("active", i == 0)
             self.left_indicators.append(dot)
             left_indicator_layout.addWidget(dot)
-        self.left_indicators[0].setStyleSheet("color: #6af; font-size: 18px;")
         
         left_layout.addWidget(self.left_card_stack)
         left_layout.addWidget(left_indicator_widget)
@@ -853,9 +980,17 @@ class Dashboard(QWidget):
         # ========================================
         center_section = QWidget()
         center_section.setFixedWidth(480)  # 增加寬度以容納 3 位數時速
-        center_layout = QVBoxLayout(center_section)
-        center_layout.setSpacing(0)
+        # 單一 QGridLayout：row 0 = 手煞車/CRUISE，row 2/3 = 時速/單位（row 1/4 為上下彈性空間），
+        # col 0 = 檔位，col 1 = 時速（固定 300px 寬確保置中穩定），col 2 = 右側彈性空間；
+        # 速限浮動層與時速共用同一組格子疊加
+        center_layout = QGridLayout(center_section)
         center_layout.setContentsMargins(5, 10, 5, 10)
+        center_layout.setHorizontalSpacing(10)
+        center_layout.setVerticalSpacing(0)
+        center_layout.setRowStretch(1, 1)
+        center_layout.setRowStretch(4, 1)
+        center_layout.setColumnMinimumWidth(1, 300)
+        center_layout.setColumnStretch(2, 1)
         
         # === 上方：手煞車 + CRUISE 顯示區 ===
         indicator_row = QWidget()
@@ -874,84 +1009,41 @@ class Dashboard(QWidget):
         parking_brake_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         self.parking_brake_label = QLabel("")
+        self.parking_brake_label.setObjectName("parkingBrakeLabel")
+        self.parking_brake_label.setFont(self._make_font(32, bold=True))
         self.parking_brake_label.setFixedSize(50, 50)
-        self.parking_brake_label.setStyleSheet(f"""
-            color: {T('PARKING_BRAKE')};
-            font-size: 28px;
-            font-weight: bold;
-            font-family: Arial;
-            background: transparent;
-        """)
         self.parking_brake_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         parking_brake_layout.addWidget(self.parking_brake_label)
         
         # CRUISE 指示器（右側）
         self.cruise_label = QLabel("")
-        self.cruise_label.setStyleSheet(f"""
-            color: {T('SUCCESS')};
-            font-size: 40px;
-            font-weight: bold;
-            font-family: Arial;
-            background: transparent;
-            letter-spacing: 3px;
-        """)
+        self.cruise_label.setObjectName("cruiseLabel")
+        self.cruise_label.setFont(self._make_font(40, bold=True, letter_spacing=2))
         self.cruise_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         indicator_row_layout.addWidget(parking_brake_container)
         indicator_row_layout.addWidget(self.cruise_label, 1)
         
         # === 中央：檔位(左) + 時速(右) ===
-        speed_gear_widget = QWidget()
-        speed_gear_widget.setStyleSheet("background: transparent;")
-        speed_gear_layout = QHBoxLayout(speed_gear_widget)
-        speed_gear_layout.setContentsMargins(0, 0, 0, 0)
-        speed_gear_layout.setSpacing(10)
-        speed_gear_layout.setAlignment(Qt.AlignmentFlag.AlignVCenter)
-        
         # 檔位顯示（左側）- 可點擊切換顯示模式
         self.gear_label = ClickableLabel("P")
-        self.gear_label.setStyleSheet(f"""
-            color: {T('SUCCESS')};
-            font-size: 120px;
-            font-weight: bold;
-            font-family: Arial;
-            background: rgba(30, 30, 40, 0.8);
-            border: 4px solid #456;
-            border-radius: 20px;
-        """)
+        self.gear_label.setObjectName("gearLabel")
+        self.gear_label.setFont(self._make_font(120, bold=True))
         self.gear_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.gear_label.setFixedSize(140, 180)
         self.gear_label.clicked.connect(self._toggle_gear_display_mode)
         
-        # 時速區域（右側）
-        speed_container = QWidget()
-        speed_container.setStyleSheet("background: transparent;")
-        speed_layout = QVBoxLayout(speed_container)
-        speed_layout.setContentsMargins(0, 0, 0, 0)
-        speed_layout.setSpacing(0)
-        
         # 速度數字
         self.speed_label = QLabel("0")
-        self.speed_label.setStyleSheet(f"""
-            color: {T('TEXT_PRIMARY')};
-            font-size: 140px;
-            font-weight: bold;
-            font-family: 'Arial', 'Helvetica', sans-serif;
-            background: transparent;
-        """)
+        self.speed_label.setObjectName("speedLabel")
+        self.speed_label.setFont(self._make_font(140, bold=True))
         self.speed_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.speed_label.setFixedWidth(300)  # 固定寬度確保置中穩定
         
         # 單位標籤
         self.unit_label = QLabel("Km/h")
-        self.unit_label.setStyleSheet(f"""
-            color: {T('TEXT_SECONDARY')};
-            font-size: 28px;
-            font-family: Arial;
-            background: transparent;
-        """)
+        self.unit_label.setObjectName("unitLabel")
+        self.unit_label.setFont(self._make_font(28))
         self.unit_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.unit_label.setFixedWidth(300)  # 與時速同寬確保置中
         
         # 速限標籤
         self.speed_limit_label = QLabel("--")
@@ -990,12 +1082,6 @@ class Dashboard(QWidget):
         speed_limit_circle_layout.addWidget(self.speed_limit_circle_label)
         self.speed_limit_container.hide()
         
-        speed_layout.addWidget(self.speed_label)
-        speed_layout.addWidget(self.unit_label)
-        
-        speed_gear_layout.addWidget(self.gear_label)
-        speed_gear_layout.addWidget(speed_container, 1)
-        
         # 速限文字浮動區（疊加在底部，右下角）
         speed_limit_float_widget = QWidget()
         speed_limit_float_widget.setFixedWidth(440)
@@ -1014,20 +1100,14 @@ class Dashboard(QWidget):
         speed_limit_circle_float_layout.setSpacing(0)
         speed_limit_circle_float_layout.addWidget(self.speed_limit_container, 1, 1, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignRight)
         
-        # 組合中央區域佈局（使用 StackedLayout 實現疊加效果）
-        center_stack_layout = QStackedLayout()
-        center_stack_layout.setStackingMode(QStackedLayout.StackingMode.StackAll)
-        center_stack_layout.addWidget(speed_gear_widget)
-        center_stack_layout.addWidget(speed_limit_float_widget)
-        center_stack_layout.addWidget(speed_limit_circle_float_widget)
-        
-        # 疊加層容器
-        stack_container = QWidget()
-        stack_container.setLayout(center_stack_layout)
-        stack_container.setStyleSheet("background: transparent;")
-        
-        center_layout.addWidget(indicator_row)
-        center_layout.addWidget(stack_container, 1)
+        # 組合中央區域：速限浮動層先加入（位於底層），檔位與時速後加入疊在上方，
+        # 確保檔位標籤仍可點擊
+        center_layout.addWidget(indicator_row, 0, 0, 1, 3)
+        center_layout.addWidget(speed_limit_float_widget, 1, 0, 4, 3, Qt.AlignmentFlag.AlignLeft)
+        center_layout.addWidget(speed_limit_circle_float_widget, 1, 0, 4, 3, Qt.AlignmentFlag.AlignLeft)
+        center_layout.addWidget(self.gear_label, 2, 0, 2, 1, Qt.AlignmentFlag.AlignVCenter)
+        center_layout.addWidget(self.speed_label, 2, 1)
+        center_layout.addWidget(self.unit_label, 3, 1)
         
         # ========================================
         # 右側區域：寬卡片（雙層，可左右滑動）
@@ -1051,10 +1131,10 @@ class Dashboard(QWidget):
             dot = QLabel("●")
             dot.setFixedSize(16, 16)
             dot.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            dot.setStyleSheet("color: #444; font-size: 16px;")
+            dot.setProperty("role", "rowDot")
+            dot.setProperty("active", i == 0)
             self.row_indicators.append(dot)
             row_indicator_layout.addWidget(dot)
-        self.row_indicators[0].setStyleSheet("color: #6af; font-size: 16px;")
         
         # 右側卡片區（卡片堆疊 + 底部卡片指示器）
         right_cards_section = QWidget()
@@ -1063,12 +1143,11 @@ class Dashboard(QWidget):
         right_cards_layout.setSpacing(5)
         
         # 右側使用雙層架構 - 列 (rows) 包含多個卡片 (cards)
-        self.row_stack = QStackedWidget()
-        self.row_stack.setFixedSize(800, 380)
+        # 使用 CardDeck 以 show/hide 切換，避免 QStackedWidget 每次切換都重算版面
+        self.row_stack = CardDeck(800, 380)
         
         # === 第一列：音樂卡片 / 導航卡片 / 門狀態卡片 ===
-        row1_cards = QStackedWidget()
-        row1_cards.setFixedSize(800, 380)
+        row1_cards = CardDeck(800, 380)
         
         # 音樂卡片（寬版）
         self.music_card = MusicCardWide()
@@ -1086,8 +1165,7 @@ class Dashboard(QWidget):
         row1_cards.addWidget(self.door_card)   # row1_index 2
         
         # === 第二列：Trip 卡片 / ODO 卡片 / 行程資訊卡片 ===
-        row2_cards = QStackedWidget()
-        row2_cards.setFixedSize(800, 380)
+        row2_cards = CardDeck(800, 380)
         
         # Trip 卡片（寬版）
         self.trip_card = TripCardWide()
@@ -1124,10 +1202,10 @@ class Dashboard(QWidget):
             dot = QLabel("●")
             dot.setFixedSize(12, 12)
             dot.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            dot.setStyleSheet("color: #444; font-size: 18px;")
+            dot.setProperty("role", "dot")
+            dot.setProperty("active", i == 0)
             self.card_indicators.append(dot)
             card_indicator_layout.addWidget(dot)
-        self.card_indicators[0].setStyleSheet("color: #6af; font-size: 18px;")
         
         right_cards_layout.addWidget(self.row_stack)
         right_cards_layout.addWidget(card_indicator_container)
@@ -1143,6 +1221,8 @@ class Dashboard(QWidget):
         self.rows = [row1_cards, row2_cards]  # 列的引用
         self.row_card_counts = [3, 3]  # 每列的卡片數量（第一列: 音樂/導航/門, 第二列: Trip/ODO/行程資訊）
         self.left_card_count = 2       # 左側卡片數量（四宮格 + 油量，不含詳細視圖）
+        self._active_dots = {"left": 0, "row": 0, "card": 0}  # 各組指示器目前亮起的點
+        self._shown_card_dots = len(self.card_indicators)      # 右側卡片指示器目前顯示的數量
         
         # 觸控滑動相關
         self.touch_start_pos = None
@@ -1346,7 +1426,7 @@ class Dashboard(QWidget):
             self.show_toast("MQTT 尚未設定，熄火紀錄已先儲存", "warning", 4500)
             return
 
-        if not hasattr(self, "mqtt_client") or self.mqtt_client is None or not self._mqtt_connected:
+        if self.mqtt_client is None or not self._mqtt_connected:
             print("[ShutdownMQTT] MQTT 尚未連線，已先儲存熄火紀錄")
             self.show_toast("MQTT 尚未連線，熄火紀錄已先儲存", "warning", 4500)
             return
@@ -1381,7 +1461,6 @@ class Dashboard(QWidget):
             finally:
                 self._shutdown_mqtt_in_progress = False
 
-        import threading
         threading.Thread(target=_worker, daemon=True).start()
 
     def show_toast(self, message: str, level: str = "info", duration_ms: int = 3000):
@@ -1430,9 +1509,11 @@ class Dashboard(QWidget):
         self._show_shutdown_summary_card()
         self._publish_shutdown_mqtt_event()
         
-        # 釋放 GPS 資源，讓 location_notifier 可以接手
-        if hasattr(self, 'gps_monitor_thread') and self.gps_monitor_thread is not None:
-            self.gps_monitor_thread.stop()
+        # 要求 GPS 執行緒停止（最多等 50ms，不阻塞關機對話框）；
+        # serial port 會在目前這次讀取結束後（最多約 1 秒）才由執行緒自行關閉，
+        # 不保證此時已可交給 location_notifier（它在背景自行探測 port，有 10 秒逾時）
+        if self.gps_monitor_thread is not None:
+            self.gps_monitor_thread.stop(timeout_ms=50)
             
         self._shutdown_monitor.show_shutdown_dialog(self)
     
@@ -1451,19 +1532,17 @@ class Dashboard(QWidget):
         print("   可能原因: 儀表開機但車輛從未發動，OBD 無回應")
         print("   全程未發動，不記錄行程、不發送熄火 MQTT")
         
-        # 釋放 GPS 資源
-        if hasattr(self, 'gps_monitor_thread') and self.gps_monitor_thread is not None:
-            self.gps_monitor_thread.stop()
+        # 要求 GPS 執行緒停止（最多等 50ms，不阻塞關機對話框；port 稍後由執行緒自行關閉）
+        if self.gps_monitor_thread is not None:
+            self.gps_monitor_thread.stop(timeout_ms=50)
         
         # 顯示關機對話框（與電源中斷相同的處理）
         self._shutdown_monitor.show_shutdown_dialog(self)
     
     def _create_brightness_overlay(self):
         """創建亮度調節覆蓋層"""
-        self.brightness_overlay = QWidget(self)
+        self.brightness_overlay = BrightnessOverlay(self)
         self.brightness_overlay.setGeometry(0, 0, 1920, 480)
-        self.brightness_overlay.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)  # 讓滑鼠事件穿透
-        self.brightness_overlay.setStyleSheet("background: transparent;")
         self.brightness_overlay.hide()
         self.brightness_overlay.raise_()  # 確保在最上層
     
@@ -1472,6 +1551,8 @@ class Dashboard(QWidget):
         設定亮度等級
         level: 0=100% (全亮), 1=75%, 2=50%
         """
+        if level == self.brightness_level:
+            return
         self.brightness_level = level
         
         if level == 0:
@@ -1479,10 +1560,8 @@ class Dashboard(QWidget):
             self.brightness_overlay.hide()
             print("[亮度] 設定為 100%")
         else:
-            # 計算透明度 (level 1 = 25% 黑, level 2 = 50% 黑)
-            opacity = level * 0.25  # 0.25 或 0.50
-            alpha = int(opacity * 255)
-            self.brightness_overlay.setStyleSheet(f"background: rgba(0, 0, 0, {alpha});")
+            # 透明度 (level 1 = 25% 黑, level 2 = 50% 黑)，直接以 QPainter 填色
+            self.brightness_overlay.set_alpha(self._BRIGHTNESS_ALPHA[level])
             self.brightness_overlay.show()
             self.brightness_overlay.raise_()
             if hasattr(self, "toast_manager"):
@@ -1540,8 +1619,36 @@ class Dashboard(QWidget):
         self._spotify_connected = False
         self._spotify_init_attempts = 0
         self._spotify_integration = None  # Spotify 整合實例引用
+        self._spotify_task = None  # 執行中的 Spotify 初始化 BackgroundTask
         self._spotify_reauth_required = False
         self._mqtt_connected = False
+        self.mqtt_client = None  # paho MQTT client（_init_mqtt_client 建立）
+        self._mqtt_teardown_task = None  # 背景清理舊 client 的 BackgroundTask（進行中才非 None）
+        self._mqtt_publish_topic = "car/telemetry"  # 遙測發布主題（_init_mqtt_client 讀取設定檔時更新）
+        # 遙測 payload 範本：欄位固定，_publish_telemetry 每次只覆寫數值，不重建巢狀 dict
+        self._telemetry = {
+            'timestamp': 0.0, 'status': False, 'speed': 0, 'rpm': 0,
+            'coolant_temp': None, 'fuel': None, 'gear': None, 'turbo': None, 'battery': None,
+            'odo': 0.0, 'trip_a': 0.0, 'trip_b': 0.0,
+            'gps': {'lat': None, 'lon': None, 'fixed': False},
+            'doors': {'FL': 'off', 'FR': 'off', 'RL': 'off', 'RR': 'off', 'BK': 'off'},
+            'cruise': {'switch': False, 'engaged': False},
+            'parking_brake': False,
+        }
+        self._last_telemetry_key = None  # 上次發布的遙測內容（不含 timestamp）
+        self._odo_storage = OdometerStorage()  # 里程存儲（單例），遙測時直接讀取記憶體中的數值
+        self._last_telemetry_publish = 0.0  # 上次發布的 monotonic 時間
+        self._last_telemetry_retain = None  # 上次以 retain=True 發布的 monotonic 時間（None = 尚未發布）
+        self._last_retained_key = None  # 上次 retained 訊息中的狀態欄位
+        self._last_forwarded = {}  # set_* 介面上次轉送的 (值, monotonic 時間)
+        self._telemetry_publisher = TelemetryPublisher()  # 在背景執行緒寫 MQTT socket，避免卡住 UI
+        # 換檔等事件的即時上傳：500ms 內多次觸發只發布一次（避免 P↔N↔D 來回跳動時連續編碼/發布）
+        self._pending_immediate_publish = QTimer(self)
+        self._pending_immediate_publish.setSingleShot(True)
+        self._pending_immediate_publish.setInterval(500)
+        self._pending_immediate_publish.timeout.connect(self._publish_telemetry)
+        self.gps_monitor_thread = None  # GPS 監控執行緒（__init__ 依 skip_gps 建立）
+        self.network_monitor_thread = None  # 網路 / 服務健康監控執行緒（start_dashboard 建立）
         self._mqtt_reconnect_timer = None
         self._shutdown_mqtt_in_progress = False
         
@@ -1555,13 +1662,14 @@ class Dashboard(QWidget):
         self._last_battery_display = None
 
         # 速度校正狀態
-        import vehicle.datagrab as datagrab
-        self.speed_correction = datagrab.get_speed_correction()
+        self.speed_correction = self._dg.get_speed_correction()
         self._last_speed_cali_ts = 0
         
         # RPM 動畫平滑 (GUI 端二次平滑)
         self.target_rpm = 0.0  # 目標轉速
         self.rpm_animation_alpha = 0.3  # GUI 端平滑係數
+        self._rpm_one_minus_alpha = 1.0 - self.rpm_animation_alpha  # 預先算好，EMA 熱路徑不必每次相減
+        self._last_rpm_display = None  # 上次送到儀表的 RPM 量化值（每 20 rpm 一格）
         
         # 門狀態卡片自動切換
         self.door_auto_switch_timer = QTimer()
@@ -1576,12 +1684,12 @@ class Dashboard(QWidget):
         # 雷達自動切換（低速 + D/R檔 + 雷達觸發時自動切到門卡片）
         self.last_radar_auto_switch_time = 0  # 上次雷達自動切換時間
         
-        # 物理心跳 Timer（每 100ms 觸發一次，持續累積里程）
+        # 物理心跳 Timer（行駛中每 100ms、靜止時每 500ms 觸發一次，持續累積里程）
         self.physics_timer = QTimer()
         self.physics_timer.timeout.connect(self._physics_tick)
         # Timer 啟動延遲到 start_dashboard() 調用時
-        # self.physics_timer.start(100)  # 100ms = 0.1 秒
-        self.last_physics_time = time.time()
+        self.last_physics_time = time.monotonic()
+        self._physics_idle = False
         
         self.update_display()
         
@@ -1599,32 +1707,26 @@ class Dashboard(QWidget):
         self.jank_detector = JankDetector(threshold_ms=100)
         self.jank_detector.start()
         
-        # 啟動時間更新 Timer
-        self.time_timer.start(1000)
-        
         # 方向燈目前是靜態開關顯示，收到 CAN 狀態時會立即更新。
         # 不啟動 60 FPS 空轉 timer，避免主執行緒每秒被喚醒 60 次。
         
-        # 啟動速限閃爍 Timer
-        self.speed_limit_timer = QTimer()
-        self.speed_limit_timer.timeout.connect(self._update_speed_limit_flash)
-        self.speed_limit_timer.start(500)  # 閃爍節奏 0.5 秒，避免 20 FPS 空轉
-        
-        # 啟動速限查詢 Timer（每 5 秒查詢一次）
-        self.speed_limit_query_timer = QTimer()
-        self.speed_limit_query_timer.timeout.connect(self._update_speed_limit)
-        self.speed_limit_query_timer.start(5000)  # 5000ms = 5 秒
+        # 啟動 heartbeat Timer（0.5 秒）：速限閃爍、每秒時間更新、每 5 秒速限查詢
+        # 共用同一個計時器，取代三個各自喚醒事件迴圈的 QTimer
+        self._speed_limit_query_active = True
+        self.heartbeat_timer = QTimer()
+        self.heartbeat_timer.timeout.connect(self._heartbeat_tick)
+        self.heartbeat_timer.start(500)
         
         # 啟動物理心跳 Timer（里程累積）
-        self.last_physics_time = time.time()  # 重設時間基準
-        self.physics_timer.start(100)  # 100ms = 0.1 秒
+        self.last_physics_time = time.monotonic()  # 重設時間基準
+        self.physics_timer.start(self._PHYSICS_INTERVAL_MS)
         
-        # 啟動增量式垃圾回收 Timer（每 10 秒執行一次小型 GC）
-        # 更頻繁但更小量的 GC 可以避免物件累積後造成的長時間停頓
+        # 智能 GC 計時器：single-shot，1 小時後檢查一次；
+        # 車輛未靜止時改為 1 分鐘後再試，不再每 10 秒輪詢
         self.gc_timer = QTimer()
+        self.gc_timer.setSingleShot(True)
         self.gc_timer.timeout.connect(self._incremental_gc)
-        self.gc_timer.start(10000)  # 每 10 秒
-        self._gc_counter = 0
+        self.gc_timer.start(self._GC_INTERVAL_MS)
         
         # 初始化 Spotify（除非被跳過）
         if not self._skip_spotify_init:
@@ -1635,17 +1737,11 @@ class Dashboard(QWidget):
         # 初始化 MQTT（如果有設定檔）
         self._check_mqtt_config()
         
-        # 啟動網路狀態檢測（每 5 秒檢查一次）
-        self.network_check_timer = QTimer()
-        self.network_check_timer.timeout.connect(self._check_network_status)
-        self.network_check_timer.start(5000)  # 5 秒
-        # 立即檢查一次
-        QTimer.singleShot(2000, self._check_network_status)
-        
-        # 啟動服務健康檢查（每 60 秒檢查一次）
-        self.service_health_timer = QTimer()
-        self.service_health_timer.timeout.connect(self._check_service_health)
-        self.service_health_timer.start(60000)  # 60 秒
+        # 啟動網路狀態檢測（每 5 秒）與服務健康檢查（每 60 秒），共用一條常駐執行緒
+        self.network_monitor_thread = NetworkMonitorThread()
+        self.network_monitor_thread.network_status_checked.connect(self._update_network_status)
+        self.network_monitor_thread.service_check_due.connect(self._check_service_health)
+        self.network_monitor_thread.start()
         
         # === 初始化 GPIO 按鈕（樹莓派實體按鈕）===
         # GPIO19: 按鈕 A (短按=切換左卡片, 長按=詳細視圖)
@@ -1657,49 +1753,37 @@ class Dashboard(QWidget):
         else:
             print("GPIO 按鈕不可用 - 請使用鍵盤 F1/F2 控制")
         
+        # 啟動期間建立的 widgets / 計時器 / 設定幾乎都存活到程式結束，
+        # 移入永久代後，之後的手動 GC 不必再逐一掃描它們
+        gc.freeze()
+        print(f"[GC] 已凍結 {gc.get_freeze_count()} 個啟動期物件")
+        
         print("儀表板邏輯已啟動")
     
     def _incremental_gc(self):
         """智能垃圾回收 - 只在車輛靜止時執行
         
         策略：
-        1. 完全禁用 Python 自動 GC（在 __init__ 中設定）
-        2. 只在速度為 0（車輛靜止）時才考慮執行 GC
-        3. 距離上次 GC 超過 1 小時才執行
-        4. 這樣即使 GC 有短暫停頓，也不會影響駕駛體驗
+        1. 完全禁用 Python 自動 GC（在 __init__ 中設定），啟動完成後 gc.freeze() 長駐物件
+        2. 每小時檢查一次；速度不為 0（行駛中）時 1 分鐘後再試
+        3. 在主執行緒直接執行：GC 需持有 GIL，另開執行緒一樣會卡住 UI，
+           只是多了建立執行緒的成本；靜止時短暫停頓不影響駕駛體驗
         
         8GB RAM + 智能 GC = 不會記憶體洩漏，也不會凍結
         """
-        self._gc_counter += 1
-        
-        # 初始化上次 GC 時間
-        if not hasattr(self, '_last_full_gc_time'):
-            self._last_full_gc_time = time.time()
-        
-        perf_enabled = os.environ.get('PERF_MONITOR', '').lower() in ('1', 'true', 'yes')
-        
-        # 每 10 秒檢查一次是否需要 GC
-        now = time.time()
-        hours_since_gc = (now - self._last_full_gc_time) / 3600
+        if self.speed != 0:
+            self.gc_timer.start(self._GC_RETRY_MS)
+            return
         
-        # 條件：速度為 0 且距離上次 GC 超過 1 小時
-        if self.speed == 0 and hours_since_gc >= 1.0:
-            import threading
-            
-            def background_full_gc():
-                start = time.perf_counter()
-                # 按順序執行，避免一次性大量釋放
-                collected0 = gc.collect(0)
-                collected1 = gc.collect(1)
-                collected2 = gc.collect(2)
-                duration = (time.perf_counter() - start) * 1000
-                total = collected0 + collected1 + collected2
-                print(f"⚡ [GC] 智能 GC 完成 (車輛靜止): {duration:.1f}ms, 回收 {total} 物件")
-            
-            # 更新 GC 時間
-            self._last_full_gc_time = now
-            print(f"⚡ [GC] 觸發智能 GC (速度=0, 已 {hours_since_gc:.1f} 小時未 GC)")
-            threading.Thread(target=background_full_gc, daemon=True).start()
+        start = time.perf_counter()
+        # 按順序執行，避免一次性大量釋放
+        collected0 = gc.collect(0)
+        collected1 = gc.collect(1)
+        collected2 = gc.collect(2)
+        duration = (time.perf_counter() - start) * 1000
+        total = collected0 + collected1 + collected2
+        print(f"⚡ [GC] 智能 GC 完成 (車輛靜止): {duration:.1f}ms, 回收 {total} 物件")
+        self.gc_timer.start(self._GC_INTERVAL_MS)
 
     def check_spotify_config(self):
         """檢查 Spotify 設定並初始化"""
@@ -1711,25 +1795,7 @@ class Dashboard(QWidget):
             print("發現 Spotify 設定檔和快取，正在初始化...")
             self.music_card.show_player_ui()
             # 在背景執行緒初始化，避免卡住 UI
-            import threading
-            def init_spotify():
-                result = setup_spotify(self)
-                if result:
-                    self._spotify_connected = True
-                    self._spotify_integration = result  # 儲存整合實例引用
-                    self._set_spotify_progress_active(self._is_music_card_visible())
-                    self._spotify_init_attempts = 0
-                    print("Spotify 初始化成功")
-                else:
-                    self._spotify_connected = False
-                    self._spotify_init_attempts += 1
-                    print(f"Spotify 初始化失敗 (嘗試 {self._spotify_init_attempts})")
-                    # 如果初始化失敗，30 秒後重試（最多 3 次）
-                    token_cache_exists = os.path.exists(cache_path)
-                    if self._spotify_init_attempts < 3 and not self.is_offline and token_cache_exists:
-                        print(f"[Spotify] 將在 30 秒後重試...")
-                        QTimer.singleShot(30000, self._retry_spotify_init)
-            threading.Thread(target=init_spotify, daemon=True).start()
+            self._start_spotify_init("startup")
         else:
             if not os.path.exists(config_path):
                 print("未發現 Spotify 設定檔，顯示綁定介面")
@@ -1743,26 +1809,48 @@ class Dashboard(QWidget):
             return
         
         print(f"[Spotify] 重試初始化 (嘗試 {self._spotify_init_attempts + 1}/3)...")
+        self._start_spotify_init("retry")
+
+    def _start_spotify_init(self, mode):
+        """在全域 QThreadPool 執行 setup_spotify，完成後回到主執行緒處理結果
+
+        mode: "startup" / "retry" / "auth" / "reconnect"
+        """
+        if self._spotify_task is not None:
+            # 已有初始化在進行中：不重複啟動，避免兩個 setup_spotify 同時建立 client / listener
+            print(f"[Spotify] 初始化進行中，略過 {mode}")
+            return
+        task = BackgroundTask(mode, setup_spotify, self)
+        task.signals.finished.connect(self._on_spotify_init_finished)
+        self._spotify_task = task  # 保留參考直到完成，避免 signals 物件被回收
+        QThreadPool.globalInstance().start(task)
+
+    def _on_spotify_init_finished(self, mode, result):
+        """Spotify 初始化完成（主執行緒）：更新連線狀態，必要時排程 30 秒後重試"""
+        self._spotify_task = None
+        if result:
+            self._spotify_connected = True
+            self._spotify_integration = result  # 儲存整合實例引用
+            self._set_spotify_progress_active(self._is_music_card_visible())
+            self._spotify_init_attempts = 0
+            print({"startup": "Spotify 初始化成功",
+                   "retry": "[Spotify] ✅ 重試成功",
+                   "auth": "[Spotify] ✅ 初始化成功",
+                   "reconnect": "[Spotify] ✅ 重新連接成功"}[mode])
+            return
         
-        import threading
-        def init_spotify():
-            result = setup_spotify(self)
-            if result:
-                self._spotify_connected = True
-                self._spotify_integration = result  # 儲存整合實例引用
-                self._set_spotify_progress_active(self._is_music_card_visible())
-                self._spotify_init_attempts = 0
-                print("[Spotify] ✅ 重試成功")
-            else:
-                self._spotify_connected = False
-                self._spotify_init_attempts += 1
-                print(f"[Spotify] ❌ 重試失敗 (嘗試 {self._spotify_init_attempts})")
-                # 繼續重試
-                token_cache_exists = os.path.exists(get_spotify_cache_path())
-                if self._spotify_init_attempts < 3 and not self.is_offline and token_cache_exists:
-                    QTimer.singleShot(30000, self._retry_spotify_init)
-        
-        threading.Thread(target=init_spotify, daemon=True).start()
+        self._spotify_connected = False
+        if mode == "auth":
+            print("[Spotify] ❌ 初始化失敗")
+            return
+        self._spotify_init_attempts += 1
+        print(f"[Spotify] ❌ 初始化失敗 ({mode}，嘗試 {self._spotify_init_attempts})")
+        # 開機/重試失敗時 30 秒後再試（最多 3 次）；重連失敗交給服務健康檢查
+        if mode in ("startup", "retry"):
+            token_cache_exists = os.path.exists(get_spotify_cache_path())
+            if self._spotify_init_attempts < 3 and not self.is_offline and token_cache_exists:
+                print("[Spotify] 將在 30 秒後重試...")
+                QTimer.singleShot(30000, self._retry_spotify_init)
 
     def _handle_spotify_update_on_card_change(self, old_index, new_index):
         """處理卡片切換時的 Spotify 更新邏輯"""
@@ -1868,25 +1956,7 @@ class Dashboard(QWidget):
             self._spotify_init_attempts = 0
             self.music_card.show_player_ui()
             # 在背景執行緒初始化 Spotify，避免阻塞 UI
-            def _init_spotify_async():
-                try:
-                    result = setup_spotify(self)
-                    if result:
-                        self._spotify_connected = True
-                        self._spotify_integration = result
-                        self._set_spotify_progress_active(self._is_music_card_visible())
-                        self._spotify_init_attempts = 0
-                        print("[Spotify] ✅ 初始化成功")
-                    else:
-                        self._spotify_connected = False
-                        print("[Spotify] ❌ 初始化失敗")
-                except Exception as e:
-                    self._spotify_connected = False
-                    print(f"Spotify 初始化失敗: {e}")
-            
-            import threading
-            spotify_thread = threading.Thread(target=_init_spotify_async, daemon=True)
-            spotify_thread.start()
+            self._start_spotify_init("auth")
         else:
             print("Spotify 授權失敗")
             self.music_card.show_bind_ui()
@@ -2021,42 +2091,6 @@ class Dashboard(QWidget):
         except Exception as e:
             print(f"[Telegram] 讀取設定失敗: {e}")
     
-    def _check_network_status(self):
-        """檢查網路連線狀態"""
-        import socket
-        import subprocess
-        import platform
-        
-        def check_connection():
-            # 方法 1: 嘗試 socket 連接 Google DNS
-            try:
-                sock = socket.create_connection(("8.8.8.8", 53), timeout=3)
-                sock.close()
-                return True
-            except Exception:
-                pass
-            
-            # 方法 2: 嘗試 socket 連接 Cloudflare DNS
-            try:
-                sock = socket.create_connection(("1.1.1.1", 53), timeout=3)
-                sock.close()
-                return True
-            except Exception:
-                pass
-            
-            # 都失敗了
-            return False
-        
-        # 在背景執行緒檢查，避免卡住 UI
-        import threading
-        
-        def check_and_update():
-            is_connected = check_connection()
-            # 使用 Signal 回到主執行緒更新 UI
-            self.signal_update_network.emit(is_connected)
-        
-        threading.Thread(target=check_and_update, daemon=True).start()
-    
     def _update_network_status(self, is_connected):
         """更新網路狀態顯示（主執行緒）"""
         was_offline = self.is_offline
@@ -2105,44 +2139,49 @@ class Dashboard(QWidget):
         # 2. 重連 MQTT（如果有設定檔但客戶端未連線）
         config_file = get_mqtt_config_path()
         if os.path.exists(config_file):
-            if not hasattr(self, 'mqtt_client') or self.mqtt_client is None or not self._mqtt_connected:
+            if self.mqtt_client is None or not self._mqtt_connected:
                 print("[重連] 嘗試重新連接 MQTT...")
                 self._reconnect_mqtt()
     
     def _reconnect_spotify(self):
         """重新連接 Spotify"""
-        def _init_spotify_async():
-            try:
-                result = setup_spotify(self)
-                if result:
-                    self._spotify_connected = True
-                    self._spotify_init_attempts = 0
-                    print("[Spotify] ✅ 重新連接成功")
-                else:
-                    self._spotify_init_attempts += 1
-                    print(f"[Spotify] ❌ 重新連接失敗 (嘗試 {self._spotify_init_attempts})")
-            except Exception as e:
-                self._spotify_init_attempts += 1
-                print(f"[Spotify] ❌ 重新連接錯誤: {e}")
-        
-        import threading
-        threading.Thread(target=_init_spotify_async, daemon=True).start()
+        self._start_spotify_init("reconnect")
     
     def _reconnect_mqtt(self):
         """重新連接 MQTT"""
-        # 先清理舊的連線
-        if hasattr(self, 'mqtt_client') and self.mqtt_client is not None:
-            try:
-                self.mqtt_client.disconnect()
-                self.mqtt_client.loop_stop()
-            except Exception:
-                pass
+        # 舊連線仍在背景清理中，完成後會自行重新初始化
+        if self._mqtt_teardown_task is not None:
+            return
+        
+        # 先清理舊的連線：loop_stop() 會 join paho 網路執行緒，而該執行緒斷線時
+        # 可能正卡在 reconnect()（DNS / TCP 逾時），所以改在執行緒池中執行，完成後再重建
+        if self.mqtt_client is not None:
+            old_client = self.mqtt_client
             self.mqtt_client = None
             self._mqtt_connected = False
+            task = BackgroundTask("mqtt_teardown", self._teardown_mqtt_client, old_client)
+            task.signals.finished.connect(self._on_mqtt_teardown_finished)
+            self._mqtt_teardown_task = task  # 保留參考直到完成，避免 signals 物件被回收
+            QThreadPool.globalInstance().start(task)
+            return
         
         # 重新初始化
         self._init_mqtt_client()
     
+    @staticmethod
+    def _teardown_mqtt_client(client):
+        """（背景執行緒）斷開並停止舊的 paho client"""
+        try:
+            client.disconnect()
+            client.loop_stop()
+        except Exception:
+            pass
+    
+    def _on_mqtt_teardown_finished(self, tag, result):
+        """舊 client 清理完成（主執行緒）：重新初始化"""
+        self._mqtt_teardown_task = None
+        self._init_mqtt_client()
+    
     def _check_service_health(self):
         """定時檢查服務健康狀態，必要時重連"""
         # 如果離線，跳過檢查
@@ -2157,10 +2196,11 @@ class Dashboard(QWidget):
                 print("[健康檢查] Spotify 未連線，嘗試重連...")
                 self._reconnect_spotify()
         
-        # 檢查 MQTT 狀態
+        # 檢查 MQTT 狀態（client 存在時由 paho 網路執行緒自行退避重連，
+        # 這裡重建 client 會把退避重設回 1 秒；網路恢復時另由 _attempt_reconnect_services 立即重連）
         config_file = get_mqtt_config_path()
         if os.path.exists(config_file):
-            if not self._mqtt_connected:
+            if not self._mqtt_connected and self.mqtt_client is None:
                 print("[健康檢查] MQTT 未連線，嘗試重連...")
                 self._reconnect_mqtt()
     
@@ -2188,11 +2228,20 @@ class Dashboard(QWidget):
             
             dashboard = self  # 保存 dashboard 參考
             mqtt_publish_topic = config.get('publish_topic', 'car/telemetry')  # 上傳用的主題
+            self._mqtt_publish_topic = mqtt_publish_topic  # 快取給 _publish_telemetry，不必每次讀檔
             
             def on_connect(client, userdata, flags, rc, properties=None):
                 if rc == 0:
                     dashboard._mqtt_connected = True
                     print(f"[MQTT] ✅ 已連接到 {config['broker']}:{config['port']}")
+                    # 關閉 Nagle：遙測封包很小，不等湊滿再送；送出緩衝也不必大
+                    sock = client.socket()
+                    if sock is not None:
+                        try:
+                            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 32 * 1024)
+                        except (OSError, AttributeError):
+                            pass  # WebSocket 包裝等不支援 setsockopt 的傳輸層
                     # 訂閱主題
                     topic = config.get('topic', 'car/#')
                     client.subscribe(topic)
@@ -2215,14 +2264,21 @@ class Dashboard(QWidget):
                 else:
                     print("[MQTT] 已斷線")
             
+            # 逐則訊息的內容只在 PERF_MONITOR 開啟時印出
+            log_messages = self._perf_log
+            
             def on_message(client, userdata, msg):
                 try:
-                    payload = msg.payload.decode('utf-8')
-                    data = json.loads(payload)
-                    print(f"[MQTT] 收到訊息: {msg.topic} -> {payload[:100]}...")
+                    if ORJSON_AVAILABLE:
+                        data = orjson.loads(msg.payload)  # 直接解析 bytes，不必先 decode
+                    else:
+                        data = json.loads(msg.payload)  # json.loads 也接受 UTF-8 bytes
+                    if log_messages:
+                        print(f"[MQTT] 收到訊息: {msg.topic} -> {msg.payload[:100].decode('utf-8', 'replace')}...")
                     
                     # 處理導航訊息 - 使用 Signal 確保在主執行緒更新 UI
-                    if 'navigation' in msg.topic or 'nav' in msg.topic:
+                    # （'navigation' 也包含 'nav'，檢查一次即可）
+                    if 'nav' in msg.topic:
                         # 透過 Signal 傳遞資料到主執行緒
                         dashboard.signal_update_navigation.emit(data)
                     
@@ -2234,8 +2290,8 @@ class Dashboard(QWidget):
             self.mqtt_client.on_disconnect = on_disconnect
             self.mqtt_client.on_message = on_message
             
-            # 啟用自動重連，指數退避（1秒起，最大 5 秒）
-            self.mqtt_client.reconnect_delay_set(min_delay=1, max_delay=5)
+            # 啟用自動重連，指數退避（1 秒起每次加倍，最大 120 秒），broker 長時間離線時不會一直重試
+            self.mqtt_client.reconnect_delay_set(min_delay=1, max_delay=120)
             
             # 設定認證
             username = config.get('username', '').strip()
@@ -2243,19 +2299,10 @@ class Dashboard(QWidget):
             if username:
                 self.mqtt_client.username_pw_set(username, password)
             
-            # 在背景執行緒中連線
-            import threading
-            def connect_mqtt():
-                try:
-                    self.mqtt_client.connect(config['broker'], config['port'], keepalive=60)
-                    # 使用 loop_forever 會自動處理重連
-                    self.mqtt_client.loop_forever(retry_first_connection=True)
-                except Exception as e:
-                    print(f"[MQTT] 連線錯誤: {e}")
-                    dashboard._mqtt_connected = False
-            
-            mqtt_thread = threading.Thread(target=connect_mqtt, daemon=True)
-            mqtt_thread.start()
+            # 非阻塞連線：由 paho 自己的網路執行緒連線並自動重連（首次連線失敗也會重試），
+            # 重新初始化時 loop_stop() 也能確實結束該執行緒
+            self.mqtt_client.connect_async(config['broker'], config['port'], keepalive=60)
+            self.mqtt_client.loop_start()
             
         except ImportError:
             print("[MQTT] paho-mqtt 未安裝")
@@ -2267,6 +2314,11 @@ class Dashboard(QWidget):
         if hasattr(self, '_mqtt_telemetry_timer') and self._mqtt_telemetry_timer is not None:
             self._mqtt_telemetry_timer.stop()
         
+        self._last_telemetry_key = None  # 每次(重新)連線後第一筆一定發布
+        self._last_telemetry_retain = None  # 且一定以 retain 發布
+        self._last_retained_key = None
+        if not self._telemetry_publisher.isRunning():
+            self._telemetry_publisher.start()
         self._mqtt_telemetry_timer = QTimer()
         self._mqtt_telemetry_timer.timeout.connect(self._publish_telemetry)
         self._mqtt_telemetry_timer.start(30000)  # 每 30 秒上傳一次
@@ -2302,80 +2354,104 @@ class Dashboard(QWidget):
         """引擎狀態從 on 掉到 off 時立即上傳一次"""
         status_fell, _ = self._update_engine_status()
         if status_fell and self._mqtt_connected:
-            self._publish_telemetry()
+            self._publish_telemetry(force_retain=True)
     
-    def _publish_telemetry(self):
-        """發布車輛遙測數據到 MQTT"""
-        if not self._mqtt_connected or not hasattr(self, 'mqtt_client') or self.mqtt_client is None:
+    def _publish_telemetry(self, force_retain=False):
+        """發布車輛遙測數據到 MQTT（force_retain: 熄火等狀態事件一定更新 retained 訊息）"""
+        if not self._mqtt_connected or self.mqtt_client is None:
             return
         
         try:
             # 取得 ODO 和 Trip 資料
-            storage = OdometerStorage()
+            storage = self._odo_storage
             odo_total = storage.get_odo()
             trip1_distance, _ = storage.get_trip1()
             trip2_distance, _ = storage.get_trip2()
             
-            # 取得門狀態 (開門 = "on", 關門 = "off")
-            door_status = {}
-            if hasattr(self, 'door_card'):
-                door_status = {
-                    'FL': 'off' if self.door_card.door_fl_closed else 'on',
-                    'FR': 'off' if self.door_card.door_fr_closed else 'on',
-                    'RL': 'off' if self.door_card.door_rl_closed else 'on',
-                    'RR': 'off' if self.door_card.door_rr_closed else 'on',
-                    'BK': 'off' if self.door_card.door_bk_closed else 'on'
-                }
+            # 先把要上傳的欄位讀成區域變數：比對 key 與寫入 payload 都用同一份快照
+            speed = int(self.speed)  # 與儀表顯示一致，使用整數
+            temp = self.temp
+            fuel = self.fuel
+            gear = self.gear
+            turbo = self.turbo
+            battery = self.battery
+            gps_lat = self.gps_lat
+            gps_lon = self.gps_lon
+            gps_fixed = self.is_gps_fixed
+            cruise_switch = self.cruise_switch
+            cruise_engaged = self.cruise_engaged
+            parking_brake = self.parking_brake
             
-            # 水溫轉換：self.temp 是百分比 (0-100)，轉換為攝氏度 (40-120°C)
-            coolant_celsius = 40 + (self.temp / 100) * 80 if self.temp is not None else None
+            # 水溫轉換：temp 是百分比 (0-100)，轉換為攝氏度 (40-120°C)
+            coolant_celsius = 40 + (temp / 100) * 80 if temp is not None else None
             
             # 計算引擎狀態 (status)
             # 電壓從 10 以上掉到 0 時，status 優先變成 false（熄火）
             # RPM > 100 時，status 變成 true（引擎運轉）
             status_fell, current_rpm = self._update_engine_status()
+            engine_status = self._engine_status
             
-            # 組裝數據
-            telemetry = {
-                'timestamp': time.time(),
-                'status': self._engine_status,
-                'speed': int(self.speed),  # 與儀表顯示一致，使用整數
-                'rpm': current_rpm,  # 使用已計算的整數 RPM
-                'coolant_temp': coolant_celsius,
-                'fuel': self.fuel,
-                'gear': self.gear,
-                'turbo': self.turbo,
-                'battery': self.battery,
-                'odo': odo_total,
-                'trip_a': trip1_distance,
-                'trip_b': trip2_distance,
-                'gps': {
-                    'lat': self.gps_lat,
-                    'lon': self.gps_lon,
-                    'fixed': getattr(self, 'is_gps_fixed', False)
-                },
-                'doors': door_status,
-                'cruise': {
-                    'switch': self.cruise_switch,
-                    'engaged': self.cruise_engaged
-                },
-                'parking_brake': self.parking_brake
-            }
+            # 內容與上次相同且未到 keepalive 時間 → 不重新編碼、不發布
+            door_card = self.door_card
+            doors_closed = tuple(getattr(door_card, attr) for _, attr in self.DOOR_ATTRS)
+            telemetry_key = (
+                engine_status, speed, current_rpm, coolant_celsius,
+                fuel, gear, turbo, battery,
+                odo_total, trip1_distance, trip2_distance,
+                gps_lat, gps_lon, gps_fixed, doors_closed,
+                cruise_switch, cruise_engaged, parking_brake,
+            )
+            now = time.monotonic()
+            if (telemetry_key == self._last_telemetry_key
+                    and now - self._last_telemetry_publish < self._TELEMETRY_KEEPALIVE_SEC):
+                return
             
-            # 讀取發布主題
-            config_file = get_mqtt_config_path()
-            publish_topic = "car/telemetry"
-            if os.path.exists(config_file):
-                try:
-                    with open(config_file, 'r', encoding='utf-8') as f:
-                        config = json.load(f)
-                        publish_topic = config.get('publish_topic', 'car/telemetry')
-                except:
-                    pass
+            # 更新數據（覆寫範本內的值）
+            t = self._telemetry
+            t['timestamp'] = time.time()
+            t['status'] = engine_status
+            t['speed'] = speed
+            t['rpm'] = current_rpm  # 使用已計算的整數 RPM
+            t['coolant_temp'] = coolant_celsius
+            t['fuel'] = fuel
+            t['gear'] = gear
+            t['turbo'] = turbo
+            t['battery'] = battery
+            t['odo'] = odo_total
+            t['trip_a'] = trip1_distance
+            t['trip_b'] = trip2_distance
+            gps = t['gps']
+            gps['lat'] = gps_lat
+            gps['lon'] = gps_lon
+            gps['fixed'] = gps_fixed
+            # 門狀態 (開門 = "on", 關門 = "off")
+            doors = t['doors']
+            for (code, _), closed in zip(self.DOOR_ATTRS, doors_closed):
+                doors[code] = 'off' if closed else 'on'
+            cruise = t['cruise']
+            cruise['switch'] = cruise_switch
+            cruise['engaged'] = cruise_engaged
+            t['parking_brake'] = parking_brake
             
-            # 發布數據 (retain=True 讓新訂閱者能收到最後一筆訊息)
-            payload = json.dumps(telemetry, ensure_ascii=False)
-            self.mqtt_client.publish(publish_topic, payload, qos=0, retain=True)
+            # 發布數據：連線後第一筆、熄火、狀態欄位（引擎/檔位/車門/手煞車/定速）變化時，
+            # 以及之後每 5 分鐘用 retain=True，讓新訂閱者一定拿到最新狀態；
+            # 只有車速、轉速、GPS 等數值變化或 keepalive 才做一般發布，避免 broker 每次改寫 retained 儲存
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(t)  # 緊湊 UTF-8 bytes，可直接交給 publish
+            else:
+                payload = json.dumps(t, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            retained_key = (engine_status, gear, doors_closed, parking_brake,
+                            cruise_switch, cruise_engaged)
+            retain = (force_retain or status_fell
+                      or retained_key != self._last_retained_key
+                      or self._last_telemetry_retain is None
+                      or now - self._last_telemetry_retain >= self._TELEMETRY_RETAIN_INTERVAL_SEC)
+            if retain:
+                self._last_telemetry_retain = now
+                self._last_retained_key = retained_key
+            self._telemetry_publisher.submit(self.mqtt_client, self._mqtt_publish_topic, payload, retain)
+            self._last_telemetry_key = telemetry_key
+            self._last_telemetry_publish = now
             
         except Exception as e:
             print(f"[MQTT] 發布遙測數據錯誤: {e}")
@@ -2383,7 +2459,7 @@ class Dashboard(QWidget):
     @pyqtSlot(dict)
     def _slot_update_navigation(self, data: dict):
         """處理導航訊息（Slot - 在主執行緒執行）"""
-        perf_log = self._perf_logging_enabled()
+        perf_log = self._perf_log
         if perf_log:
             print(f"[Navigation] _slot_update_navigation 被呼叫")
             print(f"[Navigation] 資料: direction={data.get('direction')}, distance={data.get('totalDistance')}")
@@ -2481,8 +2557,7 @@ class Dashboard(QWidget):
             self.control_panel.set_speed_sync_state(mode)
 
         try:
-            import vehicle.datagrab as datagrab
-            datagrab.set_speed_sync_mode(mode)
+            self._dg.set_speed_sync_mode(mode)
         except Exception as e:
             print(f"[速度同步] 更新 datagrab 失敗: {e}")
         print(f"[速度同步] 模式切換為 {mode}")
@@ -2503,9 +2578,8 @@ class Dashboard(QWidget):
         
         self.panel_visible = True
         
-        # 創建動畫
-        self.panel_animation = QPropertyAnimation(self.control_panel, b"geometry")
-        self.panel_animation.setDuration(300)  # 300ms
+        # 重用動畫：從目前位置開始（可能正在收起途中）
+        self.panel_animation.stop()
         self.panel_animation.setStartValue(self.control_panel.geometry())
         self.panel_animation.setEndValue(QRectF(0, 50, 1920, 300).toRect())  # 從狀態欄下方滑出
         self.panel_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
@@ -2525,15 +2599,18 @@ class Dashboard(QWidget):
         
         self.panel_visible = False
         
-        # 創建動畫
-        self.panel_animation = QPropertyAnimation(self.control_panel, b"geometry")
-        self.panel_animation.setDuration(300)
+        # 重用動畫：收起完成後由 _on_panel_animation_finished 隱藏面板
+        self.panel_animation.stop()
         self.panel_animation.setStartValue(self.control_panel.geometry())
         self.panel_animation.setEndValue(QRectF(0, -300, 1920, 300).toRect())
         self.panel_animation.setEasingCurve(QEasingCurve.Type.InCubic)
-        self.panel_animation.finished.connect(self.control_panel.hide)
         self.panel_animation.start()
     
+    def _on_panel_animation_finished(self):
+        """動畫結束：若是收起動畫則隱藏面板"""
+        if not self.panel_visible:
+            self.control_panel.hide()
+    
     def show_wifi_manager(self):
         """顯示 WiFi 管理器"""
         try:
@@ -2564,19 +2641,23 @@ class Dashboard(QWidget):
             print(f"開啟 WiFi 管理器錯誤: {e}")
 
     # === 執行緒安全的公開方法 (從背景執行緒呼叫) ===
-    @perf_track
     def set_speed(self, speed):
         """外部數據接口：設置速度 (0-200 km/h)
         執行緒安全：透過 Signal 發送，由主執行緒執行
         """
-        self.signal_update_speed.emit(float(speed))
+        speed = float(speed)
+        if self._should_forward("speed", speed, self._SPEED_FORWARD_THRESHOLD):
+            self.signal_update_speed.emit(speed)
     
-    @perf_track
     def set_rpm(self, rpm):
         """外部數據接口：設置轉速 (0-8 x1000rpm)
         執行緒安全：透過 Signal 發送，由主執行緒執行
         """
-        self.signal_update_rpm.emit(float(rpm))
+        rpm = float(rpm)
+        # 指針還在 EMA 逼近目標途中時，重複值也要轉送，否則指針會停在半路
+        settling = int(self.rpm * 50) != int(max(0, min(8, rpm)) * 50)
+        if self._should_forward("rpm", rpm, self._RPM_FORWARD_THRESHOLD, force=settling):
+            self.signal_update_rpm.emit(rpm)
     
     def set_temperature(self, temp):
         """外部數據接口：設置水溫 (0-100，對應約 40-120°C)
@@ -2585,14 +2666,16 @@ class Dashboard(QWidget):
         - 85-100: 過熱 (紅區)
         執行緒安全：透過 Signal 發送，由主執行緒執行
         """
-        self.signal_update_temperature.emit(float(temp))
+        temp = float(temp)
+        if self._should_forward("temp", temp, self._PERCENT_FORWARD_THRESHOLD):
+            self.signal_update_temperature.emit(temp)
 
     def set_obd_batch(self, values: dict):
         """外部數據接口：批次更新高頻 OBD 資料，降低跨執行緒 signal 數量。"""
         if "rpm" in values:
-            self.signal_update_rpm.emit(float(values["rpm"]))
+            self.set_rpm(values["rpm"])
         if "temp" in values:
-            self.signal_update_temperature.emit(float(values["temp"]))
+            self.set_temperature(values["temp"])
         if "turbo" in values:
             self.set_turbo(float(values["turbo"]))
     
@@ -2600,7 +2683,19 @@ class Dashboard(QWidget):
         """外部數據接口：設置油量 (0-100)
         執行緒安全：透過 Signal 發送，由主執行緒執行
         """
-        self.signal_update_fuel.emit(float(fuel))
+        fuel = float(fuel)
+        if self._should_forward("fuel", fuel, self._PERCENT_FORWARD_THRESHOLD):
+            self.signal_update_fuel.emit(fuel)
+    
+    def _should_forward(self, key, value, threshold, force=False):
+        """值變化達門檻、距上次轉送超過 _FORWARD_REFRESH_SEC 或 force 時才轉送"""
+        now = time.monotonic()
+        last = self._last_forwarded.get(key)
+        if (not force and last is not None and abs(value - last[0]) < threshold
+                and now - last[1] < self._FORWARD_REFRESH_SEC):
+            return False
+        self._last_forwarded[key] = (value, now)
+        return True
     
     def set_gear(self, gear):
         """外部數據接口：設置檔位 (P/R/N/D/1/2/3/4/5/6)
@@ -2635,18 +2730,8 @@ class Dashboard(QWidget):
             return
         
         # 檢查門狀態是否真的改變
-        door_upper = door.upper()
-        current_state = None
-        if door_upper == "FL":
-            current_state = self.door_card.door_fl_closed
-        elif door_upper == "FR":
-            current_state = self.door_card.door_fr_closed
-        elif door_upper == "RL":
-            current_state = self.door_card.door_rl_closed
-        elif door_upper == "RR":
-            current_state = self.door_card.door_rr_closed
-        elif door_upper == "BK":
-            current_state = self.door_card.door_bk_closed
+        attr = self._DOOR_ATTR_BY_CODE.get(door.upper())
+        current_state = getattr(self.door_card, attr) if attr is not None else None
         
         # 如果門狀態沒有改變，直接返回（避免 CAN 訊息瘋狂觸發）
         if current_state is not None and current_state == is_closed:
@@ -2682,11 +2767,7 @@ class Dashboard(QWidget):
         
         # 重置自動回退計時器
         # 如果所有門都關閉，5秒後自動切回
-        if (self.door_card.door_fl_closed and 
-            self.door_card.door_fr_closed and 
-            self.door_card.door_rl_closed and 
-            self.door_card.door_rr_closed and 
-            self.door_card.door_bk_closed):
+        if self.door_card.all_doors_closed():
             # 所有門都關閉，啟動計時器
             if hasattr(self, 'door_auto_switch_timer'):
                 self.door_auto_switch_timer.start(5000)  # 5秒後切回
@@ -2742,11 +2823,10 @@ class Dashboard(QWidget):
 
     # === 實際執行 UI 更新的 Slot 方法 (在主執行緒中執行) ===
     @pyqtSlot(float)
-    @perf_track
     def _slot_set_speed(self, speed):
         """Slot: 在主執行緒中更新速度顯示"""
         # 如果 GPS 速度優先且已定位且且速度 >= 20，則忽略 CAN 速度更新 (顯示部分)
-        import vehicle.datagrab as datagrab
+        datagrab = self._dg
         use_gps = (datagrab.gps_speed_mode and 
                    self.is_gps_fixed and 
                    speed >= 20.0) # 這裡用傳入的 speed (即 OBD 速度)
@@ -2764,9 +2844,9 @@ class Dashboard(QWidget):
         smoothed_obd_speed = None
         try:
             obd_data = datagrab.data_store.get("OBD", {})
-            last_update = obd_data.get("last_update", 0)
+            last_update = obd_data.get("last_update", 0)  # time.monotonic()
             # 只有在 OBD 資料是「新鮮」的（5 秒內有更新）才使用
-            if time.time() - last_update < 5.0:
+            if time.monotonic() - last_update < 5.0:
                 raw_obd_speed = obd_data.get("speed")
                 smoothed_obd_speed = obd_data.get("speed_smoothed")
         except Exception:
@@ -2781,6 +2861,8 @@ class Dashboard(QWidget):
         
         # 存入變數供 physics_tick 使用
         self.calc_speed_source = max(0.0, physics_speed_candidate if physics_speed_candidate is not None else 0.0)
+        if self._physics_idle and self.calc_speed_source > 0:
+            self._set_physics_idle(False)  # 起步時立刻回到 100ms 積分
 
         # 更新顯示邏輯
         new_speed = max(0, min(200, display_speed_candidate if display_speed_candidate is not None else speed))
@@ -2842,8 +2924,8 @@ class Dashboard(QWidget):
         """根據 GPS 與 OBD 速度差逐步修正校正係數"""
         if obd_speed is None or not self.is_gps_fixed:
             return
+        datagrab = self._dg
         try:
-            import vehicle.datagrab as datagrab
             if getattr(datagrab, "speed_sync_mode", "calibrated") == "fixed":
                 return
             if hasattr(datagrab, "is_speed_calibration_enabled") and not datagrab.is_speed_calibration_enabled():
@@ -2853,7 +2935,7 @@ class Dashboard(QWidget):
         gps_speed = self.current_gps_speed
         if gps_speed <= 5 or obd_speed <= 5:
             return
-        now = time.time()
+        now = time.monotonic()
         if now - self._last_speed_cali_ts < 1.0:
             return
         diff = abs(gps_speed - obd_speed)
@@ -2863,7 +2945,6 @@ class Dashboard(QWidget):
         ratio = gps_speed / max(obd_speed, 0.1)
         ratio = max(0.7, min(1.3, ratio))
 
-        import vehicle.datagrab as datagrab
         prev = datagrab.get_speed_correction()
         alpha = 0.05  # 漸進式更新，避免瞬間跳動
         new_value = (1 - alpha) * prev + alpha * ratio
@@ -2873,10 +2954,16 @@ class Dashboard(QWidget):
         if self._perf_logging_enabled():
             print(f"[速度校正] GPS 已鎖定，係數 {prev:.3f} -> {new_value:.3f} (比例 {ratio:.3f}，差 {diff:.1f} km/h)")
     
+    def _set_physics_idle(self, idle):
+        """切換物理心跳頻率；梯形積分使用實際經過時間，改變間隔不影響里程"""
+        self._physics_idle = idle
+        self.physics_timer.setInterval(
+            self._PHYSICS_IDLE_INTERVAL_MS if idle else self._PHYSICS_INTERVAL_MS)
+
     def _physics_tick(self):
-        """物理心跳：每 100ms 根據當前速度累積里程 (梯形積分法)"""
-        current_time = time.time()
-        time_delta = current_time - getattr(self, "last_physics_time", current_time)
+        """物理心跳：每 100ms（靜止時 500ms）根據當前速度累積里程 (梯形積分法)"""
+        current_time = time.monotonic()  # 單調時鐘：系統校時（NTP/GPS）不會讓 time_delta 跳動
+        time_delta = current_time - self.last_physics_time
         
         # 安全檢查
         if time_delta <= 0 or time_delta > 1.0:
@@ -2914,13 +3001,16 @@ class Dashboard(QWidget):
             
         # 記錄這次速度供下次梯形計算使用
         self._prev_physics_speed = current_speed
+        
+        # 前後兩次都靜止時放慢心跳，避免停車時空轉
+        idle = avg_speed <= 0 and current_speed <= 0
+        if idle != self._physics_idle:
+            self._set_physics_idle(idle)
     
     @pyqtSlot(float)
-    @perf_track
     def _slot_set_rpm(self, rpm):
         """Slot: 在主執行緒中更新轉速顯示 (含 GUI 端平滑)"""
         target = max(0, min(8, rpm))
-        old_rpm = self.rpm
         
         # 追蹤最大 RPM (原始值×1000)
         get_max_value_logger().update_rpm(target * 1000)
@@ -2930,10 +3020,11 @@ class Dashboard(QWidget):
             self.rpm = target  # 首次直接設定
         else:
             # 平滑插值：越接近目標越慢
-            self.rpm = self.rpm * (1 - self.rpm_animation_alpha) + target * self.rpm_animation_alpha
+            self.rpm = self.rpm * self._rpm_one_minus_alpha + target * self.rpm_animation_alpha
         
-        rpm_display = int((self.rpm * 1000) // 20)
-        if getattr(self, "_last_rpm_display", None) != rpm_display:
+        # 以顯示解析度（20 rpm）比較，量化值沒變就不重畫
+        rpm_display = int(self.rpm * 50)
+        if self._last_rpm_display != rpm_display:
             self._last_rpm_display = rpm_display
             self._update_quad_gauge_display(update_rpm=True)
         
@@ -2994,9 +3085,10 @@ class Dashboard(QWidget):
         self.gear = display_gear
         self._update_gear_display()
 
-        # 檔位變更時立即上傳 MQTT 數據
+        # 檔位變更時上傳 MQTT 數據（合併 500ms 內的連續換檔）
         if gear_changed and self._mqtt_connected:
-            self._publish_telemetry()
+            if not self._pending_immediate_publish.isActive():
+                self._pending_immediate_publish.start()
         
         # === D→N 換檔時觸發 GPS 軟重啟（UBX Hot Start）===
         # 利用停車/暫停的自然時機刷新 GPS 模組狀態
@@ -3008,7 +3100,7 @@ class Dashboard(QWidget):
             driving_gears = {'D', '1', '2', '3', '4', '5', 'S', 'L'}
             if prev_display_gear in driving_gears:
                 try:
-                    if hasattr(self, 'gps_monitor_thread') and self.gps_monitor_thread.isRunning():
+                    if self.gps_monitor_thread is not None and self.gps_monitor_thread.isRunning():
                         self.gps_monitor_thread.request_soft_reset()
                         print(f"[Dashboard] {prev_display_gear}→N detected, requested GPS soft reset")
                 except Exception as e:
@@ -3059,22 +3151,18 @@ class Dashboard(QWidget):
         # 更新狀態 + 記錄最後收到訊號時間（供 watchdog 用）
         self._last_turn_signal_frame_time = time.time()
         
-        if state == "left_on":
-            self.left_turn_on = True
-            self.right_turn_on = False
-        elif state == "left_off":
-            self.left_turn_on = False
-        elif state == "right_on":
-            self.right_turn_on = True
-            self.left_turn_on = False
-        elif state == "right_off":
-            self.right_turn_on = False
-        elif state == "both_on":
-            self.left_turn_on = True
-            self.right_turn_on = True
-        elif state in ("both_off", "off"):
-            self.left_turn_on = False
-            self.right_turn_on = False
+        entry = self.TURN_TABLE.get(state)
+        if entry is None:
+            return
+        left, right = entry
+        if left is not None:
+            self.left_turn_on = left
+        if right is not None:
+            self.right_turn_on = right
+        
+        # 狀態沒變（例如重複收到同一個 CAN 訊框）就不必重設樣式
+        if self.left_turn_on == prev_left and self.right_turn_on == prev_right:
+            return
         
         # 立即更新 gradient pos 和 style（不再依賴 animation_timer）
         self.left_gradient_pos = 1.0 if self.left_turn_on else 0.0
@@ -3116,7 +3204,7 @@ class Dashboard(QWidget):
     # === Spotify Slots ===
     @pyqtSlot(str, str, str)
     def _slot_update_spotify_track(self, title, artist, album):
-        if os.environ.get('PERF_MONITOR', '').lower() in ('1', 'true', 'yes'):
+        if self._perf_log:
             print(f"DEBUG: UI Received - Title: {title}, Artist: {artist}, Album: '{album}'")
         if hasattr(self, 'music_card'):
             self.music_card.set_song(title, artist, album)
@@ -3131,36 +3219,58 @@ class Dashboard(QWidget):
         if hasattr(self, 'music_card'):
             self.music_card.set_album_art_from_pil(pil_image)
 
+    @staticmethod
+    def _make_font(pixel_size, bold=False, letter_spacing=0):
+        """建立 Arial 字型（以像素指定大小，與 QSS 的 font-size: Npx 一致）"""
+        font = QFont("Arial")
+        font.setPixelSize(pixel_size)
+        if bold:
+            font.setWeight(QFont.Weight.Bold)
+        if letter_spacing:
+            font.setLetterSpacing(QFont.SpacingType.AbsoluteSpacing, letter_spacing)
+        return font
+
+    @staticmethod
+    def _set_style_property(widget, name, value):
+        """設定 QSS 動態屬性，值有變才重新 polish（不重新解析樣式表）
+
+        樣式表樣式的 polish() 會重新比對該元件的屬性選擇器，
+        不需要先 unpolish 整個元件，省下一次樣式規則拆除。
+        """
+        if widget.property(name) == value:
+            return
+        widget.setProperty(name, value)
+        widget.style().polish(widget)
+        widget.update()
+
+    def _set_active_dot(self, group, dots, index):
+        """切換一組指示器的亮點，只重新 polish 狀態有變的舊點與新點"""
+        prev = self._active_dots.get(group)
+        if prev == index:
+            return
+        if prev is not None and 0 <= prev < len(dots):
+            self._set_style_property(dots[prev], "active", False)
+        if 0 <= index < len(dots):
+            self._set_style_property(dots[index], "active", True)
+        self._active_dots[group] = index
+
     @perf_track
     def update_indicators(self):
         """更新所有指示器的狀態"""
         # 更新左側卡片指示器
-        for i, indicator in enumerate(self.left_indicators):
-            if i == self.current_left_index:
-                indicator.setStyleSheet("color: #6af; font-size: 18px;")
-            else:
-                indicator.setStyleSheet("color: #444; font-size: 18px;")
+        self._set_active_dot("left", self.left_indicators, self.current_left_index)
         
         # 更新右側列指示器
-        for i, indicator in enumerate(self.row_indicators):
-            if i == self.current_row_index:
-                indicator.setStyleSheet("color: #6af; font-size: 16px;")
-            else:
-                indicator.setStyleSheet("color: #444; font-size: 16px;")
+        self._set_active_dot("row", self.row_indicators, self.current_row_index)
         
         # 更新右側卡片指示器（根據當前列的卡片數量）
         card_count = self.row_card_counts[self.current_row_index]
-        for i, indicator in enumerate(self.card_indicators):
-            if i < card_count:
-                indicator.show()
-                if i == self.current_card_index:
-                    indicator.setStyleSheet("color: #6af; font-size: 18px;")
-                else:
-                    indicator.setStyleSheet("color: #444; font-size: 18px;")
-            else:
-                indicator.hide()  # 隱藏多餘的指示器
+        if card_count != self._shown_card_dots:
+            for i, indicator in enumerate(self.card_indicators):
+                indicator.setVisible(i < card_count)  # 隱藏多餘的指示器
+            self._shown_card_dots = card_count
+        self._set_active_dot("card", self.card_indicators, self.current_card_index)
     
-    @perf_track
     def mousePressEvent(self, a0):  # type: ignore
         """觸控/滑鼠按下事件"""
         if a0 is None:
@@ -3173,7 +3283,6 @@ class Dashboard(QWidget):
             if self.panel_visible:
                 self.panel_touch_start = pos
                 self.panel_drag_active = True
-                import time
                 self.panel_touch_time = time.time()
             return
         
@@ -3181,7 +3290,6 @@ class Dashboard(QWidget):
         if self.panel_visible:
             self.panel_touch_start = pos
             self.panel_drag_active = True
-            import time
             self.panel_touch_time = time.time()
             return
         
@@ -3190,7 +3298,6 @@ class Dashboard(QWidget):
         if pos.y() <= 80 and not self.panel_visible:
             self.panel_touch_start = pos
             self.panel_drag_active = True
-            import time
             self.panel_touch_time = time.time()
             return
         
@@ -3207,7 +3314,6 @@ class Dashboard(QWidget):
             self.is_swiping = True
             self.swipe_direction = None
             self.swipe_area = 'left'
-            import time
             self.touch_start_time = time.time()
             return
         
@@ -3221,7 +3327,6 @@ class Dashboard(QWidget):
             self.is_swiping = True
             self.swipe_direction = None
             self.swipe_area = 'right'
-            import time
             self.touch_start_time = time.time()
     
     def mouseMoveEvent(self, a0):  # type: ignore
@@ -3287,7 +3392,6 @@ class Dashboard(QWidget):
             delta_x = abs(pos.x() - self.panel_touch_start.x())
             
             # 計算滑動速度（像素/秒）
-            import time
             elapsed = time.time() - getattr(self, 'panel_touch_time', time.time())
             velocity = abs(delta_y) / max(elapsed, 0.01)  # 避免除以零
             
@@ -3599,21 +3703,22 @@ class Dashboard(QWidget):
         # 設定動畫方向：direction=1 向左滑出，direction=-1 向右滑出
         slide_offset = stack_width if direction > 0 else -stack_width
         
-        # 準備目標卡片
-        to_widget.setGeometry(0, 0, stack_width, current_row.height())
-        to_widget.move(slide_offset, 0)
-        to_widget.show()
-        to_widget.raise_()
+        # 以快照取代實際卡片做動畫，滑動期間不重繪卡片子元件
+        from_snap = current_row.snapshot(from_index)
+        to_snap = current_row.snapshot(to_index)
+        from_widget.hide()
+        to_snap.move(slide_offset, 0)
+        to_snap.raise_()
         
         # 當前卡片滑出動畫
-        self._card_out_anim = QPropertyAnimation(from_widget, b"pos")
+        self._card_out_anim = QPropertyAnimation(from_snap, b"pos")
         self._card_out_anim.setDuration(200)
-        self._card_out_anim.setStartValue(from_widget.pos())
+        self._card_out_anim.setStartValue(QPoint(0, 0))
         self._card_out_anim.setEndValue(QPoint(-slide_offset, 0))
         self._card_out_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
         
         # 目標卡片滑入動畫
-        self._card_in_anim = QPropertyAnimation(to_widget, b"pos")
+        self._card_in_anim = QPropertyAnimation(to_snap, b"pos")
         self._card_in_anim.setDuration(200)
         self._card_in_anim.setStartValue(QPoint(slide_offset, 0))
         self._card_in_anim.setEndValue(QPoint(0, 0))
@@ -3628,9 +3733,9 @@ class Dashboard(QWidget):
             # Spotify 更新邏輯：檢查是否在音樂卡片所在的第一列
             self._handle_spotify_update_on_row_change(self.current_row_index)
             
-            # 重設位置
-            from_widget.move(0, 0)
-            to_widget.move(0, 0)
+            # 移除動畫快照
+            from_snap.deleteLater()
+            to_snap.deleteLater()
             self._right_card_animating = False
         
         self._card_in_anim.finished.connect(on_card_animation_finished)
@@ -3669,21 +3774,22 @@ class Dashboard(QWidget):
         # 設定動畫方向：direction=1 向上滑出，direction=-1 向下滑出
         slide_offset = stack_height if direction > 0 else -stack_height
         
-        # 準備目標列
-        to_widget.setGeometry(0, 0, self.row_stack.width(), stack_height)
-        to_widget.move(0, slide_offset)
-        to_widget.show()
-        to_widget.raise_()
+        # 以快照取代實際列做動畫，滑動期間不重繪卡片子元件
+        from_snap = self.row_stack.snapshot(from_row)
+        to_snap = self.row_stack.snapshot(to_row)
+        from_widget.hide()
+        to_snap.move(0, slide_offset)
+        to_snap.raise_()
         
         # 當前列滑出動畫
-        self._row_out_anim = QPropertyAnimation(from_widget, b"pos")
+        self._row_out_anim = QPropertyAnimation(from_snap, b"pos")
         self._row_out_anim.setDuration(200)
-        self._row_out_anim.setStartValue(from_widget.pos())
+        self._row_out_anim.setStartValue(QPoint(0, 0))
         self._row_out_anim.setEndValue(QPoint(0, -slide_offset))
         self._row_out_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
         
         # 目標列滑入動畫
-        self._row_in_anim = QPropertyAnimation(to_widget, b"pos")
+        self._row_in_anim = QPropertyAnimation(to_snap, b"pos")
         self._row_in_anim.setDuration(200)
         self._row_in_anim.setStartValue(QPoint(0, slide_offset))
         self._row_in_anim.setEndValue(QPoint(0, 0))
@@ -3697,9 +3803,9 @@ class Dashboard(QWidget):
             self.current_card_index = 0
             self.rows[to_row].setCurrentIndex(0)
             self.update_indicators()
-            # 重設位置
-            from_widget.move(0, 0)
-            to_widget.move(0, 0)
+            # 移除動畫快照
+            from_snap.deleteLater()
+            to_snap.deleteLater()
             self._right_row_animating = False
         
         self._row_in_anim.finished.connect(on_row_animation_finished)
@@ -3822,11 +3928,7 @@ class Dashboard(QWidget):
         # 映射: 0 -> 0, 2 -> 1
         indicator_index = 0 if current_index == 0 else 1
         
-        for i, indicator in enumerate(self.left_indicators):
-            if i == indicator_index:
-                indicator.setStyleSheet("color: #6af; font-size: 18px;")
-            else:
-                indicator.setStyleSheet("color: #444; font-size: 18px;")
+        self._set_active_dot("left", self.left_indicators, indicator_index)
     
     # === GPIO 按鈕接口（預留給樹莓派 GPIO）===
     def on_button_a_pressed(self):
@@ -4283,7 +4385,7 @@ class Dashboard(QWidget):
         # 更新關機監控器的行程資訊
         if hasattr(self, '_shutdown_monitor') and hasattr(self, 'trip_info_card'):
             trip_info = self.trip_info_card.get_trip_info()
-            if os.environ.get('PERF_MONITOR', '').lower() in ('1', 'true', 'yes'):
+            if self._perf_log:
                 print(f"[DEBUG] get_trip_info result: {trip_info}")
                 print(f"[DEBUG] trip_info_card.start_time: {self.trip_info_card.start_time}")
                 print(f"[DEBUG] trip_info_card.trip_distance: {self.trip_info_card.trip_distance}")
@@ -4348,61 +4450,24 @@ class Dashboard(QWidget):
     
     def update_cruise_display(self):
         """更新巡航顯示 - 三種狀態"""
-        if not self.cruise_switch:
-            # 不顯示
-            self.cruise_label.setText("")
-        elif self.cruise_engaged:
-            # 綠色 - 作動中
-            self.cruise_label.setText("CRUISE")
-            self.cruise_label.setStyleSheet("""
-                color: #4ade80;
-                font-size: 40px;
-                font-weight: bold;
-                font-family: Arial;
-                background: transparent;
-                letter-spacing: 2px;
-            """)
-        else:
-            # 白色 - 待命
-            self.cruise_label.setText("CRUISE")
-            self.cruise_label.setStyleSheet("""
-                color: #ffffff;
-                font-size: 40px;
-                font-weight: bold;
-                font-family: Arial;
-                background: transparent;
-                letter-spacing: 2px;
-            """)
+        cruise_text = "CRUISE" if self.cruise_switch else ""
+        if self.cruise_label.text() != cruise_text:
+            self.cruise_label.setText(cruise_text)
+        if self.cruise_switch:
+            # 綠色 - 作動中 / 白色 - 待命
+            self._set_style_property(self.cruise_label, "engaged", bool(self.cruise_engaged))
 
     def update_parking_brake_display(self):
         """更新手煞車顯示"""
-        if self.parking_brake:
-            # 紅色 - 手煞車拉起
-            self.parking_brake_label.setText("P")
-            self.parking_brake_label.setStyleSheet("""
-                color: #f66;
-                font-size: 32px;
-                font-weight: bold;
-                font-family: Arial;
-                background: rgba(255, 100, 100, 0.2);
-                border: 2px solid #f66;
-                border-radius: 25px;
-            """)
-        else:
-            # 不顯示
-            self.parking_brake_label.setText("")
-            self.parking_brake_label.setStyleSheet("""
-                color: #f66;
-                font-size: 32px;
-                font-weight: bold;
-                font-family: Arial;
-                background: transparent;
-                border: none;
-            """)
+        # 紅色 - 手煞車拉起 / 不顯示
+        brake_text = "P" if self.parking_brake else ""
+        if self.parking_brake_label.text() != brake_text:
+            self.parking_brake_label.setText(brake_text)
+        self._set_style_property(self.parking_brake_label, "engaged", bool(self.parking_brake))
 
     def _slot_update_parking_brake(self, is_engaged: bool):
         """Slot: 更新手煞車狀態（從 GPIO 訊號）"""
-        if os.environ.get('PERF_MONITOR', '').lower() in ('1', 'true', 'yes'):
+        if self._perf_log:
             print(f"[Dashboard] 收到手煞車信號: {is_engaged}")
         self.parking_brake = is_engaged
         self.update_parking_brake_display()
@@ -4416,7 +4481,7 @@ class Dashboard(QWidget):
         - 有任意雷達觸發（值 > 0）
         - 1 分鐘內只自動切換一次
         """
-        if os.environ.get('PERF_MONITOR', '').lower() in ('1', 'true', 'yes'):
+        if self._perf_log:
             print(f"[Dashboard] Received radar data: {radar_str}")  # Debug 用
         if hasattr(self, 'door_card'):
             self.door_card.set_radar_status(radar_str)
@@ -4508,7 +4573,7 @@ class Dashboard(QWidget):
     
     def set_parking_brake(self, is_engaged: bool):
         """設定手煞車狀態 - 供外部呼叫"""
-        if os.environ.get('PERF_MONITOR', '').lower() in ('1', 'true', 'yes'):
+        if self._perf_log:
             print(f"[Dashboard] 設定手煞車: {is_engaged}")
         self.parking_brake = is_engaged
         self.update_parking_brake_display()
@@ -4548,8 +4613,7 @@ class Dashboard(QWidget):
 
     def _update_speed_display(self):
         """局部更新中心速度數字。"""
-        import vehicle.datagrab as datagrab
-        use_gps = datagrab.gps_speed_mode and self.is_gps_fixed and self.speed >= 20.0
+        use_gps = self._dg.gps_speed_mode and self.is_gps_fixed and self.speed >= 20.0
         if use_gps:
             speed_text = str(int(self.current_gps_speed))
         else:
@@ -4559,31 +4623,8 @@ class Dashboard(QWidget):
 
     def _update_gear_display(self):
         """局部更新檔位文字與顏色。"""
-        gear_colors = {
-            "P": "#6af",   # 藍色
-            "R": "#f66",   # 紅色
-            "N": "#fa6",   # 橙色
-            "D": "#4ade80",  # 綠色
-            "1": "#6af",   # 藍色 (1檔)
-            "2": "#6af",   # 藍色 (2檔)
-            "3": "#6af",   # 藍色 (3檔)
-            "4": "#6af",   # 藍色 (4檔)
-            "5": "#6af",   # 藍色 (5檔)
-            "S": "#f6f",   # 紫色
-            "L": "#ff6",   # 黃色
-        }
-        color = gear_colors.get(self.gear, "#6af")
-        if getattr(self, "_last_gear_color", None) != color:
-            self.gear_label.setStyleSheet(f"""
-                color: {color};
-                font-size: 120px;
-                font-weight: bold;
-                font-family: Arial;
-                background: rgba(30, 30, 40, 0.8);
-                border: 4px solid #456;
-                border-radius: 20px;
-            """)
-            self._last_gear_color = color
+        # 顏色由 _DASHBOARD_QSS 的 tone 屬性決定（未知檔位沿用藍色）
+        self._set_style_property(self.gear_label, "tone", self._GEAR_TONES.get(self.gear, "blue"))
         if self.gear_label.text() != self.gear:
             self.gear_label.setText(self.gear)
 
@@ -4666,6 +4707,9 @@ def run_dashboard(
     """
     app = QApplication(sys.argv)
     
+    # 全域 pixmap 快取 20 MB（導航轉彎圖示等），整段執行期間每張圖只解碼一次
+    QPixmapCache.setCacheLimit(20480)
+    
     # 檢測環境
     is_production = is_production_environment()
     env_name = "生產環境（樹莓派）" if is_production else "開發環境（Mac/Windows）"
@@ -4824,6 +4868,12 @@ def run_dashboard(
         if monitor.enabled:
             monitor.report()
         
+        # 停止遙測發布與網路監控執行緒
+        if dashboard._telemetry_publisher.isRunning():
+            dashboard._telemetry_publisher.stop()
+        if dashboard.network_monitor_thread is not None and dashboard.network_monitor_thread.isRunning():
+            dashboard.network_monitor_thread.stop()
+        
         # 儲存里程資料
         try:
             storage = OdometerStorage()
@@ -4845,6 +4895,12 @@ def run_dashboard(
             except Exception as e:
                 print(f"清理時發生錯誤: {e}")
     
+    # 控制面板要求重啟：清理都已完成，flush 日誌後以 execve 原地替換行程
+    restart = pending_restart()
+    if restart is not None:
+        logging.shutdown()
+        exec_restart(*restart)
+    
     sys.exit(exit_code)
 
 # 全域變數儲存硬體初始化結果
@@ -4912,7 +4968,6 @@ def main():
         signals.update_fuel_consumption.connect(dashboard.set_fuel_consumption)
         
         # 啟動背景執行緒
-        import threading
         t_receiver = threading.Thread(
             target=datagrab.unified_receiver, 
             args=(can_bus, db, signals), 
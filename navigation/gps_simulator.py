@@ -76,6 +76,7 @@ def main() -> int:
     print("GPS SIMULATOR (NMEA -> pseudo-tty)")
     print(f"Port: {port_path}")
     print("Usage: point your app to this serial port (baud 38400). Keep this running.")
+    print("       location_notifier only scans /dev/pts/* when DASHBOARD_DEBUG_PTS=1 is set.")
     print("Ctrl+C to stop.")
     print("=" * 60)
 
@@ -143,7 +144,7 @@ def main() -> int:
                 obd_speed = speed_kmh + args.obd_offset
                 datagrab_module.data_store["OBD"]["speed"] = obd_speed
                 datagrab_module.data_store["OBD"]["speed_smoothed"] = obd_speed
-                datagrab_module.data_store["OBD"]["last_update"] = time.time()
+                datagrab_module.data_store["OBD"]["last_update"] = time.monotonic()
 
             fix_str = 'NO' if args.no_fix else 'YES'
             obd_str = f" | OBD={speed_kmh + args.obd_offset:.1f}" if datagrab_module else ""
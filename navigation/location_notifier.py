@@ -209,7 +209,10 @@ def find_gps_and_get_location(timeout=10):
     Returns (lat, lon, is_approx) or None.
     """
     # 掃描可能的連接埠
-    potential_ports = glob.glob('/dev/ttyUSB*') + glob.glob('/dev/ttyACM*') + glob.glob('/dev/pts/*')
+    # /dev/pts/* 是所有 ssh/tmux 虛擬終端，逐一探測非常耗時；
+    # 僅在開發時（搭配 gps_simulator.py）以 DASHBOARD_DEBUG_PTS=1 開啟
+    pts_ports = glob.glob('/dev/pts/*') if os.environ.get('DASHBOARD_DEBUG_PTS') else []
+    potential_ports = glob.glob('/dev/ttyUSB*') + glob.glob('/dev/ttyACM*') + pts_ports
     baud_rates = [38400, 9600, 115200, 4800]
     
     # print(f"[*] Scanning ports: {potential_ports}")
@@ -42,6 +42,7 @@ class SpotifyListener:
         self.last_track_id = None
         self.last_playback = None
         self.last_album_art = None
+        self._album_art_cache = {}  # url -> 縮小後的 PIL Image（同專輯連續播放不重複下載）
         
         # 本地進度追蹤（用於補間）
         self.local_progress_ms = 0
@@ -374,6 +375,11 @@ class SpotifyListener:
         Returns:
             PIL.Image.Image: 縮小後的圖片物件，失敗則返回 None
         """
+        cached = self._album_art_cache.get(url)
+        if cached is not None:
+            self.last_album_art = cached
+            return cached
+        
         try:
             response = requests.get(url, timeout=5)
             response.raise_for_status()
@@ -392,6 +398,10 @@ class SpotifyListener:
                 image = image.convert('RGB')
             
             self.last_album_art = image
+            self._album_art_cache[url] = image
+            if len(self._album_art_cache) > 16:
+                oldest_key = next(iter(self._album_art_cache))
+                self._album_art_cache.pop(oldest_key, None)
             return image
             
         except Exception as e:
@@ -56,7 +56,7 @@ def simulator_thread(speed_kmh=50.0, obd_offset=3.0, mode="fixed"):
             # 更新 datagrab 數據
             datagrab.data_store["OBD"]["speed"] = obd_speed
             datagrab.data_store["OBD"]["speed_smoothed"] = obd_speed
-            datagrab.data_store["OBD"]["last_update"] = time.time()
+            datagrab.data_store["OBD"]["last_update"] = time.monotonic()
             
             # RPM 跟速度連動
             fake_rpm = 800 + (gps_speed / 120.0) * 4000
@@ -102,6 +102,97 @@ class RadarOverlay(QWidget):
             painter.drawArc(rect, int(start_angle * 16), int(span_angle * 16))
 
 
+class BrightnessOverlay(QWidget):
+    """亮度調節覆蓋層 - 以 QPainter 填滿半透明黑色，不經過 QSS 解析"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)  # 讓滑鼠事件穿透
+        self._color = QColor(0, 0, 0, 0)
+
+    def set_alpha(self, alpha):
+        """設定黑色遮罩透明度（0~255），值有變才重繪"""
+        if self._color.alpha() != alpha:
+            self._color.setAlpha(alpha)
+            self.update()
+
+    def paintEvent(self, event):
+        if self._color.alpha() == 0:
+            return
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self._color)
+        painter.end()
+
+
+class CardDeck(QWidget):
+    """固定尺寸的卡片容器 - 以 show/hide 切換子頁，取代 QStackedWidget
+
+    每張卡片都疊在 (0, 0) 並與容器同尺寸，切換時只隱藏舊卡、顯示新卡，
+    不經過 QStackedLayout 的版面重新計算。提供與 QStackedWidget 相同的
+    addWidget / widget / count / currentIndex / setCurrentIndex 介面。
+    """
+    def __init__(self, width, height, parent=None):
+        super().__init__(parent)
+        self.setFixedSize(width, height)
+        self._cards = []
+        self._current = -1
+
+    def addWidget(self, widget):
+        widget.setParent(self)
+        widget.setGeometry(0, 0, self.width(), self.height())
+        self._cards.append(widget)
+        if self._current < 0:
+            self._current = 0
+            widget.show()
+        else:
+            widget.hide()
+        return len(self._cards) - 1
+
+    def widget(self, index):
+        if 0 <= index < len(self._cards):
+            return self._cards[index]
+        return None
+
+    def count(self):
+        return len(self._cards)
+
+    def currentIndex(self):
+        return self._current
+
+    def setCurrentIndex(self, index):
+        """切換顯示的卡片；同時隱藏滑動動畫可能留下的其他可見卡片"""
+        if not 0 <= index < len(self._cards):
+            return
+        self._current = index
+        for i, card in enumerate(self._cards):
+            if i != index and not card.isHidden():
+                card.hide()
+        target = self._cards[index]
+        if target.isHidden():
+            target.show()
+
+    def snapshot(self, index):
+        """把指定卡片渲染成一張 QPixmap，放在覆蓋於卡片上方的 QLabel 中
+
+        滑動動畫只移動這張快照，不必每一幀重繪整棵卡片子元件樹。
+        快照在每次切換時才擷取，因此內容永遠是當下的資料。
+        """
+        card = self._cards[index]
+        # 延遲載入內容的卡片（例如門狀態圖片）在擷取前先完成載入
+        ensure_loaded = getattr(card, "ensure_loaded", None)
+        if ensure_loaded is not None:
+            ensure_loaded()
+        card.ensurePolished()
+        if card.layout() is not None:
+            card.layout().activate()
+        label = QLabel(self)
+        label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        label.setStyleSheet("background: transparent;")
+        label.setGeometry(0, 0, self.width(), self.height())
+        label.setPixmap(card.grab())
+        label.show()
+        return label
+
+
 class ClickableLabel(QLabel):
     """可點擊的 QLabel，發出 clicked 信號"""
     clicked = pyqtSignal()
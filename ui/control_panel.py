@@ -1,13 +1,153 @@
 # Auto-extracted from main.py
 import os
 import time
+import random
 import platform
+import subprocess
+import sys
+import threading
+from datetime import datetime
+from functools import lru_cache, partial
 from PyQt6.QtWidgets import *
 from PyQt6.QtCore import *
 from PyQt6.QtGui import *
 
 from ui.theme import get_theme_manager, T
 
+# 嘗試導入 dbus (查詢 NetworkManager SSID、呼叫 timedated，不必 fork 外部指令)
+try:
+    import dbus
+    DBUS_AVAILABLE = True
+except ImportError:
+    DBUS_AVAILABLE = False
+
+_NM_BUS_NAME = 'org.freedesktop.NetworkManager'
+_NM_PATH = '/org/freedesktop/NetworkManager'
+_DBUS_PROPS = 'org.freedesktop.DBus.Properties'
+_TIMEDATE1_NAME = 'org.freedesktop.timedate1'
+_TIMEDATE1_PATH = '/org/freedesktop/timedate1'
+_SYSTEMD1_NAME = 'org.freedesktop.systemd1'
+_SYSTEMD1_PATH = '/org/freedesktop/systemd1'
+
+# 本模組所在目錄（git 指令工作目錄與重啟時的專案根目錄推算基準）
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.dirname(_SCRIPT_DIR)
+
+
+def _first_existing_script(*candidates):
+    """回傳專案根目錄下第一個存在的腳本路徑，皆不存在時回傳 None"""
+    for candidate in candidates:
+        path = os.path.join(_PROJECT_ROOT, candidate)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+# 重啟計畫表（載入時解析一次路徑）：入口 → (重啟腳本, 參數)
+# 參數以 '-m' 開頭時以 module 方式啟動，腳本路徑僅用於確認存在
+_RESTART_TABLE = {
+    'main': (os.path.join(_PROJECT_ROOT, 'main.py'), []),
+    'datagrab': (_first_existing_script('datagrab.py', 'vehicle/datagrab.py'), ['-m', 'vehicle.datagrab']),
+    'demo': (_first_existing_script('demo_mode.py', 'vehicle/demo_mode.py'), ['--spotify']),
+}
+# 入口名稱別名（腳本檔名 → 重啟計畫表 key）
+_ENTRY_ALIASES = {'demo_mode': 'demo'}
+
+
+def _normalize_entry(name):
+    """將 argv[0] 或 DASHBOARD_ENTRY（如 'datagrab.py'、'vehicle/demo_mode.py'）正規化為計畫表 key"""
+    name = os.path.basename(name.strip()).lower()
+    if name.endswith('.py'):
+        name = name[:-3]
+    return _ENTRY_ALIASES.get(name, name)
+
+
+def _detect_entry_key():
+    """判斷程式入口：sys.argv[0] 優先，其次 DASHBOARD_ENTRY 環境變數；無法判斷時回傳 None"""
+    argv_key = _normalize_entry(sys.argv[0]) if sys.argv else ''
+    if argv_key in _RESTART_TABLE:
+        return argv_key
+    env_key = _normalize_entry(os.environ.get('DASHBOARD_ENTRY', ''))
+    if env_key in _RESTART_TABLE:
+        return env_key
+    return None
+
+# 平台與系統工具偵測（執行期間不會改變，載入時檢查一次）
+_IS_LINUX = platform.system() == 'Linux'
+_HAS_TIMEDATECTL = os.path.exists('/usr/bin/timedatectl')
+_HAS_NTPDATE = os.path.exists('/usr/sbin/ntpdate')
+_HAS_RTC = os.path.exists('/dev/rtc0')
+# deploy/setup_sudoers.sh 安裝的 root 擁有輔助腳本：一次 sudo 完成 set-ntp + 重啟 timesyncd
+_NTP_HELPER = '/usr/local/sbin/qtdashboard-ntp-sync'
+_HAS_NTP_HELPER = os.path.exists(_NTP_HELPER)
+
+# NTP 同步狀態輪詢：每 0.5 秒檢查一次，最多 5 秒，一同步就提早結束
+_NTP_POLL_INTERVAL_MS = 500
+_NTP_POLL_TRIES = 10
+
+# 非 Linux 開發環境的模擬 WiFi 名稱
+_DUMMY_SSIDS = ("Home-WiFi", "Office-5G", "Starbucks_Free", "iPhone 熱點")
+
+
+@lru_cache(maxsize=128)
+def _adjust_color(hex_color, factor):
+    """調整顏色亮度（結果依 (hex, factor) 快取）"""
+    value = int(hex_color.lstrip('#'), 16)
+    r = min(255, int(((value >> 16) & 0xFF) * factor))
+    g = min(255, int(((value >> 8) & 0xFF) * factor))
+    b = min(255, int((value & 0xFF) * factor))
+    return f'#{(r << 16) | (g << 8) | b:06x}'
+
+
+@lru_cache(maxsize=64)
+def _solid_button_qss(color, font_size, hover_factor, pressed_factor):
+    """單色按鈕的完整樣式表（含 hover/pressed），依參數快取"""
+    return f"""
+        QPushButton {{
+            background-color: {color};
+            border: none;
+            border-radius: 20px;
+            font-size: {font_size}px;
+            color: white;
+        }}
+        QPushButton:hover {{
+            background-color: {_adjust_color(color, hover_factor)};
+        }}
+        QPushButton:pressed {{
+            background-color: {_adjust_color(color, pressed_factor)};
+        }}
+    """
+
+
+# 快捷按鈕共用樣式模板，以 accent 動態屬性選擇顏色
+_CONTROL_BTN_QSS = """
+    QPushButton[accent="{color}"] {{
+        background-color: {color};
+        border: none;
+        border-radius: 20px;
+        font-size: 48px;
+        color: white;
+    }}
+    QPushButton[accent="{color}"]:hover {{
+        background-color: {hover};
+    }}
+    QPushButton[accent="{color}"]:pressed {{
+        background-color: {pressed};
+    }}
+"""
+
+
+def _build_control_buttons_qss(colors):
+    """為所有快捷按鈕顏色產生一份共用樣式表"""
+    return "".join(
+        _CONTROL_BTN_QSS.format(
+            color=color,
+            hover=_adjust_color(color, 1.2),
+            pressed=_adjust_color(color, 0.8),
+        )
+        for color in dict.fromkeys(colors)
+    )
+
 class TurnSignalBar(QWidget):
     """方向燈漸層條 - 使用 QPainter 繪製，避免 CSS 效能問題
     
@@ -31,14 +171,20 @@ class TurnSignalBar(QWidget):
         self._color_mid = QColor(140, 255, 0)
         self._color_dim = QColor(120, 255, 0)
         self._color_dark = QColor(30, 30, 30)
+        
+        # 漸層筆刷快取：只在寬度或漸層位置改變時重建（靜態亮燈時每次閃爍都重用）
+        self._brush_key = None
+        self._brush = None
     
     def set_gradient_pos(self, pos: float):
         """設定漸層位置並觸發重繪
         Args:
             pos: 0.0 到 1.0
         """
+        # 量化到 1/128，肉眼看不出的微小變化不觸發重繪
+        pos = round(max(0.0, min(1.0, pos)) * 128) / 128.0
         if self.gradient_pos != pos:
-            self.gradient_pos = max(0.0, min(1.0, pos))
+            self.gradient_pos = pos
             self.update()  # 觸發 paintEvent
     
     def paintEvent(self, event):
@@ -46,13 +192,26 @@ class TurnSignalBar(QWidget):
         if self.gradient_pos <= 0:
             return  # 完全熄滅，不繪製任何東西
         
+        w = self.width()
+        h = self.height()
+        
+        key = (w, self.gradient_pos)
+        if key != self._brush_key:
+            self._brush = self._build_brush(w, self.gradient_pos)
+            self._brush_key = key
+        
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        w = self.width()
-        h = self.height()
-        pos = self.gradient_pos
+        # 繪製圓角矩形
+        painter.setBrush(self._brush)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawRoundedRect(0, 0, w, h, 4, 4)
         
+        painter.end()
+    
+    def _build_brush(self, w, pos):
+        """依寬度與漸層位置建立漸層筆刷"""
         # 建立漸層
         if self.direction == "left":
             # 左轉燈：從左邊（亮）到右邊（暗）
@@ -80,18 +239,253 @@ class TurnSignalBar(QWidget):
             gradient.setColorAt(min(0.85 * pos, 0.99), self._color_dim)
             gradient.setColorAt(1, self._color_dark)
         
-        # 繪製圓角矩形
-        painter.setBrush(QBrush(gradient))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRoundedRect(0, 0, w, h, 4, 4)
-        
-        painter.end()
+        return QBrush(gradient)
+
 
 
+# 控制面板要求的重啟 (cmd, cwd, env)；由 run_dashboard 在事件迴圈結束、清理完成後執行
+_pending_restart = None
+
+
+def pending_restart():
+    """回傳待執行的重啟 (cmd, cwd, env)，沒有要求重啟時回傳 None"""
+    return _pending_restart
+
+
+def exec_restart(cmd, cwd, env):
+    """以 execve 原地重啟程式（呼叫端須先完成所有清理）"""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    try:
+        os.chdir(cwd)
+        os.execve(cmd[0], cmd, env)
+    except OSError as e:
+        # execve 失敗時退回另開新行程
+        print(f"[重啟] execve 失敗，改用新行程啟動: {e}")
+        subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            env=env,
+            start_new_session=True,
+            stdin=subprocess.DEVNULL
+        )
+
+
+class NtpSyncThread(QThread):
+    """NTP 時間校正執行緒
+    
+    timedatectl / systemctl / ntpdate / hwclock 都可能耗時數秒，
+    在背景執行以免凍結 GUI，結果透過訊號回傳。
+    """
+    sync_finished = pyqtSignal(bool, str)  # (success, result_text)
+    sync_error = pyqtSignal(str, str, bool)  # (title, text, critical)
+    
+    def run(self):
+        try:
+            success, result_text = self._sync()
+        except subprocess.TimeoutExpired:
+            self.sync_error.emit("時間校正逾時", "NTP 同步逾時，請檢查網路連線後重試。", False)
+            return
+        except Exception as e:
+            self.sync_error.emit("時間校正錯誤", f"發生錯誤：{str(e)}", True)
+            return
+        self.sync_finished.emit(success, result_text)
+    
+    def _sync(self):
+        """執行同步，回傳 (success, result_text)"""
+        result_text = ""
+        success = False
+        
+        # 嘗試使用 timedatectl (systemd-timesyncd)
+        if _HAS_TIMEDATECTL:
+            # 優先直接透過 D-Bus 呼叫 timedated/systemd（需 polkit 授權，免 sudo 與 fork）
+            synced = self._sync_via_dbus()
+            if synced is None:
+                print("[時間校正] 使用 timedatectl...")
+                
+                if _HAS_NTP_HELPER:
+                    # 啟用 NTP + 重啟 timesyncd 合併成一次 sudo（sudoers 白名單中的固定腳本）
+                    result = subprocess.run(['sudo', '-n', _NTP_HELPER, 'start'],
+                                            capture_output=True, timeout=15)
+                    if result.returncode != 0:
+                        return False, "啟用 NTP 失敗"
+                else:
+                    # 未安裝輔助腳本：逐一執行 sudoers 允許的個別指令
+                    # （不能包成 sudo bash -c，白名單沒有也不該有 bash）
+                    result = subprocess.run(['sudo', 'timedatectl', 'set-ntp', 'true'],
+                                            capture_output=True, timeout=5)
+                    if result.returncode != 0:
+                        return False, "啟用 NTP 失敗"
+
+                    # 重啟 timesyncd 強制同步
+                    result = subprocess.run(['sudo', 'systemctl', 'restart', 'systemd-timesyncd'],
+                                            capture_output=True, timeout=10)
+                    if result.returncode != 0:
+                        return False, "重啟 systemd-timesyncd 失敗"
+                
+                # 等待同步
+                synced = self._wait_ntp_synchronized(self._ntp_synchronized_cli)
+            
+            # 指令都成功即視為成功；即使尚未回報同步完成，也可能已經更新
+            success = True
+            result_text = "NTP 同步成功" if synced else "已嘗試 NTP 同步"
+                
+        # 備用：嘗試使用 ntpdate
+        elif _HAS_NTPDATE:
+            print("[時間校正] 使用 ntpdate...")
+            result = subprocess.run(
+                ['sudo', 'ntpdate', '-u', 'pool.ntp.org'],
+                capture_output=True, text=True, timeout=15
+            )
+            if result.returncode == 0:
+                success = True
+                result_text = "NTP 同步成功"
+            else:
+                # 嘗試備用伺服器
+                result = subprocess.run(
+                    ['sudo', 'ntpdate', '-u', 'time.google.com'],
+                    capture_output=True, text=True, timeout=15
+                )
+                success = result.returncode == 0
+                result_text = "NTP 同步成功" if success else "同步失敗"
+        else:
+            result_text = "未找到 NTP 工具"
+            success = False
+        
+        # 如果有 RTC，也同步到 RTC
+        if success and _HAS_RTC:
+            print("[時間校正] 同步時間到 RTC...")
+            cmd = ['sudo', '-n', _NTP_HELPER, 'rtc'] if _HAS_NTP_HELPER else ['sudo', 'hwclock', '-w']
+            result = subprocess.run(cmd, capture_output=True, timeout=5)
+            if result.returncode == 0:
+                result_text += "\n已同步到 RTC"
+            else:
+                result_text += "\n寫入 RTC 失敗"
+        
+        return success, result_text
+    
+    def _sync_via_dbus(self):
+        """透過 D-Bus 啟用 NTP 並重啟 systemd-timesyncd
+        
+        Returns:
+            是否已同步；D-Bus 不可用或未授權時回傳 None（改用 sudo timedatectl）
+        """
+        if not DBUS_AVAILABLE:
+            return None
+        try:
+            bus = dbus.SystemBus()
+            timedate = bus.get_object(_TIMEDATE1_NAME, _TIMEDATE1_PATH)
+            systemd = bus.get_object(_SYSTEMD1_NAME, _SYSTEMD1_PATH)
+            
+            print("[時間校正] 使用 D-Bus (timedate1)...")
+            # SetNTP(use_ntp, interactive)
+            timedate.SetNTP(True, False, dbus_interface=_TIMEDATE1_NAME)
+            systemd.RestartUnit('systemd-timesyncd.service', 'replace',
+                                dbus_interface=_SYSTEMD1_NAME + '.Manager')
+            
+            def is_synchronized():
+                return bool(timedate.Get(_TIMEDATE1_NAME, 'NTPSynchronized',
+                                         dbus_interface=_DBUS_PROPS))
+            
+            return self._wait_ntp_synchronized(is_synchronized)
+        except Exception as e:
+            print(f"[時間校正] D-Bus 呼叫失敗，改用 timedatectl: {e}")
+            return None
+    
+    def _wait_ntp_synchronized(self, is_synchronized):
+        """輪詢 NTP 同步狀態，同步後立即返回（以截止時間為上限，約 5 秒）"""
+        deadline = time.monotonic() + _NTP_POLL_TRIES * _NTP_POLL_INTERVAL_MS / 1000
+        while True:
+            if is_synchronized():
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            self.msleep(_NTP_POLL_INTERVAL_MS)
+    
+    @staticmethod
+    def _ntp_synchronized_cli():
+        """以 timedatectl 查詢同步狀態（不需 sudo）；查詢失敗視為尚未同步"""
+        try:
+            result = subprocess.run(['timedatectl', 'show', '-p', 'NTPSynchronized'],
+                                    capture_output=True, text=True, timeout=1)
+        except (subprocess.TimeoutExpired, OSError):
+            return False
+        return 'NTPSynchronized=yes' in result.stdout
+
 
 class ControlPanel(QWidget):
     """下拉控制面板（類似 Android 狀態列）"""
     
+    speed_calibration_toggled = pyqtSignal(bool)  # 速度校正模式切換（enabled）
+    
+    # 預先組好的按鈕樣式表，狀態切換時只需查表
+    _SPEED_SYNC_LABELS = {
+        "calibrated": "OBD\n(校正)",
+        "fixed": "OBD\n(同步)",
+        "gps": "OBD\n(GPS)",
+    }
+    _SPEED_SYNC_QSS = {
+        mode: _solid_button_qss(color, 28, 1.15, 0.85)
+        for mode, color in (("calibrated", "#4CAF50"), ("fixed", "#FF9800"), ("gps", "#2196F3"))
+    }
+    _SPEED_SYNC_FALLBACK_QSS = _solid_button_qss("#555555", 28, 1.15, 0.85)
+    
+    # 亮度等級 -> (圖示, 樣式表)：0=全亮, 1=75%, 2=50%
+    _BRIGHTNESS_STATES = tuple(
+        (icon, _solid_button_qss(color, 48, 1.2, 0.8))
+        for icon, color in (("☀", "#FF9800"), ("🔅", "#FFA726"), ("🔆", "#FFB74D"))
+    )
+    
+    _TIME_BTN_SYNCING_QSS = """
+        QPushButton {
+            background-color: #666;
+            border: none;
+            border-radius: 20px;
+            font-size: 48px;
+            color: white;
+        }
+    """
+    _TIME_BTN_IDLE_QSS = """
+        QPushButton {
+            background-color: #4285F4;
+            border: none;
+            border-radius: 20px;
+            font-size: 48px;
+            color: white;
+        }
+        QPushButton:hover {
+            background-color: #5a9cf4;
+        }
+        QPushButton:pressed {
+            background-color: #3367d6;
+        }
+    """
+    
+    _UPDATE_BTN_ENABLED_QSS = """
+        QPushButton {
+            background-color: #00BCD4;
+            border: none;
+            border-radius: 20px;
+            font-size: 48px;
+            color: white;
+        }
+        QPushButton:hover {
+            background-color: #26C6DA;
+        }
+        QPushButton:pressed {
+            background-color: #0097A7;
+        }
+    """
+    _UPDATE_BTN_DISABLED_QSS = """
+        QPushButton {
+            background-color: #444;
+            border: none;
+            border-radius: 20px;
+            font-size: 48px;
+            color: #888;
+        }
+    """
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(1920, 300)
@@ -102,8 +496,30 @@ class ControlPanel(QWidget):
         # WiFi 狀態
         self.wifi_ssid = None
         self.wifi_signal = 0
+        self._nm_proxy = None  # NetworkManager DBus 代理（首次查詢時建立）
         self.speed_sync_mode = "calibrated"  # 速度同步初始模式
         
+        # 防止連點重複觸發時間校正 / 自動更新
+        self._time_sync_busy = False
+        self._update_busy = False
+        
+        # 共用的非模態訊息框（依種類延遲建立）
+        self._message_boxes = {}
+        
+        # 電源選單縮放比例快取: ((視窗寬, 視窗高), scale)
+        self._power_menu_scale = None
+        # 電源選單對話框（首次開啟時建立）
+        self._power_dialog = None
+        self._power_dialog_scale = None
+        self._countdown_overlay = None  # 電源倒數提示（首次使用時建立）
+        # 程式入口（重啟計畫表 key），執行期間不會改變
+        self._entry_key = _detect_entry_key()
+        
+        # 按鈕目前套用的狀態，狀態未變時跳過 setStyleSheet（避免重新 polish）
+        self._time_btn_syncing = False
+        self._brightness_level = None
+        self._update_btn_enabled = None
+        
         # 主佈局
         layout = QVBoxLayout(self)
         layout.setContentsMargins(40, 30, 40, 30)
@@ -155,6 +571,7 @@ class ControlPanel(QWidget):
         
         self.buttons = []
         self.button_widgets = {}  # 用於存取特定按鈕
+        self._btn_cache = {}  # 標題 -> 容器內的 QPushButton
         # 三段速度模式：校正 / 固定1.05 / OBD+GPS
         self.speed_sync_modes = ["calibrated", "fixed", "gps"]
         self.speed_sync_mode_index = 0
@@ -168,16 +585,21 @@ class ControlPanel(QWidget):
             ("設定", "⚙", T('BTN_SETTINGS'))
         ]
         
+        # 所有快捷按鈕共用同一份樣式表，Qt 只需解析一次
+        self.setStyleSheet(_build_control_buttons_qss(color for _, _, color in button_configs))
+        
         for title, icon, color in button_configs:
             btn = self.create_control_button(title, icon, color)
             self.buttons.append(btn)
             self.button_widgets[title] = btn
+            self._btn_cache[title] = btn.findChild(QPushButton)
             button_layout.addWidget(btn)
 
         # 速度同步（三段模式）
         speed_sync_btn = self.create_speed_sync_button()
         self.buttons.append(speed_sync_btn)
         self.button_widgets["速度同步"] = speed_sync_btn
+        self._btn_cache["速度同步"] = speed_sync_btn.findChild(QPushButton)
         button_layout.addWidget(speed_sync_btn)
         
         content_layout.addLayout(button_layout)
@@ -316,8 +738,6 @@ class ControlPanel(QWidget):
         
     def update_status_info(self):
         """更新狀態資訊"""
-        from datetime import datetime
-        
         # 更新日期時間
         now = datetime.now()
         self.date_label.setText(now.strftime("%Y年%m月%d日"))
@@ -330,13 +750,10 @@ class ControlPanel(QWidget):
     
     def update_wifi_status(self):
         """更新 WiFi 狀態 - 使用 /proc/net/wireless + iw（輕量快速）"""
-        import random
-        
         # 檢查是否在 Linux 環境
-        if platform.system() != 'Linux':
+        if not _IS_LINUX:
             # macOS/Windows: 顯示模擬資料
-            dummy_networks = ["Home-WiFi", "Office-5G", "Starbucks_Free", "iPhone 熱點"]
-            ssid = random.choice(dummy_networks)
+            ssid = random.choice(_DUMMY_SSIDS)
             signal = random.randint(60, 95)
             
             self.wifi_ssid = ssid
@@ -390,9 +807,12 @@ class ControlPanel(QWidget):
                                     signal = 0
                                 break
             
-            # 2. 使用 iw 取得 SSID（比 iwgetid 更常見，不會觸發掃描）
+            # 2. 優先透過 DBus 向 NetworkManager 查詢 SSID（不需 fork）
             if interface and signal > 0:
-                import subprocess
+                ssid = self._get_ssid_via_dbus(interface)
+            
+            # 3. 備用：使用 iw 取得 SSID（比 iwgetid 更常見，不會觸發掃描）
+            if interface and signal > 0 and ssid is None:
                 try:
                     # iw dev <interface> link 可以取得當前連接的 SSID
                     result = subprocess.run(
@@ -427,7 +847,7 @@ class ControlPanel(QWidget):
                 except Exception:
                     ssid = None
             
-            # 3. 更新 UI
+            # 4. 更新 UI
             if ssid and signal > 0:
                 self.wifi_ssid = ssid
                 self.wifi_signal = signal
@@ -475,6 +895,34 @@ class ControlPanel(QWidget):
         # 更新「更新」按鈕狀態 (只在有網路時啟用)
         self._update_update_button_state()
     
+    def _get_ssid_via_dbus(self, interface):
+        """透過 NetworkManager DBus 取得介面目前連線的 SSID
+        
+        Returns:
+            SSID 字串；未連線回傳空字串；DBus 不可用時回傳 None（改用 iw）
+        """
+        if not DBUS_AVAILABLE:
+            return None
+        try:
+            if self._nm_proxy is None:
+                bus = dbus.SystemBus()
+                self._nm_proxy = (bus, bus.get_object(_NM_BUS_NAME, _NM_PATH))
+            bus, nm = self._nm_proxy
+            
+            device_path = nm.GetDeviceByIpIface(interface, dbus_interface=_NM_BUS_NAME)
+            device = bus.get_object(_NM_BUS_NAME, device_path)
+            ap_path = device.Get(_NM_BUS_NAME + '.Device.Wireless', 'ActiveAccessPoint',
+                                 dbus_interface=_DBUS_PROPS)
+            if ap_path == '/':
+                return ''
+            ap = bus.get_object(_NM_BUS_NAME, ap_path)
+            raw_ssid = ap.Get(_NM_BUS_NAME + '.AccessPoint', 'Ssid', dbus_interface=_DBUS_PROPS)
+            return bytes(raw_ssid).decode('utf-8', errors='replace')
+        except Exception:
+            # NetworkManager 未執行或介面不受管理，改用 iw
+            self._nm_proxy = None
+            return None
+    
     def _update_update_button_state(self):
         """根據網路狀態更新「更新」按鈕"""
         # 檢查父視窗的網路狀態
@@ -527,23 +975,9 @@ class ControlPanel(QWidget):
         # 按鈕主體
         btn = QPushButton()
         btn.setFixedSize(120, 120)
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
-                border: none;
-                border-radius: 20px;
-                font-size: 48px;
-                color: white;
-            }}
-            QPushButton:hover {{
-                background-color: {self.adjust_color(color, 1.2)};
-            }}
-            QPushButton:pressed {{
-                background-color: {self.adjust_color(color, 0.8)};
-            }}
-        """)
+        btn.setProperty("accent", color)  # 樣式由面板的共用樣式表提供
         btn.setText(icon)
-        btn.clicked.connect(lambda checked=False, t=title: self.on_button_clicked(t, checked))
+        btn.clicked.connect(partial(self.on_button_clicked, title))
         # 標籤
         label = QLabel(title)
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -573,7 +1007,7 @@ class ControlPanel(QWidget):
 
         btn = QPushButton()
         btn.setFixedSize(120, 120)
-        btn.clicked.connect(lambda checked=False: self.on_button_clicked("速度同步", checked))
+        btn.clicked.connect(partial(self.on_button_clicked, "速度同步"))
         
         # 長按檢測（1.5 秒）
         btn._long_press_timer = QTimer()
@@ -621,9 +1055,7 @@ class ControlPanel(QWidget):
             current_val = 1.01
         
         # 彈出確認對話框
-        from PyQt6.QtWidgets import QMessageBox
-        
-        msg = QMessageBox()
+        msg = QMessageBox(self.window())
         
         if current_enabled:
             # 已開啟 → 長按 = 存檔並關閉
@@ -640,82 +1072,101 @@ class ControlPanel(QWidget):
         msg.setDefaultButton(QMessageBox.StandardButton.Yes)
         msg.setWindowFlags(msg.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
         
-        result = msg.exec()
+        self._open_dialog(msg, lambda box: self._on_speed_calibration_answer(
+            box.standardButton(box.clickedButton()), current_enabled, current_val))
+    
+    def _on_speed_calibration_answer(self, answer, current_enabled, current_val):
+        """速度校正確認對話框的回應"""
+        if answer != QMessageBox.StandardButton.Yes:
+            return
         
-        if result == QMessageBox.StandardButton.Yes:
-            try:
-                import datagrab
-                new_state = not current_enabled
-                datagrab.set_speed_calibration_enabled(new_state)
-                
-                # 顯示結果
-                status_msg = QMessageBox()
-                if new_state:
-                    # 開啟校正模式
-                    status_msg.setWindowTitle("🔧 校正模式已啟用")
-                    status_msg.setText(f"✅ 速度校正模式已啟用\n\n目前校正係數：{current_val:.4f}\n\n請在 GPS 訊號良好的情況下行駛，\n系統會自動調整校正值。\n\n💡 完成後長按此按鈕可儲存")
-                    status_msg.setIcon(QMessageBox.Icon.Information)
-                else:
-                    # 關閉並儲存
-                    datagrab.persist_speed_correction()
-                    final_val = datagrab.get_speed_correction()
-                    status_msg.setWindowTitle("💾 校正已儲存")
-                    status_msg.setText(f"✅ 速度校正係數已儲存！\n\n最終校正係數：{final_val:.4f}\n\n校正模式已關閉")
-                    status_msg.setIcon(QMessageBox.Icon.Information)
-                status_msg.setWindowFlags(status_msg.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-                status_msg.exec()
-                
-            except Exception as e:
-                print(f"[速度校正] 切換失敗: {e}")
+        try:
+            import datagrab
+            new_state = not current_enabled
+            datagrab.set_speed_calibration_enabled(new_state)
+            self.speed_calibration_toggled.emit(new_state)
+            
+            # 顯示結果
+            if new_state:
+                # 開啟校正模式
+                self._show_message(
+                    'calibration',
+                    "🔧 校正模式已啟用",
+                    f"✅ 速度校正模式已啟用\n\n目前校正係數：{current_val:.4f}\n\n請在 GPS 訊號良好的情況下行駛，\n系統會自動調整校正值。\n\n💡 完成後長按此按鈕可儲存"
+                )
+            else:
+                # 關閉並儲存（寫入 SD 卡可能耗時，於背景執行緒進行；數值已在記憶體中）
+                threading.Thread(target=datagrab.persist_speed_correction, daemon=False).start()
+                final_val = datagrab.get_speed_correction()
+                self._show_message(
+                    'calibration',
+                    "💾 校正已儲存",
+                    f"✅ 速度校正係數已儲存！\n\n最終校正係數：{final_val:.4f}\n\n校正模式已關閉"
+                )
+            
+        except Exception as e:
+            print(f"[速度校正] 切換失敗: {e}")
+    
+    def _message_box(self, kind, icon):
+        """取得（首次建立）指定種類的共用非模態訊息框"""
+        box = self._message_boxes.get(kind)
+        if box is None:
+            box = QMessageBox(self.window())
+            box.setWindowModality(Qt.WindowModality.NonModal)
+            box.setIcon(icon)
+            box.setWindowFlags(box.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
+            self._message_boxes[kind] = box
+        return box
+    
+    def _show_message(self, kind, title, text, icon=QMessageBox.Icon.Information, informative_text=None):
+        """顯示非模態訊息框（不進入巢狀事件迴圈，儀表數據持續更新）
+        
+        同一種訊息（kind：'calibration'、'ntp'、'update'、'power'）共用一個 QMessageBox，
+        只更新圖示、標題與內容後重新顯示；不同功能的訊息互不覆蓋。
+        """
+        box = self._message_box(kind, icon)
+        box.setIcon(icon)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setInformativeText(informative_text or "")
+        box.show()
+        box.raise_()
+        return box
+    
+    def _show_progress(self, title, text):
+        """顯示無按鈕的進行中提示（共用同一個訊息框）"""
+        box = self._message_box('progress', QMessageBox.Icon.Information)
+        box.setStandardButtons(QMessageBox.StandardButton.NoButton)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setInformativeText("")
+        box.show()
+        box.raise_()
+        return box
+    
+    def _open_dialog(self, dialog, on_finished):
+        """以 open() 開啟對話框，關閉時呼叫 on_finished(dialog)，不阻塞事件迴圈"""
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, True)
+        dialog.finished.connect(lambda _result: on_finished(dialog))
+        dialog.open()
     
     def adjust_color(self, hex_color, factor):
         """調整顏色亮度"""
-        hex_color = hex_color.lstrip('#')
-        r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        r = min(255, int(r * factor))
-        g = min(255, int(g * factor))
-        b = min(255, int(b * factor))
-        return f'#{r:02x}{g:02x}{b:02x}'
+        return _adjust_color(hex_color, factor)
     
     def _get_button_by_title(self, title):
-        """取得指定標題的 QPushButton 物件"""
-        if title not in self.button_widgets:
-            return None
-        container = self.button_widgets[title]
-        for child in container.findChildren(QPushButton):
-            return child
-        return None
+        """取得指定標題的 QPushButton 物件（首次查找後快取）"""
+        btn = self._btn_cache.get(title)
+        if btn is None and title in self.button_widgets:
+            btn = self.button_widgets[title].findChild(QPushButton)
+            if btn is not None:
+                self._btn_cache[title] = btn
+        return btn
 
     def _apply_speed_sync_style(self, btn: QPushButton, mode: str):
         """套用速度同步按鈕的樣式與文字"""
-        label_map = {
-            "calibrated": "OBD\n(校正)",
-            "fixed": "OBD\n(同步)",
-            "gps": "OBD\n(GPS)",
-        }
-        color_map = {
-            "calibrated": "#4CAF50",
-            "fixed": "#FF9800",
-            "gps": "#2196F3",
-        }
-        text = label_map.get(mode, mode)
-        color = color_map.get(mode, "#555555")
-        btn.setText(text)
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
-                border: none;
-                border-radius: 20px;
-                font-size: 28px;
-                color: white;
-            }}
-            QPushButton:hover {{
-                background-color: {self.adjust_color(color, 1.15)};
-            }}
-            QPushButton:pressed {{
-                background-color: {self.adjust_color(color, 0.85)};
-            }}
-        """)
+        btn.setText(self._SPEED_SYNC_LABELS.get(mode, mode))
+        btn.setStyleSheet(self._SPEED_SYNC_QSS.get(mode, self._SPEED_SYNC_FALLBACK_QSS))
 
     def set_speed_sync_state(self, mode: str):
         """更新速度同步按鈕狀態（UI）"""
@@ -761,159 +1212,70 @@ class ControlPanel(QWidget):
                 self.set_speed_sync_state(getattr(self, "speed_sync_mode", "calibrated"))
     
     def do_time_sync(self):
-        """執行 NTP 時間校正"""
-        from PyQt6.QtWidgets import QMessageBox
-        import subprocess
+        """執行 NTP 時間校正（實際同步在背景執行緒進行）"""
+        if self._time_sync_busy:
+            return
         
         # 檢查網路狀態
         main_window = self.parent()
         if main_window and hasattr(main_window, 'is_offline') and main_window.is_offline:
-            msg = QMessageBox()
-            msg.setWindowTitle("無法校正時間")
-            msg.setText("網路未連線，無法執行 NTP 時間校正。\n請先連接網路後再試。")
-            msg.setIcon(QMessageBox.Icon.Warning)
-            msg.setWindowFlags(msg.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-            msg.exec()
+            self._show_message('ntp', "無法校正時間", "網路未連線，無法執行 NTP 時間校正。\n請先連接網路後再試。",
+                               QMessageBox.Icon.Warning)
             return
         
         # 更新按鈕狀態為同步中
+        self._time_sync_busy = True
         self._update_time_button_syncing(True)
         
-        try:
-            result_text = ""
-            success = False
-            
-            # 嘗試使用 timedatectl (systemd-timesyncd)
-            if os.path.exists('/usr/bin/timedatectl'):
-                print("[時間校正] 使用 timedatectl...")
-                
-                # 啟用 NTP
-                subprocess.run(['sudo', 'timedatectl', 'set-ntp', 'true'], 
-                              capture_output=True, timeout=5)
-                
-                # 重啟 timesyncd 強制同步
-                subprocess.run(['sudo', 'systemctl', 'restart', 'systemd-timesyncd'],
-                              capture_output=True, timeout=10)
-                
-                # 等待同步
-                import time
-                time.sleep(2)
-                
-                # 檢查同步狀態
-                result = subprocess.run(['timedatectl', 'show', '--property=NTPSynchronized'],
-                                       capture_output=True, text=True, timeout=5)
-                
-                if 'NTPSynchronized=yes' in result.stdout:
-                    success = True
-                    result_text = "NTP 同步成功"
-                else:
-                    # 即使沒有顯示同步成功，也可能已經更新
-                    success = True
-                    result_text = "已嘗試 NTP 同步"
-                    
-            # 備用：嘗試使用 ntpdate
-            elif os.path.exists('/usr/sbin/ntpdate'):
-                print("[時間校正] 使用 ntpdate...")
-                result = subprocess.run(
-                    ['sudo', 'ntpdate', '-u', 'pool.ntp.org'],
-                    capture_output=True, text=True, timeout=15
-                )
-                if result.returncode == 0:
-                    success = True
-                    result_text = "NTP 同步成功"
-                else:
-                    # 嘗試備用伺服器
-                    result = subprocess.run(
-                        ['sudo', 'ntpdate', '-u', 'time.google.com'],
-                        capture_output=True, text=True, timeout=15
-                    )
-                    success = result.returncode == 0
-                    result_text = "NTP 同步成功" if success else "同步失敗"
-            else:
-                result_text = "未找到 NTP 工具"
-                success = False
-            
-            # 如果有 RTC，也同步到 RTC
-            if success and os.path.exists('/dev/rtc0'):
-                print("[時間校正] 同步時間到 RTC...")
-                subprocess.run(['sudo', 'hwclock', '-w'], capture_output=True, timeout=5)
-                result_text += "\n已同步到 RTC"
-            
-            # 顯示結果
-            from datetime import datetime
-            current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            
-            msg = QMessageBox()
-            if success:
-                msg.setWindowTitle("時間校正完成")
-                msg.setText(f"{result_text}\n\n目前時間：{current_time}")
-                msg.setIcon(QMessageBox.Icon.Information)
-            else:
-                msg.setWindowTitle("時間校正失敗")
-                msg.setText(f"{result_text}\n\n請檢查網路連線後重試。")
-                msg.setIcon(QMessageBox.Icon.Warning)
-            
-            msg.setWindowFlags(msg.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-            msg.exec()
-            
-            # 更新日期時間顯示
-            self.update_status_info()
-            
-        except subprocess.TimeoutExpired:
-            msg = QMessageBox()
-            msg.setWindowTitle("時間校正逾時")
-            msg.setText("NTP 同步逾時，請檢查網路連線後重試。")
-            msg.setIcon(QMessageBox.Icon.Warning)
-            msg.setWindowFlags(msg.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-            msg.exec()
-        except Exception as e:
-            msg = QMessageBox()
-            msg.setWindowTitle("時間校正錯誤")
-            msg.setText(f"發生錯誤：{str(e)}")
-            msg.setIcon(QMessageBox.Icon.Critical)
-            msg.setWindowFlags(msg.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-            msg.exec()
-        finally:
-            # 恢復按鈕狀態
-            self._update_time_button_syncing(False)
+        self._ntp_thread = NtpSyncThread(self)
+        self._ntp_thread.sync_finished.connect(self._on_ntp_done)
+        self._ntp_thread.sync_error.connect(self._on_ntp_error)
+        self._ntp_thread.finished.connect(self._ntp_thread.deleteLater)
+        self._ntp_thread.start()
+    
+    def _on_ntp_done(self, success, result_text):
+        """NTP 同步完成（GUI 執行緒）"""
+        # 恢復按鈕狀態
+        self._time_sync_busy = False
+        self._update_time_button_syncing(False)
+        
+        # 顯示結果
+        current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        if success:
+            self._show_message('ntp', "時間校正完成", f"{result_text}\n\n目前時間：{current_time}")
+        else:
+            self._show_message('ntp', "時間校正失敗", f"{result_text}\n\n請檢查網路連線後重試。",
+                               QMessageBox.Icon.Warning)
+        
+        # 更新日期時間顯示
+        self.update_status_info()
+    
+    def _on_ntp_error(self, title, text, critical):
+        """NTP 同步逾時或發生例外（GUI 執行緒）"""
+        # 恢復按鈕狀態
+        self._time_sync_busy = False
+        self._update_time_button_syncing(False)
+        
+        self._show_message('ntp', title, text, QMessageBox.Icon.Critical if critical else QMessageBox.Icon.Warning)
     
     def _update_time_button_syncing(self, syncing):
         """更新時間按鈕的同步狀態"""
-        if "時間" not in self.button_widgets:
+        if syncing == self._time_btn_syncing:
+            return
+        btn = self._get_button_by_title("時間")
+        if btn is None:
             return
+        self._time_btn_syncing = syncing
         
-        btn_container = self.button_widgets["時間"]
-        for child in btn_container.findChildren(QPushButton):
-            if syncing:
-                child.setText("⏳")
-                child.setEnabled(False)
-                child.setStyleSheet("""
-                    QPushButton {
-                        background-color: #666;
-                        border: none;
-                        border-radius: 20px;
-                        font-size: 48px;
-                        color: white;
-                    }
-                """)
-            else:
-                child.setText("🕐")
-                child.setEnabled(True)
-                child.setStyleSheet("""
-                    QPushButton {
-                        background-color: #4285F4;
-                        border: none;
-                        border-radius: 20px;
-                        font-size: 48px;
-                        color: white;
-                    }
-                    QPushButton:hover {
-                        background-color: #5a9cf4;
-                    }
-                    QPushButton:pressed {
-                        background-color: #3367d6;
-                    }
-                """)
+        if syncing:
+            btn.setText("⏳")
+            btn.setEnabled(False)
+            btn.setStyleSheet(self._TIME_BTN_SYNCING_QSS)
+        else:
+            btn.setText("🕐")
+            btn.setEnabled(True)
+            btn.setStyleSheet(self._TIME_BTN_IDLE_QSS)
 
     def cycle_brightness(self):
         """循環切換亮度"""
@@ -925,96 +1287,46 @@ class ControlPanel(QWidget):
     
     def _update_brightness_button(self, level):
         """更新亮度按鈕的顯示"""
-        if "亮度" not in self.button_widgets:
+        if level == self._brightness_level:
             return
+        btn = self._get_button_by_title("亮度")
+        if btn is None:
+            return
+        self._brightness_level = level
         
-        btn_container = self.button_widgets["亮度"]
-        for child in btn_container.findChildren(QPushButton):
-            # 根據亮度等級更新圖示
-            if level == 0:
-                child.setText("☀")  # 全亮
-                color = "#FF9800"
-            elif level == 1:
-                child.setText("🔅")  # 75%
-                color = "#FFA726"
-            else:
-                child.setText("🔆")  # 50%
-                color = "#FFB74D"
-            
-            child.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {color};
-                    border: none;
-                    border-radius: 20px;
-                    font-size: 48px;
-                    color: white;
-                }}
-                QPushButton:hover {{
-                    background-color: {self.adjust_color(color, 1.2)};
-                }}
-                QPushButton:pressed {{
-                    background-color: {self.adjust_color(color, 0.8)};
-                }}
-            """)
+        # 根據亮度等級更新圖示
+        icon, qss = self._BRIGHTNESS_STATES[level if level in (0, 1) else 2]
+        btn.setText(icon)
+        btn.setStyleSheet(qss)
     
     def set_update_button_enabled(self, enabled):
         """設定更新按鈕的啟用狀態"""
-        if "更新" in self.button_widgets:
-            btn_container = self.button_widgets["更新"]
-            # 找到容器內的 QPushButton
-            for child in btn_container.findChildren(QPushButton):
-                child.setEnabled(enabled)
-                if enabled:
-                    child.setStyleSheet("""
-                        QPushButton {
-                            background-color: #00BCD4;
-                            border: none;
-                            border-radius: 20px;
-                            font-size: 48px;
-                            color: white;
-                        }
-                        QPushButton:hover {
-                            background-color: #26C6DA;
-                        }
-                        QPushButton:pressed {
-                            background-color: #0097A7;
-                        }
-                    """)
-                else:
-                    child.setStyleSheet("""
-                        QPushButton {
-                            background-color: #444;
-                            border: none;
-                            border-radius: 20px;
-                            font-size: 48px;
-                            color: #888;
-                        }
-                    """)
+        if enabled == self._update_btn_enabled:
+            return
+        btn = self._get_button_by_title("更新")
+        if btn is not None:
+            self._update_btn_enabled = enabled
+            btn.setEnabled(enabled)
+            btn.setStyleSheet(self._UPDATE_BTN_ENABLED_QSS if enabled else self._UPDATE_BTN_DISABLED_QSS)
     
     def do_auto_update(self):
         """執行自動更新"""
-        from PyQt6.QtWidgets import QMessageBox, QApplication, QComboBox, QDialog, QVBoxLayout, QLabel
-        import subprocess
-        import sys
+        if self._update_busy:
+            return
         
         # 檢查網路狀態
         main_window = self.parent()
         if main_window and hasattr(main_window, 'is_offline') and main_window.is_offline:
-            msg = QMessageBox()
-            msg.setWindowTitle("無法更新")
-            msg.setText("網路未連線，無法執行自動更新。\n請先連接網路後再試。")
-            msg.setIcon(QMessageBox.Icon.Warning)
-            msg.setWindowFlags(msg.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-            msg.exec()
+            self._show_message('update', "無法更新", "網路未連線，無法執行自動更新。\n請先連接網路後再試。",
+                               QMessageBox.Icon.Warning)
             return
         
+        self._update_busy = True
         try:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            
             # 取得目前分支
             current_branch_result = subprocess.run(
                 ['git', 'branch', '--show-current'],
-                cwd=script_dir,
+                cwd=_SCRIPT_DIR,
                 capture_output=True,
                 text=True
             )
@@ -1023,7 +1335,7 @@ class ControlPanel(QWidget):
             # 取得所有遠端分支
             remote_branches_result = subprocess.run(
                 ['git', 'branch', '-r'],
-                cwd=script_dir,
+                cwd=_SCRIPT_DIR,
                 capture_output=True,
                 text=True
             )
@@ -1035,16 +1347,13 @@ class ControlPanel(QWidget):
                     remote_branches.append(branch)
             
             if not remote_branches:
-                msg = QMessageBox()
-                msg.setWindowTitle("無法更新")
-                msg.setText("找不到遠端分支，請確認已設定 Git 遠端。")
-                msg.setIcon(QMessageBox.Icon.Warning)
-                msg.setWindowFlags(msg.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-                msg.exec()
+                self._update_busy = False
+                self._show_message('update', "無法更新", "找不到遠端分支，請確認已設定 Git 遠端。",
+                                   QMessageBox.Icon.Warning)
                 return
             
             # 選擇分支對話框
-            dialog = QDialog()
+            dialog = QDialog(self.window())
             dialog.setWindowTitle("選擇分支")
             dialog.setWindowFlags(dialog.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
             layout = QVBoxLayout(dialog)
@@ -1065,22 +1374,22 @@ class ControlPanel(QWidget):
             button_box.rejected.connect(dialog.reject)
             layout.addWidget(button_box)
             
-            if dialog.exec() != QDialog.DialogCode.Accepted:
-                return
-            
-            selected_branch = combo.currentText()
+            self._open_dialog(dialog, lambda d: self._on_update_branch_chosen(d, combo))
             
         except Exception as e:
-            err_box = QMessageBox()
-            err_box.setWindowTitle("取得分支失敗")
-            err_box.setText(f"無法取得分支列表：\n{str(e)}")
-            err_box.setIcon(QMessageBox.Icon.Critical)
-            err_box.setWindowFlags(err_box.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-            err_box.exec()
+            self._update_busy = False
+            self._show_message('update', "取得分支失敗", f"無法取得分支列表：\n{str(e)}", QMessageBox.Icon.Critical)
+    
+    def _on_update_branch_chosen(self, branch_dialog, combo):
+        """分支選擇完成，顯示操作選擇對話框"""
+        if branch_dialog.result() != QDialog.DialogCode.Accepted:
+            self._update_busy = False
             return
         
+        selected_branch = combo.currentText()
+        
         # 選擇操作對話框
-        dialog = QDialog()
+        dialog = QDialog(self.window())
         dialog.setWindowTitle("分支操作")
         dialog.setWindowFlags(dialog.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
         layout = QVBoxLayout(dialog)
@@ -1109,83 +1418,86 @@ class ControlPanel(QWidget):
         switch_btn.clicked.connect(do_switch)
         cancel_btn.clicked.connect(do_cancel)
         
-        result = dialog.exec()
-        
+        self._open_dialog(dialog, lambda d: self._on_update_action_chosen(d.result(), selected_branch))
+    
+    def _on_update_action_chosen(self, result, selected_branch):
+        """以 QProcess 非同步執行 git pull 或 checkout"""
         if result == 0:
+            self._update_busy = False
             return
         
         do_pull = (result == 1)
+        if do_pull:
+            print(f"[更新] 正在執行 git pull origin {selected_branch}...")
+            git_args = ['pull', 'origin', selected_branch]
+            action_desc = "更新"
+        else:
+            print(f"[分支] 正在執行 git checkout {selected_branch}...")
+            git_args = ['checkout', selected_branch]
+            action_desc = "分支切換"
+        
+        # 執行中提示（輸出即時附加在下方）
+        status_box = self._show_progress(f"{action_desc}中", f"⏳ 正在執行 git {' '.join(git_args)}...")
+        
+        proc = QProcess(self)
+        proc.setWorkingDirectory(_SCRIPT_DIR)
+        proc.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+        state = {'output': bytearray(), 'timed_out': False}
+        
+        def on_ready_read():
+            state['output'] += bytes(proc.readAllStandardOutput())
+            text = state['output'].decode('utf-8', errors='replace').strip()
+            status_box.setInformativeText(text[-300:])
+        
+        def on_timeout():
+            if proc.state() != QProcess.ProcessState.NotRunning:
+                state['timed_out'] = True
+                proc.kill()
+        
+        def on_error(error):
+            # 啟動失敗時不會收到 finished
+            if error == QProcess.ProcessError.FailedToStart:
+                self._update_busy = False
+                status_box.close()
+                proc.deleteLater()
+                self._show_message('update', "Git 未安裝", "找不到 git 指令，請確認已安裝 Git。", QMessageBox.Icon.Critical)
+        
+        def on_finished(exit_code, exit_status):
+            status_box.close()
+            proc.deleteLater()
+            output = state['output'].decode('utf-8', errors='replace')
+            self._on_git_done(exit_code, exit_status, output, state['timed_out'],
+                              do_pull, action_desc)
+        
+        proc.readyReadStandardOutput.connect(on_ready_read)
+        proc.errorOccurred.connect(on_error)
+        proc.finished.connect(on_finished)
+        QTimer.singleShot(30000, proc, on_timeout)
+        proc.start('git', git_args)
+    
+    def _on_git_done(self, exit_code, exit_status, output, timed_out, do_pull, action_desc):
+        """git 執行完成（GUI 執行緒）"""
+        self._update_busy = False
         
-        try:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            
-            if do_pull:
-                print(f"[更新] 正在執行 git pull origin {selected_branch}...")
-                result = subprocess.run(
-                    ['git', 'pull', 'origin', selected_branch],
-                    cwd=script_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                action_desc = "更新"
-            else:
-                print(f"[分支] 正在執行 git checkout {selected_branch}...")
-                result = subprocess.run(
-                    ['git', 'checkout', selected_branch],
-                    cwd=script_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                action_desc = "分支切換"
-            
-            if result.returncode != 0:
-                error_msg = result.stderr or result.stdout or "未知錯誤"
-                err_box = QMessageBox()
-                err_box.setWindowTitle(f"{action_desc}失敗")
-                err_box.setText(f"Git {'pull' if do_pull else 'checkout'} 失敗:\n{error_msg}")
-                err_box.setIcon(QMessageBox.Icon.Critical)
-                err_box.setWindowFlags(err_box.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-                err_box.exec()
-                return
-            
-            print(f"[{action_desc}] Git {'pull' if do_pull else 'checkout'} 結果: {result.stdout}")
-            
-            # 顯示成功訊息
-            success_box = QMessageBox()
-            success_box.setWindowTitle(f"{action_desc}完成")
-            success_box.setText(f"已成功{action_desc}！")
-            success_box.setInformativeText(f"{result.stdout}\n\n程式將在 2 秒後重新啟動...")
-            success_box.setIcon(QMessageBox.Icon.Information)
-            success_box.setWindowFlags(success_box.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-            success_box.exec()
-            
-            # 延遲重啟 (給使用者看到訊息)
-            from PyQt6.QtCore import QTimer
-            QTimer.singleShot(2000, lambda: self._restart_application(script_dir))
-            
-        except subprocess.TimeoutExpired:
-            err_box = QMessageBox()
-            err_box.setWindowTitle("更新逾時")
-            err_box.setText("Git pull 執行逾時，請檢查網路連線後重試。")
-            err_box.setIcon(QMessageBox.Icon.Critical)
-            err_box.setWindowFlags(err_box.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-            err_box.exec()
-        except FileNotFoundError:
-            err_box = QMessageBox()
-            err_box.setWindowTitle("Git 未安裝")
-            err_box.setText("找不到 git 指令，請確認已安裝 Git。")
-            err_box.setIcon(QMessageBox.Icon.Critical)
-            err_box.setWindowFlags(err_box.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-            err_box.exec()
-        except Exception as e:
-            err_box = QMessageBox()
-            err_box.setWindowTitle("更新錯誤")
-            err_box.setText(f"更新過程發生錯誤:\n{str(e)}")
-            err_box.setIcon(QMessageBox.Icon.Critical)
-            err_box.setWindowFlags(err_box.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-            err_box.exec()
+        if timed_out:
+            self._show_message('update', "更新逾時", "Git pull 執行逾時，請檢查網路連線後重試。", QMessageBox.Icon.Critical)
+            return
+        
+        if exit_status != QProcess.ExitStatus.NormalExit or exit_code != 0:
+            error_msg = output or "未知錯誤"
+            self._show_message('update', f"{action_desc}失敗",
+                               f"Git {'pull' if do_pull else 'checkout'} 失敗:\n{error_msg}",
+                               QMessageBox.Icon.Critical)
+            return
+        
+        print(f"[{action_desc}] Git {'pull' if do_pull else 'checkout'} 結果: {output}")
+        
+        # 顯示成功訊息
+        self._show_message('update', f"{action_desc}完成", f"已成功{action_desc}！",
+                           informative_text=f"{output}\n\n程式將在 2 秒後重新啟動...")
+        
+        # 延遲重啟 (給使用者看到訊息)
+        QTimer.singleShot(2000, self._restart_application)
     
     def on_accent_color_changed(self, color_hex: str):
         """當強調色改變時通知 ControlPanel；實際 UI 刷新由集中主題邏輯處理。"""
@@ -1198,8 +1510,6 @@ class ControlPanel(QWidget):
     
     def show_settings_menu(self):
         """顯示設定選單"""
-        from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QApplication, QMainWindow
-        
         # 取得實際顯示的視窗大小
         parent_width = 1920
         parent_height = 480
@@ -1389,50 +1699,19 @@ class ControlPanel(QWidget):
         dialog.exec()
     
     def show_power_menu(self):
-        """顯示電源選單"""
-        from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QApplication, QMainWindow
-        import platform
-        
-        is_linux = platform.system() == 'Linux'
-        
-        # 取得實際顯示的視窗大小
-        # 在開發環境中，Dashboard 被包在 ScalableWindow (QMainWindow) 裡面
-        # Dashboard 本身永遠是 1920x480，但 ScalableWindow 是縮放過的
-        parent_width = 1920
-        parent_height = 480
-        
-        # 嘗試找到 ScalableWindow（QMainWindow 類型的父視窗）
-        widget = self
-        while widget:
-            parent = widget.parent()
-            if parent is None:
-                break
-            # 檢查是否是 QMainWindow（ScalableWindow）
-            if isinstance(parent, QMainWindow):
-                parent_width = parent.width()
-                parent_height = parent.height()
-                print(f"[電源選單] 找到 ScalableWindow: {parent_width}x{parent_height}")
-                break
-            widget = parent
+        """顯示電源選單（對話框建立一次後重複使用，視窗縮放改變時才重建）"""
+        scale = self._get_power_menu_scale()
         
-        # 如果找不到 ScalableWindow，檢查是否在全螢幕模式
-        if parent_width == 1920 and parent_height == 480:
-            # 可能是全螢幕模式或直接顯示 Dashboard
-            screen = QApplication.primaryScreen()
-            if screen:
-                geometry = screen.availableGeometry()
-                # 如果螢幕小於 1920x480，使用螢幕大小
-                if geometry.width() < 1920 or geometry.height() < 480:
-                    parent_width = geometry.width()
-                    parent_height = min(geometry.height(), int(geometry.width() / 4))
-                    print(f"[電源選單] 使用螢幕大小: {parent_width}x{parent_height}")
-        
-        print(f"[電源選單] 最終視窗大小: {parent_width}x{parent_height}")
-        
-        # 計算縮放比例（以 1920x480 為基準）
-        scale = min(parent_width / 1920, parent_height / 480)
-        print(f"[電源選單] 縮放比例: {scale}")
+        if self._power_dialog is None or self._power_dialog_scale != scale:
+            if self._power_dialog is not None:
+                self._power_dialog.deleteLater()
+            self._power_dialog = self._build_power_dialog(scale)
+            self._power_dialog_scale = scale
         
+        self._power_dialog.open()
+    
+    def _build_power_dialog(self, scale):
+        """建立電源選單對話框"""
         dialog_width = int(1920 * scale)
         dialog_height = int(480 * scale)
         btn_width = int(280 * scale)
@@ -1444,7 +1723,7 @@ class ControlPanel(QWidget):
         spacing = max(10, int(40 * scale))
         
         # 創建電源選單對話框
-        dialog = QDialog()
+        dialog = QDialog(self.window())
         dialog.setWindowTitle("電源選項")
         dialog.setFixedSize(dialog_width, dialog_height)
         dialog.setWindowFlags(dialog.windowFlags() | Qt.WindowType.WindowStaysOnTopHint | Qt.WindowType.FramelessWindowHint)
@@ -1562,16 +1841,38 @@ class ControlPanel(QWidget):
         
         layout.addStretch()
         
-        dialog.exec()
+        return dialog
+    
+    def _get_power_menu_scale(self):
+        """計算電源選單縮放比例（以 1920x480 為基準），頂層視窗大小不變時沿用快取"""
+        # 在開發環境中，Dashboard 被包在 ScalableWindow (QMainWindow) 裡面
+        # Dashboard 本身永遠是 1920x480，但 ScalableWindow 是縮放過的
+        top = self.window()
+        parent_width = top.width() if top else 1920
+        parent_height = top.height() if top else 480
+        
+        cache_key = (parent_width, parent_height)
+        if self._power_menu_scale is not None and self._power_menu_scale[0] == cache_key:
+            return self._power_menu_scale[1]
+        
+        # 視窗仍是預設大小時，檢查螢幕是否更小（全螢幕模式或直接顯示 Dashboard）
+        if parent_width == 1920 and parent_height == 480:
+            screen = QApplication.primaryScreen()
+            if screen:
+                geometry = screen.availableGeometry()
+                # 如果螢幕小於 1920x480，使用螢幕大小
+                if geometry.width() < 1920 or geometry.height() < 480:
+                    parent_width = geometry.width()
+                    parent_height = min(geometry.height(), int(geometry.width() / 4))
+        
+        scale = min(parent_width / 1920, parent_height / 480)
+        print(f"[電源選單] 視窗大小: {parent_width}x{parent_height}，縮放比例: {scale}")
+        self._power_menu_scale = (cache_key, scale)
+        return scale
     
     def _power_action(self, action, dialog):
         """執行電源操作"""
-        from PyQt6.QtWidgets import QMessageBox, QApplication
-        import subprocess
-        import os
-        import platform
-        
-        is_linux = platform.system() == 'Linux'
+        is_linux = _IS_LINUX
         dialog.close()
         
         action_names = {
@@ -1581,7 +1882,7 @@ class ControlPanel(QWidget):
         }
         
         # 確認對話框
-        msg = QMessageBox()
+        msg = QMessageBox(self.window())
         msg.setWindowTitle("確認操作")
         
         if action == 'app_restart':
@@ -1601,34 +1902,16 @@ class ControlPanel(QWidget):
             
             msg.setDefaultButton(btn_restart)
             msg.setWindowFlags(msg.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-            msg.exec()
             
-            clicked = msg.clickedButton()
-            if clicked == btn_restart:
-                # 執行重啟
-                try:
-                    script_dir = os.path.dirname(os.path.abspath(__file__))
-                    print("[電源] 準備程式重啟...")
-                    self._show_power_countdown("程式重啟", 1)
-                    QTimer.singleShot(1000, lambda: self._restart_application(script_dir))
-                except Exception as e:
-                    self._show_power_error(e)
-            elif clicked == btn_close:
-                # 執行關閉程式
-                print("[電源] 關閉程式...")
-                # 建立標記檔案，防止自動重啟
-                try:
-                    with open('/tmp/.dashboard_manual_exit', 'w') as f:
-                        f.write('manual_exit')
-                except:
-                    pass
-                self._show_power_countdown("關閉程式", 1)
-                def force_exit():
-                    print("[電源] 強制退出應用程式...")
-                    import os
-                    os._exit(0)
-                QTimer.singleShot(1000, force_exit)
-            # 取消則不做任何事
+            def on_app_restart_choice(box):
+                clicked = box.clickedButton()
+                if clicked == btn_restart:
+                    self._power_app_restart()
+                elif clicked == btn_close:
+                    self._power_app_exit()
+                # 取消則不做任何事
+            
+            self._open_dialog(msg, on_app_restart_choice)
             return
             
         elif action == 'reboot':
@@ -1647,73 +1930,93 @@ class ControlPanel(QWidget):
         msg.setDefaultButton(QMessageBox.StandardButton.No)
         msg.setWindowFlags(msg.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
         
-        if msg.exec() != QMessageBox.StandardButton.Yes:
-            return
+        def on_confirm(box):
+            if box.standardButton(box.clickedButton()) == QMessageBox.StandardButton.Yes:
+                self._power_system_action(action, is_linux)
         
+        self._open_dialog(msg, on_confirm)
+    
+    def _power_app_restart(self):
+        """程式重啟"""
+        try:
+            print("[電源] 準備程式重啟...")
+            self._show_power_countdown("程式重啟", 1)
+            QTimer.singleShot(1000, self._restart_application)
+        except Exception as e:
+            self._show_power_error(e)
+    
+    def _power_app_exit(self):
+        """關閉程式（不自動重啟）"""
+        print("[電源] 關閉程式...")
+        # 建立標記檔案，防止自動重啟
+        try:
+            with open('/tmp/.dashboard_manual_exit', 'w') as f:
+                f.write('manual_exit')
+        except:
+            pass
+        self._show_power_countdown("關閉程式", 1)
+        def force_exit():
+            print("[電源] 強制退出應用程式...")
+            os._exit(0)
+        QTimer.singleShot(1000, force_exit)
+    
+    def _power_system_action(self, action, is_linux):
+        """系統重啟或關機（已確認）"""
         try:
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            
-            # app_restart 已在上面處理，這裡只處理 reboot 和 shutdown
             if action == 'reboot':
                 if is_linux:
                     print("[電源] 準備系統重啟...")
                     self._show_power_countdown("系統重啟", 3)
-                    QTimer.singleShot(3000, lambda: subprocess.run(['sudo', 'reboot']))
+                    QTimer.singleShot(3000, lambda: QProcess.startDetached('sudo', ['reboot']))
                 else:
                     # macOS 模擬
-                    info_box = QMessageBox()
-                    info_box.setWindowTitle("模擬系統重啟")
-                    info_box.setText("🔃 模擬系統重啟中...\n\n（macOS 上僅顯示此訊息）")
-                    info_box.setIcon(QMessageBox.Icon.Information)
-                    info_box.setWindowFlags(info_box.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-                    info_box.exec()
+                    self._show_message('power', "模擬系統重啟", "🔃 模擬系統重啟中...\n\n（macOS 上僅顯示此訊息）")
                     
             elif action == 'shutdown':
                 if is_linux:
                     print("[電源] 準備關機...")
                     self._show_power_countdown("關機", 3)
-                    QTimer.singleShot(3000, lambda: subprocess.run(['sudo', 'shutdown', '-h', 'now']))
+                    QTimer.singleShot(3000, lambda: QProcess.startDetached('sudo', ['shutdown', '-h', 'now']))
                 else:
                     # macOS 模擬
-                    info_box = QMessageBox()
-                    info_box.setWindowTitle("模擬關機")
-                    info_box.setText("🔌 模擬關機中...\n\n（macOS 上僅顯示此訊息）")
-                    info_box.setIcon(QMessageBox.Icon.Information)
-                    info_box.setWindowFlags(info_box.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-                    info_box.exec()
+                    self._show_message('power', "模擬關機", "🔌 模擬關機中...\n\n（macOS 上僅顯示此訊息）")
                     
         except Exception as e:
-            err_box = QMessageBox()
-            err_box.setWindowTitle("錯誤")
-            err_box.setText(f"操作失敗:\n{str(e)}")
-            err_box.setIcon(QMessageBox.Icon.Critical)
-            err_box.setWindowFlags(err_box.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-            err_box.exec()
+            self._show_power_error(e)
     
     def _show_power_error(self, error):
         """顯示電源操作錯誤"""
-        from PyQt6.QtWidgets import QMessageBox
-        err_box = QMessageBox()
-        err_box.setWindowTitle("錯誤")
-        err_box.setText(f"操作失敗:\n{str(error)}")
-        err_box.setIcon(QMessageBox.Icon.Critical)
-        err_box.setWindowFlags(err_box.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-        err_box.exec()
+        self._show_message('power', "錯誤", f"操作失敗:\n{str(error)}", QMessageBox.Icon.Critical)
     
     def _show_power_countdown(self, action_name, seconds):
-        """顯示電源操作倒數提示"""
-        from PyQt6.QtWidgets import QMessageBox, QApplication
-        
-        info_box = QMessageBox()
-        info_box.setWindowTitle(action_name)
-        info_box.setText(f"⏳ {action_name}將在 {seconds} 秒後執行...")
-        info_box.setIcon(QMessageBox.Icon.Information)
-        info_box.setWindowFlags(info_box.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
-        info_box.setStandardButtons(QMessageBox.StandardButton.NoButton)
-        info_box.show()
-        QApplication.processEvents()
+        """顯示電源操作倒數提示（重複使用同一個無邊框提示標籤）"""
+        if self._countdown_overlay is None:
+            overlay = QLabel(self.window(), Qt.WindowType.Window | Qt.WindowType.FramelessWindowHint
+                             | Qt.WindowType.WindowStaysOnTopHint)
+            overlay.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            overlay.setStyleSheet(f"""
+                QLabel {{
+                    background-color: {T('BG_CARD')};
+                    color: {T('TEXT_PRIMARY')};
+                    border-radius: 16px;
+                    font-size: 28px;
+                    font-weight: bold;
+                    padding: 30px 60px;
+                }}
+            """)
+            self._countdown_overlay = overlay
+        
+        overlay = self._countdown_overlay
+        overlay.setText(f"⏳ {action_name}將在 {seconds} 秒後執行...")
+        overlay.adjustSize()
+        top = self.window()
+        if top:
+            center = top.frameGeometry().center()
+            overlay.move(center.x() - overlay.width() // 2, center.y() - overlay.height() // 2)
+        overlay.show()
+        overlay.raise_()
     
-    def _restart_application(self, script_dir):
+    def _restart_application(self):
         """重新啟動應用程式
         
         重啟策略：
@@ -1721,62 +2024,29 @@ class ControlPanel(QWidget):
         2. 如果 DASHBOARD_ENTRY 環境變數有設定，使用它來判斷入口點
         3. 否則直接重啟當前入口腳本
         """
-        import subprocess
-        import sys
-        import os
-        
+        global _pending_restart
         python_exe = sys.executable
         env = os.environ.copy()
         
-        project_root = os.path.dirname(script_dir)
-        
-        # 檢查入口點
-        # 方法 1: 檢查 sys.argv[0] (啟動腳本)
-        entry_script = os.path.basename(sys.argv[0]) if sys.argv else ''
-        
-        # 方法 2: 檢查環境變數 (由啟動腳本設定)
-        main_entry = os.environ.get('DASHBOARD_ENTRY', '')
-        
-        print(f"[重啟] 偵測入口點: argv[0]={entry_script}, DASHBOARD_ENTRY={main_entry}")
-        
-        restart_script = None
-        restart_args = []
-        restart_cwd = project_root
-        
-        if entry_script == 'main.py':
-            restart_script = os.path.join(project_root, 'main.py')
+        # 入口點已在初始化時由 sys.argv[0] / DASHBOARD_ENTRY 判斷一次
+        entry = self._entry_key
+        print(f"[重啟] 偵測入口點: {entry}")
+        
+        restart_cwd = _PROJECT_ROOT
+        plan = _RESTART_TABLE.get(entry)
+        if plan is not None:
+            restart_script, restart_args = plan
+            print(f"[重啟] 使用 {entry} 模式: {restart_script}")
+        elif sys.argv and os.path.exists(sys.argv[0]):
+            # 無法判斷入口點，使用 sys.argv[0] 的完整路徑
+            restart_script = os.path.abspath(sys.argv[0])
             restart_args = []
-            print(f"[重啟] 使用 main.py 模式: {restart_script}")
-        elif 'datagrab' in entry_script or (main_entry == 'datagrab' and entry_script != 'main.py'):
-            for candidate in ['datagrab.py', 'vehicle/datagrab.py']:
-                candidate_path = os.path.join(project_root, candidate)
-                if os.path.exists(candidate_path):
-                    restart_script = candidate_path
-                    break
-            restart_args = ['-m', 'vehicle.datagrab']
-            print(f"[重啟] 使用 CAN Bus 模式: {restart_script}")
-        elif 'demo_mode' in entry_script or main_entry == 'demo':
-            for candidate in ['demo_mode.py', 'vehicle/demo_mode.py']:
-                candidate_path = os.path.join(project_root, candidate)
-                if os.path.exists(candidate_path):
-                    restart_script = candidate_path
-                    restart_args = ['--spotify']
-                    break
-            if not restart_script:
-                restart_args = ['-m', 'vehicle.demo_mode', '--spotify']
-            print(f"[重啟] 使用演示模式: {restart_script}")
+            restart_cwd = os.path.dirname(restart_script)
+            print(f"[重啟] 使用原始啟動腳本: {restart_script}")
         else:
-            # 無法判斷入口點，嘗試使用 sys.argv[0] 的完整路徑
-            if sys.argv and os.path.exists(sys.argv[0]):
-                restart_script = os.path.abspath(sys.argv[0])
-                restart_args = []
-                restart_cwd = os.path.dirname(restart_script)
-                print(f"[重啟] 使用原始啟動腳本: {restart_script}")
-            else:
-                # 最後手段：直接啟動 main.py
-                restart_script = os.path.join(project_root, 'main.py')
-                restart_args = []
-                print(f"[重啟] 找不到入口點，使用 main.py: {restart_script}")
+            # 最後手段：直接啟動 main.py
+            restart_script, restart_args = _RESTART_TABLE['main']
+            print(f"[重啟] 找不到入口點，使用 main.py: {restart_script}")
         
         use_module = False
         if restart_script and os.path.exists(restart_script):
@@ -1789,18 +2059,13 @@ class ControlPanel(QWidget):
                 cmd = [python_exe, restart_script] + restart_args
                 print(f"[重啟] 正在啟動 {restart_script} {restart_args}...")
             
-            subprocess.Popen(
-                cmd,
-                cwd=restart_cwd,
-                env=env,
-                start_new_session=True,
-                stdin=subprocess.DEVNULL
-            )
+            # 只記下重啟計畫：等事件迴圈結束、主程式完成清理（停止執行緒、儲存里程、
+            # flush 日誌）後才由 run_dashboard 以 execve 原地替換行程，不會新舊兩個 Qt 行程同時存在
+            _pending_restart = (cmd, restart_cwd, env)
         else:
             print(f"[重啟] 錯誤: 找不到重啟腳本 {restart_script}")
         
         # 關閉當前應用
-        from PyQt6.QtWidgets import QApplication
         QApplication.quit()
     
     def hide_panel(self):
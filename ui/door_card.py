@@ -9,6 +9,10 @@ from ui.theme import T
 class DoorStatusCard(QWidget):
     """門狀態顯示卡片"""
     
+    # 門代碼 → 狀態位元（位元為 1 表示關閉）
+    _DOOR_BITS = {"FL": 0b00001, "FR": 0b00010, "RL": 0b00100, "RR": 0b01000, "BK": 0b10000}
+    _ALL_DOORS_CLOSED = 0b11111
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(380, 380)
@@ -26,6 +30,7 @@ class DoorStatusCard(QWidget):
         self.door_rl_closed = True
         self.door_rr_closed = True
         self.door_bk_closed = True
+        self._door_bits = self._ALL_DOORS_CLOSED  # 五個門的關閉狀態，一次比較即可判斷全關
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -80,7 +85,8 @@ class DoorStatusCard(QWidget):
                       self.rr_open_layer, self.bk_open_layer]:
             layer.setGeometry(0, 0, 340, 280)
         
-        self.load_images()
+        # 門狀態圖片延遲到卡片第一次顯示時才載入（見 ensure_loaded）
+        self._images_loaded = False
         
         self.status_label = QLabel("All Doors Closed")
         self.status_label.setStyleSheet("""
@@ -99,6 +105,18 @@ class DoorStatusCard(QWidget):
         
         self.update_display()
     
+    def showEvent(self, event):
+        self.ensure_loaded()
+        super().showEvent(event)
+    
+    def ensure_loaded(self):
+        """第一次顯示（或擷取快照）前才載入門狀態圖片，縮短開機時間"""
+        if self._images_loaded:
+            return
+        self._images_loaded = True
+        self.load_images()
+        self.update_display()
+    
     def resizeEvent(self, event):
         if event is not None:
             super().resizeEvent(event)
@@ -135,8 +153,7 @@ class DoorStatusCard(QWidget):
                         font-weight: bold;
                         background: transparent;
                     """)
-                elif self.door_fl_closed and self.door_fr_closed and \
-                     self.door_rl_closed and self.door_rr_closed and self.door_bk_closed:
+                elif self.all_doors_closed():
                     self.status_label.setText("All Doors Closed")
                     self.status_label.setStyleSheet("""
                         color: #6f6;
@@ -148,24 +165,29 @@ class DoorStatusCard(QWidget):
             print(f"[DoorCard] Radar parse error: {e}")
 
     def load_images(self):
-        """載入所有門狀態圖片"""
+        """載入所有門狀態圖片（載入時即縮放到顯示尺寸，切換門狀態時直接套用）"""
         sprite_path = os.path.join(os.path.dirname(__file__), "..", "assets", "sprites", "carSprite")
         
-        base_pixmap = QPixmap(os.path.join(sprite_path, "closed_base.png"))
+        def load_scaled(name):
+            pixmap = QPixmap(os.path.join(sprite_path, name))
+            if pixmap.isNull():
+                return pixmap
+            return pixmap.scaled(340, 280,
+                                 Qt.AspectRatioMode.KeepAspectRatio,
+                                 Qt.TransformationMode.SmoothTransformation)
+        
+        base_pixmap = load_scaled("closed_base.png")
         if not base_pixmap.isNull():
-            scaled_base = base_pixmap.scaled(340, 280, 
-                                            Qt.AspectRatioMode.KeepAspectRatio,
-                                            Qt.TransformationMode.SmoothTransformation)
-            self.base_layer.setPixmap(scaled_base)
-        
-        self.fl_handle_pixmap = QPixmap(os.path.join(sprite_path, "closed_fl_handle.png"))
-        self.fr_handle_pixmap = QPixmap(os.path.join(sprite_path, "closed_fr_handle.png"))
-        
-        self.fl_open_pixmap = QPixmap(os.path.join(sprite_path, "FL.png"))
-        self.fr_open_pixmap = QPixmap(os.path.join(sprite_path, "FR.png"))
-        self.rl_open_pixmap = QPixmap(os.path.join(sprite_path, "RL.png"))
-        self.rr_open_pixmap = QPixmap(os.path.join(sprite_path, "RR.png"))
-        self.bk_open_pixmap = QPixmap(os.path.join(sprite_path, "BK.png"))
+            self.base_layer.setPixmap(base_pixmap)
+        
+        self.fl_handle_pixmap = load_scaled("closed_fl_handle.png")
+        self.fr_handle_pixmap = load_scaled("closed_fr_handle.png")
+        
+        self.fl_open_pixmap = load_scaled("FL.png")
+        self.fr_open_pixmap = load_scaled("FR.png")
+        self.rl_open_pixmap = load_scaled("RL.png")
+        self.rr_open_pixmap = load_scaled("RR.png")
+        self.bk_open_pixmap = load_scaled("BK.png")
     
     def set_door_status(self, door, is_closed):
         door = door.upper()
@@ -180,58 +202,51 @@ class DoorStatusCard(QWidget):
         elif door == "BK":
             self.door_bk_closed = is_closed
         
+        mask = self._DOOR_BITS.get(door, 0)
+        if is_closed:
+            self._door_bits |= mask
+        else:
+            self._door_bits &= ~mask
+        
         self.update_display()
     
-    def update_display(self):
+    def all_doors_closed(self):
+        """五個門是否全部關閉"""
+        return self._door_bits == self._ALL_DOORS_CLOSED
+    
+    def _update_layers(self):
         if self.door_fl_closed:
-            scaled_pixmap = self.fl_handle_pixmap.scaled(340, 280,
-                                                         Qt.AspectRatioMode.KeepAspectRatio,
-                                                         Qt.TransformationMode.SmoothTransformation)
-            self.fl_handle_layer.setPixmap(scaled_pixmap)
+            self.fl_handle_layer.setPixmap(self.fl_handle_pixmap)
             self.fl_open_layer.clear()
         else:
             self.fl_handle_layer.clear()
-            scaled_pixmap = self.fl_open_pixmap.scaled(340, 280,
-                                                       Qt.AspectRatioMode.KeepAspectRatio,
-                                                       Qt.TransformationMode.SmoothTransformation)
-            self.fl_open_layer.setPixmap(scaled_pixmap)
+            self.fl_open_layer.setPixmap(self.fl_open_pixmap)
         
         if self.door_fr_closed:
-            scaled_pixmap = self.fr_handle_pixmap.scaled(340, 280,
-                                                         Qt.AspectRatioMode.KeepAspectRatio,
-                                                         Qt.TransformationMode.SmoothTransformation)
-            self.fr_handle_layer.setPixmap(scaled_pixmap)
+            self.fr_handle_layer.setPixmap(self.fr_handle_pixmap)
             self.fr_open_layer.clear()
         else:
             self.fr_handle_layer.clear()
-            scaled_pixmap = self.fr_open_pixmap.scaled(340, 280,
-                                                       Qt.AspectRatioMode.KeepAspectRatio,
-                                                       Qt.TransformationMode.SmoothTransformation)
-            self.fr_open_layer.setPixmap(scaled_pixmap)
+            self.fr_open_layer.setPixmap(self.fr_open_pixmap)
         
         if not self.door_rl_closed:
-            scaled_pixmap = self.rl_open_pixmap.scaled(340, 280,
-                                                       Qt.AspectRatioMode.KeepAspectRatio,
-                                                       Qt.TransformationMode.SmoothTransformation)
-            self.rl_open_layer.setPixmap(scaled_pixmap)
+            self.rl_open_layer.setPixmap(self.rl_open_pixmap)
         else:
             self.rl_open_layer.clear()
         
         if not self.door_rr_closed:
-            scaled_pixmap = self.rr_open_pixmap.scaled(340, 280,
-                                                       Qt.AspectRatioMode.KeepAspectRatio,
-                                                       Qt.TransformationMode.SmoothTransformation)
-            self.rr_open_layer.setPixmap(scaled_pixmap)
+            self.rr_open_layer.setPixmap(self.rr_open_pixmap)
         else:
             self.rr_open_layer.clear()
         
         if not self.door_bk_closed:
-            scaled_pixmap = self.bk_open_pixmap.scaled(340, 280,
-                                                       Qt.AspectRatioMode.KeepAspectRatio,
-                                                       Qt.TransformationMode.SmoothTransformation)
-            self.bk_open_layer.setPixmap(scaled_pixmap)
+            self.bk_open_layer.setPixmap(self.bk_open_pixmap)
         else:
             self.bk_open_layer.clear()
+    
+    def update_display(self):
+        if self._images_loaded:
+            self._update_layers()
         
         open_doors = []
         if not self.door_fl_closed:
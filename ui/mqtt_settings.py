@@ -2,10 +2,234 @@
 import time
 import os
 import json
+import threading
+import uuid
+from html import escape
+
+try:
+    import paho.mqtt.client as mqtt
+    MQTT_AVAILABLE = True
+except ImportError:
+    MQTT_AVAILABLE = False
 from PyQt6.QtWidgets import *
 from PyQt6.QtCore import *
 from PyQt6.QtGui import *
 
+# 設定 POST 內容上限（設定 JSON 通常遠小於 1 KB）
+_MAX_POST_BODY = 64 * 1024
+
+# 保留的背景驗證結果上限：沒被輪詢取走的舊結果超過此數量就丟棄最舊的
+_MAX_VALIDATION_RESULTS = 8
+
+# 設定頁面 HTML 模板，模組載入時編碼一次，請求時只替換現有設定值
+_SETTINGS_HTML_TEMPLATE = '''
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1, maximum-scale=1">
+    <title>MQTT 設定</title>
+    <style>
+        * { box-sizing: border-box; }
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            min-height: 100vh;
+            margin: 0;
+            padding: 20px;
+        }
+        .container {
+            max-width: 500px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 20px;
+            padding: 30px;
+            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
+        }
+        h1 {
+            text-align: center;
+            color: #333;
+            margin-bottom: 30px;
+            font-size: 24px;
+        }
+        .form-group {
+            margin-bottom: 20px;
+        }
+        label {
+            display: block;
+            margin-bottom: 8px;
+            font-weight: 600;
+            color: #555;
+        }
+        input {
+            width: 100%;
+            padding: 15px;
+            border: 2px solid #ddd;
+            border-radius: 10px;
+            font-size: 16px;
+            transition: border-color 0.3s;
+        }
+        input:focus {
+            outline: none;
+            border-color: #667eea;
+        }
+        button {
+            width: 100%;
+            padding: 18px;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            border: none;
+            border-radius: 10px;
+            font-size: 18px;
+            font-weight: bold;
+            cursor: pointer;
+            margin-top: 20px;
+        }
+        button:hover {
+            opacity: 0.9;
+        }
+        button:disabled {
+            background: #ccc;
+            cursor: not-allowed;
+        }
+        .status {
+            text-align: center;
+            margin-top: 20px;
+            padding: 15px;
+            border-radius: 10px;
+            display: none;
+        }
+        .status.success {
+            background: #d4edda;
+            color: #155724;
+            display: block;
+        }
+        .status.error {
+            background: #f8d7da;
+            color: #721c24;
+            display: block;
+        }
+        .status.loading {
+            background: #e2e3e5;
+            color: #383d41;
+            display: block;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🚗 車機 MQTT 設定</h1>
+        <form id="mqttForm">
+            <div class="form-group">
+                <label for="broker">Broker 位址</label>
+                <input type="text" id="broker" name="broker" 
+                    placeholder="例如: mqtt.example.com" 
+                    value="__BROKER__" required>
+            </div>
+            <div class="form-group">
+                <label for="port">Port</label>
+                <input type="number" id="port" name="port" 
+                    placeholder="1883" 
+                    value="__PORT__" required>
+            </div>
+            <div class="form-group">
+                <label for="username">使用者名稱 (選填)</label>
+                <input type="text" id="username" name="username" 
+                    placeholder="留空表示無需驗證"
+                    value="__USERNAME__">
+            </div>
+            <div class="form-group">
+                <label for="password">密碼 (選填)</label>
+                <input type="password" id="password" name="password" 
+                    placeholder="留空表示無需驗證"
+                    value="__PASSWORD__">
+            </div>
+            <div class="form-group">
+                <label for="topic">訂閱主題</label>
+                <input type="text" id="topic" name="topic" 
+                    placeholder="例如: car/navigation/#"
+                    value="__TOPIC__" required>
+            </div>
+            <button type="submit" id="submitBtn">儲存設定</button>
+        </form>
+        <div id="status" class="status"></div>
+    </div>
+    <script>
+        document.getElementById('mqttForm').addEventListener('submit', async function(e) {
+            e.preventDefault();
+
+            const btn = document.getElementById('submitBtn');
+            const status = document.getElementById('status');
+
+            btn.disabled = true;
+            btn.textContent = '正在驗證...';
+            status.className = 'status loading';
+            status.textContent = '正在連接 MQTT Broker...';
+
+            const formData = new FormData(this);
+            const data = Object.fromEntries(formData.entries());
+
+            try {
+                const response = await fetch('/save', {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify(data)
+                });
+
+                let result = await response.json();
+
+                // 伺服器先回應 202，再輪詢驗證結果
+                while (result.status === 'pending') {
+                    await new Promise(r => setTimeout(r, 500));
+                    const poll = await fetch('/status?id=' + encodeURIComponent(result.id));
+                    result = await poll.json();
+                }
+
+                if (result.success) {
+                    status.className = 'status success';
+                    status.textContent = '✅ ' + result.message;
+                    btn.textContent = '設定完成！';
+
+                    setTimeout(() => {
+                        status.textContent += '\\n此頁面將自動關閉...';
+                    }, 2000);
+                } else {
+                    status.className = 'status error';
+                    status.textContent = '❌ ' + result.message;
+                    btn.disabled = false;
+                    btn.textContent = '重新嘗試';
+                }
+            } catch (error) {
+                status.className = 'status error';
+                status.textContent = '❌ 連線錯誤：' + error.message;
+                btn.disabled = false;
+                btn.textContent = '重新嘗試';
+            }
+        });
+    </script>
+</body>
+</html>
+'''.encode('utf-8')
+
+# 模板佔位符 -> (設定鍵, 預設值)
+_SETTINGS_HTML_FIELDS = (
+    (b'__BROKER__', 'broker', ''),
+    (b'__PORT__', 'port', '1883'),
+    (b'__USERNAME__', 'username', ''),
+    (b'__PASSWORD__', 'password', ''),
+    (b'__TOPIC__', 'topic', 'car/#'),
+)
+
+
+def _render_settings_html(existing_config: dict) -> bytes:
+    """將現有設定填入 HTML 模板"""
+    page = _SETTINGS_HTML_TEMPLATE
+    for placeholder, key, default in _SETTINGS_HTML_FIELDS:
+        value = escape(str(existing_config.get(key, default)), quote=True)
+        page = page.replace(placeholder, value.encode('utf-8'))
+    return page
+
+
 class MQTTSettingsSignals(QObject):
     """MQTT 設定對話框的訊號"""
     settings_saved = pyqtSignal(bool)
@@ -27,6 +251,10 @@ class MQTTSettingsDialog(QWidget):
         self._settings_received = False
         self._parent_ref = parent  # 保存父視窗參考用於計算縮放
         
+        # 背景驗證結果: req_id -> None (驗證中) 或 (success, message)
+        self._validation_results = {}
+        self._validation_lock = threading.Lock()
+        
         # 預先取得本機 IP
         self.local_ip = self._get_local_ip()
         self.server_port = 8889  # 使用不同於 Spotify 的 port
@@ -303,215 +531,55 @@ class MQTTSettingsDialog(QWidget):
     
     def start_server(self):
         """啟動 HTTP 伺服器"""
-        import threading
         self.server_thread = threading.Thread(target=self._run_server, daemon=True)
         self.server_thread.start()
     
     def _run_server(self):
         """運行 HTTP 伺服器"""
-        from http.server import HTTPServer, BaseHTTPRequestHandler
+        from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+        import socket
         import urllib.parse
         
         dialog = self  # 閉包引用
         
+        class MQTTSettingsServer(ThreadingHTTPServer):
+            """每個請求獨立執行緒，避免單一請求卡住整個伺服器"""
+            daemon_threads = True
+            allow_reuse_address = True
+        
         class MQTTSettingsHandler(BaseHTTPRequestHandler):
+            def setup(self):
+                super().setup()
+                # 關閉 Nagle，讓頁面立即送出不等待合併
+                try:
+                    self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                except OSError:
+                    pass
+            
             def do_GET(self):
-                """處理 GET 請求 - 返回設定表單"""
+                """處理 GET 請求 - 返回設定表單或驗證結果"""
+                parsed = urllib.parse.urlparse(self.path)
+                if parsed.path == '/status':
+                    self._send_status(parsed.query)
+                    return
+                
                 # 讀取現有設定
                 existing_config = dialog._load_existing_config()
                 
+                page = _render_settings_html(existing_config)
+                
                 self.send_response(200)
                 self.send_header('Content-type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(page)))
                 self.end_headers()
-                
-                html = f'''
-                <!DOCTYPE html>
-                <html>
-                <head>
-                    <meta charset="utf-8">
-                    <meta name="viewport" content="width=device-width, initial-scale=1, maximum-scale=1">
-                    <title>MQTT 設定</title>
-                    <style>
-                        * {{ box-sizing: border-box; }}
-                        body {{
-                            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
-                            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                            min-height: 100vh;
-                            margin: 0;
-                            padding: 20px;
-                        }}
-                        .container {{
-                            max-width: 500px;
-                            margin: 0 auto;
-                            background: white;
-                            border-radius: 20px;
-                            padding: 30px;
-                            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-                        }}
-                        h1 {{
-                            text-align: center;
-                            color: #333;
-                            margin-bottom: 30px;
-                            font-size: 24px;
-                        }}
-                        .form-group {{
-                            margin-bottom: 20px;
-                        }}
-                        label {{
-                            display: block;
-                            margin-bottom: 8px;
-                            font-weight: 600;
-                            color: #555;
-                        }}
-                        input {{
-                            width: 100%;
-                            padding: 15px;
-                            border: 2px solid #ddd;
-                            border-radius: 10px;
-                            font-size: 16px;
-                            transition: border-color 0.3s;
-                        }}
-                        input:focus {{
-                            outline: none;
-                            border-color: #667eea;
-                        }}
-                        button {{
-                            width: 100%;
-                            padding: 18px;
-                            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                            color: white;
-                            border: none;
-                            border-radius: 10px;
-                            font-size: 18px;
-                            font-weight: bold;
-                            cursor: pointer;
-                            margin-top: 20px;
-                        }}
-                        button:hover {{
-                            opacity: 0.9;
-                        }}
-                        button:disabled {{
-                            background: #ccc;
-                            cursor: not-allowed;
-                        }}
-                        .status {{
-                            text-align: center;
-                            margin-top: 20px;
-                            padding: 15px;
-                            border-radius: 10px;
-                            display: none;
-                        }}
-                        .status.success {{
-                            background: #d4edda;
-                            color: #155724;
-                            display: block;
-                        }}
-                        .status.error {{
-                            background: #f8d7da;
-                            color: #721c24;
-                            display: block;
-                        }}
-                        .status.loading {{
-                            background: #e2e3e5;
-                            color: #383d41;
-                            display: block;
-                        }}
-                    </style>
-                </head>
-                <body>
-                    <div class="container">
-                        <h1>🚗 車機 MQTT 設定</h1>
-                        <form id="mqttForm">
-                            <div class="form-group">
-                                <label for="broker">Broker 位址</label>
-                                <input type="text" id="broker" name="broker" 
-                                    placeholder="例如: mqtt.example.com" 
-                                    value="{existing_config.get('broker', '')}" required>
-                            </div>
-                            <div class="form-group">
-                                <label for="port">Port</label>
-                                <input type="number" id="port" name="port" 
-                                    placeholder="1883" 
-                                    value="{existing_config.get('port', '1883')}" required>
-                            </div>
-                            <div class="form-group">
-                                <label for="username">使用者名稱 (選填)</label>
-                                <input type="text" id="username" name="username" 
-                                    placeholder="留空表示無需驗證"
-                                    value="{existing_config.get('username', '')}">
-                            </div>
-                            <div class="form-group">
-                                <label for="password">密碼 (選填)</label>
-                                <input type="password" id="password" name="password" 
-                                    placeholder="留空表示無需驗證"
-                                    value="{existing_config.get('password', '')}">
-                            </div>
-                            <div class="form-group">
-                                <label for="topic">訂閱主題</label>
-                                <input type="text" id="topic" name="topic" 
-                                    placeholder="例如: car/navigation/#"
-                                    value="{existing_config.get('topic', 'car/#')}" required>
-                            </div>
-                            <button type="submit" id="submitBtn">儲存設定</button>
-                        </form>
-                        <div id="status" class="status"></div>
-                    </div>
-                    <script>
-                        document.getElementById('mqttForm').addEventListener('submit', async function(e) {{
-                            e.preventDefault();
-                            
-                            const btn = document.getElementById('submitBtn');
-                            const status = document.getElementById('status');
-                            
-                            btn.disabled = true;
-                            btn.textContent = '正在驗證...';
-                            status.className = 'status loading';
-                            status.textContent = '正在連接 MQTT Broker...';
-                            
-                            const formData = new FormData(this);
-                            const data = Object.fromEntries(formData.entries());
-                            
-                            try {{
-                                const response = await fetch('/save', {{
-                                    method: 'POST',
-                                    headers: {{ 'Content-Type': 'application/json' }},
-                                    body: JSON.stringify(data)
-                                }});
-                                
-                                const result = await response.json();
-                                
-                                if (result.success) {{
-                                    status.className = 'status success';
-                                    status.textContent = '✅ ' + result.message;
-                                    btn.textContent = '設定完成！';
-                                    
-                                    setTimeout(() => {{
-                                        status.textContent += '\\n此頁面將自動關閉...';
-                                    }}, 2000);
-                                }} else {{
-                                    status.className = 'status error';
-                                    status.textContent = '❌ ' + result.message;
-                                    btn.disabled = false;
-                                    btn.textContent = '重新嘗試';
-                                }}
-                            }} catch (error) {{
-                                status.className = 'status error';
-                                status.textContent = '❌ 連線錯誤：' + error.message;
-                                btn.disabled = false;
-                                btn.textContent = '重新嘗試';
-                            }}
-                        }});
-                    </script>
-                </body>
-                </html>
-                '''
-                self.wfile.write(html.encode())
+                self.wfile.write(page)
             
             def do_POST(self):
-                """處理 POST 請求 - 儲存設定並驗證連線"""
+                """處理 POST 請求 - 接收設定後立即回應，於背景驗證連線"""
                 if self.path == '/save':
-                    content_length = int(self.headers['Content-Length'])
-                    post_data = self.rfile.read(content_length)
+                    post_data = self._read_body()
+                    if post_data is None:
+                        return
                     
                     try:
                         data = json.loads(post_data.decode())
@@ -522,49 +590,90 @@ class MQTTSettingsDialog(QWidget):
                         except RuntimeError:
                             pass
                         
-                        # 驗證連線
-                        success, message = dialog._test_mqtt_connection(data)
-                        
-                        if success:
-                            # 儲存設定
-                            dialog._save_config(data)
-                            dialog._settings_received = True
-                            
-                            try:
-                                dialog.signals.status_update.emit("設定已儲存！5秒後關閉...")
-                                dialog.signals.settings_saved.emit(True)
-                            except RuntimeError:
-                                pass
+                        # 驗證連線最多需要 5 秒，交給背景執行緒，瀏覽器改以 /status 輪詢
+                        req_id = uuid.uuid4().hex
+                        with dialog._validation_lock:
+                            results = dialog._validation_results
+                            while len(results) >= _MAX_VALIDATION_RESULTS:
+                                del results[next(iter(results))]  # dict 依插入順序，先丟最舊的
+                            results[req_id] = None
+                        threading.Thread(
+                            target=dialog._validate_and_save,
+                            args=(data, req_id),
+                            daemon=True
+                        ).start()
                         
-                        self.send_response(200)
-                        self.send_header('Content-type', 'application/json')
-                        self.end_headers()
-                        
-                        response = json.dumps({
-                            'success': success,
-                            'message': message
-                        })
-                        self.wfile.write(response.encode())
+                        self._send_json(202, {'status': 'pending', 'id': req_id})
                         
                     except Exception as e:
-                        self.send_response(500)
-                        self.send_header('Content-type', 'application/json')
-                        self.end_headers()
-                        response = json.dumps({
+                        self._send_json(500, {
                             'success': False,
                             'message': f'伺服器錯誤：{str(e)}'
                         })
-                        self.wfile.write(response.encode())
                 else:
                     self.send_response(404)
                     self.end_headers()
             
+            def _read_body(self):
+                """依 Content-Length 讀取請求內容，長度不合法時回應錯誤並回傳 None"""
+                length_raw = self.headers.get('Content-Length', '0').strip()
+                # 只接受純數字，避免 int() 接受 "+1_0" 之類的寬鬆格式
+                if not (length_raw.isascii() and length_raw.isdigit()):
+                    self.send_response(411)
+                    self.end_headers()
+                    return None
+                content_length = int(length_raw)
+                if content_length > _MAX_POST_BODY:
+                    self.send_response(413)
+                    self.end_headers()
+                    return None
+                
+                buf = bytearray(content_length)
+                view = memoryview(buf)
+                received = 0
+                while received < content_length:
+                    got = self.rfile.readinto(view[received:])
+                    if not got:
+                        break
+                    received += got
+                return bytes(buf[:received])
+            
+            def _send_status(self, query):
+                """回傳背景驗證的結果"""
+                req_id = urllib.parse.parse_qs(query).get('id', [''])[0]
+                with dialog._validation_lock:
+                    if req_id not in dialog._validation_results:
+                        result = False
+                    else:
+                        result = dialog._validation_results[req_id]
+                        if result is not None:
+                            del dialog._validation_results[req_id]
+                
+                if result is False:
+                    self._send_json(404, {'success': False, 'message': '找不到驗證請求'})
+                elif result is None:
+                    self._send_json(200, {'status': 'pending', 'id': req_id})
+                else:
+                    success, message = result
+                    self._send_json(200, {
+                        'status': 'done',
+                        'success': success,
+                        'message': message
+                    })
+            
+            def _send_json(self, code, payload):
+                """送出 JSON 回應"""
+                self.send_response(code)
+                self.send_header('Content-type', 'application/json')
+                self.end_headers()
+                self.wfile.write(json.dumps(payload).encode())
+            
             def log_message(self, format, *args):
                 """關閉日誌輸出"""
                 pass
         
         try:
-            self.server = HTTPServer(('0.0.0.0', self.server_port), MQTTSettingsHandler)
+            self.server = MQTTSettingsServer(('0.0.0.0', self.server_port), MQTTSettingsHandler)
             if not self._is_closing:
                 try:
                     self.signals.status_update.emit("伺服器已啟動，等待掃描...")
@@ -578,6 +687,29 @@ class MQTTSettingsDialog(QWidget):
                 except RuntimeError:
                     pass
     
+    def _validate_and_save(self, data: dict, req_id: str):
+        """背景驗證 MQTT 連線，成功則儲存設定，結果存入 _validation_results"""
+        try:
+            success, message = self._test_mqtt_connection(data)
+        except Exception as e:
+            success, message = False, f"伺服器錯誤：{str(e)}"
+        
+        if success:
+            # 儲存設定
+            self._save_config(data)
+            self._settings_received = True
+            
+            try:
+                self.signals.status_update.emit("設定已儲存！5秒後關閉...")
+                self.signals.settings_saved.emit(True)
+            except RuntimeError:
+                pass
+        
+        with self._validation_lock:
+            # 已被較新的請求擠掉就不再寫回，避免字典重新長大
+            if req_id in self._validation_results:
+                self._validation_results[req_id] = (success, message)
+    
     def _load_existing_config(self) -> dict:
         """讀取現有設定"""
         try:
@@ -598,8 +730,19 @@ class MQTTSettingsDialog(QWidget):
                 'password': data.get('password', ''),
                 'topic': data.get('topic', 'car/#')
             }
-            with open(self.CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            # 先序列化成 bytes，一次寫入暫存檔再原子替換，避免寫到一半斷電留下殘缺 JSON
+            data_bytes = json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+            temp_file = f"{self.CONFIG_FILE}.{uuid.uuid4().hex}.tmp"
+            try:
+                with open(temp_file, 'wb') as f:
+                    f.write(data_bytes)
+                    f.flush()
+                    os.fsync(f.fileno())  # 確保寫入磁碟
+                os.replace(temp_file, self.CONFIG_FILE)
+            except Exception:
+                if os.path.exists(temp_file):
+                    os.remove(temp_file)
+                raise
             print(f"[MQTT] 設定已儲存到 {self.CONFIG_FILE}")
         except Exception as e:
             print(f"[MQTT] 儲存設定失敗: {e}")
@@ -609,9 +752,7 @@ class MQTTSettingsDialog(QWidget):
         測試 MQTT 連線
         Returns: (success: bool, message: str)
         """
-        try:
-            import paho.mqtt.client as mqtt
-        except ImportError:
+        if not MQTT_AVAILABLE:
             return False, "paho-mqtt 未安裝，請執行: pip install paho-mqtt"
         
         broker = data.get('broker', '').strip()
@@ -700,7 +841,6 @@ class MQTTSettingsDialog(QWidget):
         
         # 在背景執行緒中關閉伺服器
         if self.server:
-            import threading
             def shutdown_server():
                 try:
                     self.server.shutdown()
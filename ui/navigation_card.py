@@ -30,7 +30,6 @@ class NavigationCard(QWidget):
         self.duration = ""
         self.eta = ""
         self.icon_base64 = ""
-        self._icon_pixmap_cache = {}
         self._last_direction_style_mode = None
         
         # 主佈局使用 StackedWidget 切換無導航/有導航模式
@@ -317,9 +316,10 @@ class NavigationCard(QWidget):
             # 移除可能的換行符和空白
             base64_data = base64_data.replace('\n', '').replace(' ', '')
 
-            cache_key = hash(base64_data)
-            cached_pixmap = self._icon_pixmap_cache.get(cache_key)
-            if cached_pixmap is not None:
+            # 轉彎圖示放進全域 QPixmapCache（LRU、依位元組上限淘汰）
+            cache_key = f"nav_icon:{hash(base64_data)}"
+            cached_pixmap = QPixmapCache.find(cache_key)
+            if cached_pixmap is not None and not cached_pixmap.isNull():
                 self.direction_icon.setPixmap(cached_pixmap)
                 self.direction_icon.setStyleSheet("background: transparent; border: none;")
                 self.default_icon.hide()
@@ -370,10 +370,7 @@ class NavigationCard(QWidget):
                 painter.end()
                 
                 self.direction_icon.setPixmap(rounded_pixmap)
-                self._icon_pixmap_cache[cache_key] = rounded_pixmap
-                if len(self._icon_pixmap_cache) > 16:
-                    oldest_key = next(iter(self._icon_pixmap_cache))
-                    self._icon_pixmap_cache.pop(oldest_key, None)
+                QPixmapCache.insert(cache_key, rounded_pixmap)
                 self.direction_icon.setStyleSheet("background: transparent; border: none;")
                 self.default_icon.hide()
             else:
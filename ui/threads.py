@@ -1,10 +1,14 @@
 # Auto-extracted from main.py
 import time
 import glob
+import math
 import os
 import platform
+import selectors
 import serial
+import socket
 import logging
+import queue
 import threading
 from PyQt6.QtWidgets import *
 from PyQt6.QtCore import *
@@ -19,6 +23,46 @@ _serial_lock = threading.Lock()
 # 設為 False 可停用雷達掃描功能（連接埠偵測、資料讀取等全部跳過）
 RADAR_ENABLED = False
 
+# GPS 讀取緩衝區上限：超過仍沒有換行視為雜訊直接丟棄
+_RX_BUF_LIMIT = 4096
+
+# 探測後確認不是 GPS 的 port，在此秒數內略過（裝置清單變動時會提前失效）
+_PORT_PROBE_NEGATIVE_TTL = 30.0
+
+# 內部 GPS 座標位移門檻：約 1.5 公尺（1 度緯度 ≈ 111,320 公尺），以度² 表示
+_POSITION_EPSILON_DEG2 = (1.5 / 111320.0) ** 2
+
+# 內部 GPS 速度/座標發射合併間隔（毫秒），UI 最多 4Hz 更新
+_GPS_EMIT_INTERVAL_MS = 250
+
+# 掃描/重連類重複訊息的最短記錄間隔（秒）
+_LOG_THROTTLE_SEC = 5.0
+
+# 網路檢測：探測目標（DNS 53 埠）、檢測間隔與服務健康檢查間隔（秒）
+_NETWORK_PROBE_HOSTS = (("8.8.8.8", 53), ("1.1.1.1", 53))
+_NETWORK_CHECK_INTERVAL = 5.0
+_NETWORK_TCP_RECHECK_INTERVAL = 30.0  # 連線中時 TCP 握手確認的間隔，其餘週期只檢查路由
+_NETWORK_FIRST_CHECK_DELAY = 2.0
+_SERVICE_HEALTH_INTERVAL = 60.0
+
+
+def _nmea_checksum_ok(line):
+    """驗證 NMEA 語句 `*XX` checksum（$ 與 * 之間所有位元組 XOR）
+
+    直接在原始 bytes 上計算，缺少或不符的 checksum 視為損毀語句。
+    """
+    star = line.rfind(b'*')
+    if star < 1:
+        return False
+    try:
+        expected = int(line[star + 1:star + 3], 16)
+    except ValueError:
+        return False
+    cs = 0
+    for b in line[1:star]:
+        cs ^= b
+    return cs == expected
+
 class GPSMonitorThread(QThread):
     """
     GPS 狀態監控執行緒
@@ -33,9 +77,21 @@ class GPSMonitorThread(QThread):
     gps_position_changed = pyqtSignal(float, float)  # lat, lon
     gps_source_changed = pyqtSignal(bool, bool)  # (is_internal, is_fresh)
     gps_device_status_changed = pyqtSignal(bool)  # True=device found, False=no device
+    _flush_requested = pyqtSignal()  # 內部用：通知主執行緒排程合併發射
     
     def __init__(self):
         super().__init__()
+        # 內部 GPS 速度/座標合併發射：讀取執行緒只寫入 pending，
+        # 由主執行緒的 single-shot timer 每 250ms 最多發射一次（閒置時不喚醒）
+        self._pending_lock = threading.Lock()
+        self._pending_speed = None
+        self._pending_pos = None
+        self._flush_scheduled = False
+        self._emit_timer = QTimer()
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(_GPS_EMIT_INTERVAL_MS)
+        self._emit_timer.timeout.connect(self._flush_pending)
+        self._flush_requested.connect(self._emit_timer.start)
         self.running = True
         self.baud_rates = [9600, 38400]
         self.baud_rate = self.baud_rates[0]
@@ -43,6 +99,11 @@ class GPSMonitorThread(QThread):
         self._current_port = None
         self._last_lat = None
         self._last_lon = None
+        self._last_raw_pos = None  # 上一筆 RMC 原始座標欄位（lat, N/S, lon, E/W）
+        self._cos_lat2 = 1.0  # cos²(上次發射的緯度)，位移門檻計算用
+        self._last_rmc_time = 0.0
+        self._last_speed_emit_time = 0.0
+        self._last_speed_parse_time = 0.0
         self._using_external_gps = False
         self._external_gps_timestamp = None
         self._has_device = None  # None=unknown, True=device found, False=no device
@@ -54,6 +115,15 @@ class GPSMonitorThread(QThread):
         self._soft_reset_requested = False  # D→N 等事件觸發的軟重啟請求
         self._last_ubx_reset_time = 0  # 上次 reset 時間（防頻繁重啟）
         self._usb_reset_count = 0  # 連續軟 reset 無效次數（累積後觸發 USB unbind/bind）
+        self._log_times = {}  # 節流日誌：訊息類別 -> 上次記錄的 monotonic 時間
+        self._port_probe_cache = {}  # port -> 在此 monotonic 時間前不再探測（非 GPS）
+        self._last_scanned_ports = []
+        # NMEA 語句分派表：以 talker+type（line[1:6]）查表，其餘語句直接略過
+        # （Fix 狀態只看 RMC，GGA 不需要解析）
+        self._nmea_parsers = {
+            b'GNRMC': self._parse_rmc,
+            b'GPRMC': self._parse_rmc,
+        }
         
     def request_soft_reset(self):
         """外部介面：請求 GPS 軟重啟（如 D→N 換檔時觸發）
@@ -92,61 +162,56 @@ class GPSMonitorThread(QThread):
                 
                 # 發現至少一個 port，標記有裝置
                 self._update_device_status(found=True)
-                logger.info(f"[GPS] Found ports: {ports}")
+                
+                # 裝置清單變動（插拔 USB）時清空探測快取，新裝置立即重新探測
+                if ports != self._last_scanned_ports:
+                    self._last_scanned_ports = ports
+                    self._port_probe_cache.clear()
+                # 略過近期已確認不是 GPS 的 port（數據機、印表機等），避免每輪重複開啟
+                now_mono = time.monotonic()
+                ports = [p for p in ports if self._port_probe_cache.get(p, 0) < now_mono]
+                if not ports:
+                    time.sleep(2)
+                    continue
+                self._log_throttled(logging.INFO, 'found_ports', f"[GPS] Found ports: {ports}")
                 
                 # 智能策略：自動識別 GPS vs Radar（使用鎖防止競爭）
                 # 但雷達關閉時，無需偵測雷達
                 if not RADAR_ENABLED:
                     # 雷達關閉：直接用 9600 baud 嘗試所有 port，不再嘗試 38400
                     target_bauds = [9600]
-                    logger.info("[GPS] RADAR_ENABLED=False，直接用 9600 baud 掃描")
+                    self._log_throttled(logging.INFO, 'scan_9600', "[GPS] RADAR_ENABLED=False，直接用 9600 baud 掃描")
                 else:
                     target_bauds = self.baud_rates
                 
-                found = False
                 for port in ports:
                     for baud in target_bauds:
                         try:
                             with _serial_lock:
-                                ser = serial.Serial(port, baud, timeout=0.3)
-                                data_lines = []
-                                for i in range(3):
-                                    line = ser.readline()
-                                    if line:
-                                        s = line.decode('ascii', errors='ignore').strip()
-                                    data_lines.append(s)
-                                    # 識別 Radar，立即跳過（僅在雷達開啟時）
-                                    if RADAR_ENABLED and 'LR:' in s and 'RF:' in s:
-                                        ser.close()
-                                        found = True
-                                        break
-                                    # 識別 GPS
-                                    if ('$GPGGA' in s or '$GNGGA' in s or 
-                                        '$GPRMC' in s or '$GNRMC' in s) and ',' in s:
-                                        self._current_port = port
-                                        self.baud_rate = baud
-                                        self._consecutive_failures = 0
-                                        ser.close()
-                                        logger.info(f"[GPS] *** FOUND GPS on {port} @ {baud} ***")
-                                        break
-                            ser.close()
-                            
-                            # 如果檢測到乱码数据（不是GPS也不是Radar），可能port被佔用，快速跳過
-                            if not found and not self._current_port and data_lines:
-                                # 如果没有任何有效identifiers，可能是乱码
-                                if not any(('$G' in d or 'LR:' in d) for d in data_lines):
-                                    logger.info(f"[GPS] {port} @ {baud}: garbled data, skipping rest of port")
-                                    break  # 跳過這個port的其餘baud
-                                
-                        except Exception as e:
-                            pass
-                        if self._current_port:
+                                kind = self._probe_port(port, baud)
+                        except Exception:
+                            kind = None
+                        if kind == 'gps':
+                            self._current_port = port
+                            self.baud_rate = baud
+                            self._consecutive_failures = 0
+                            logger.info(f"[GPS] *** FOUND GPS on {port} @ {baud} ***")
                             break
+                        if kind == 'radar':
+                            # 識別 Radar，立即跳過（僅在雷達開啟時）
+                            break
+                        if kind == 'garbled':
+                            # 檢測到乱码数据（不是GPS也不是Radar），可能port被佔用，快速跳過
+                            self._log_throttled(logging.INFO, f'garbled:{port}',
+                                                f"[GPS] {port} @ {baud}: garbled data, skipping rest of port")
+                            break  # 跳過這個port的其餘baud
                     if self._current_port:
                         break
+                    # 此 port 所有 baud 都不是 GPS → 一段時間內不再探測
+                    self._port_probe_cache[port] = time.monotonic() + _PORT_PROBE_NEGATIVE_TTL
                 
                 if not self._current_port:
-                    logger.info("[GPS] No GPS found, will retry...")
+                    self._log_throttled(logging.INFO, 'no_gps', "[GPS] No GPS found, will retry...")
                     time.sleep(2)
                     time.sleep(2)
             else:
@@ -162,14 +227,37 @@ class GPSMonitorThread(QThread):
                 # 連續失敗超過 10 次視為真正的斷線
                 if not success or self._consecutive_failures > 10:
                     if self._consecutive_failures > 10:
-                        logger.warning(f"[GPS] Too many consecutive failures, treating as disconnection")
+                        self._log_throttled(logging.WARNING, 'conn_lost',
+                                            "[GPS] Too many consecutive failures, treating as disconnection")
                     else:
-                        logger.warning(f"[GPS] Connection lost on {self._current_port}")
+                        self._log_throttled(logging.WARNING, 'conn_lost',
+                                            f"[GPS] Connection lost on {self._current_port}")
                     self._current_port = None
                     self._update_status(False)
                     self._consecutive_failures = 0
                     time.sleep(1)
                     
+    def _probe_port(self, port, baud):
+        """以單次讀取（最多 256 bytes / 1 秒）判斷 port 上的裝置類型
+        
+        GPS 每秒輸出一批 NMEA，256 bytes 內必定含有 `$G?xxx,` 語句；
+        不再逐行 readline，避免最壞情況多次 timeout 疊加。
+        
+        Returns:
+            'gps' / 'radar' / 'garbled'（有資料但無法辨識）/ None（沒有資料）
+        """
+        with serial.Serial(port, baud, timeout=1.0) as ser:
+            chunk = ser.read(256)
+        if not chunk:
+            return None
+        if RADAR_ENABLED and b'LR:' in chunk and b'RF:' in chunk:
+            return 'radar'
+        if b'$G' in chunk and b',' in chunk:
+            return 'gps'
+        if b'LR:' not in chunk:
+            return 'garbled'
+        return None
+
     def _try_connect(self, port):
         """測試連接"""
         # 優先嘗試上一個成功的 baud rate，可加速重連
@@ -177,21 +265,9 @@ class GPSMonitorThread(QThread):
 
         for baud in candidate_bauds:
             try:
-                with serial.Serial(port, baud, timeout=0.3) as ser:
-                    # 快速檢測：只讀取少量行（GGA/RMC 每秒1次，0.3秒內至少1-2行）
-                    for _ in range(3):
-                        line = ser.readline()
-                        if not line:
-                            continue
-                        try:
-                            line_str = line.decode('ascii', errors='ignore').strip()
-                            if ((line_str.startswith('$GPGGA') or line_str.startswith('$GNGGA') or
-                                 line_str.startswith('$GPRMC') or line_str.startswith('$GNRMC')) and
-                                    ',' in line_str):
-                                logger.info(f"[GPS] Found GPS on {port} @ {baud}")
-                                return baud
-                        except Exception:
-                            pass
+                if self._probe_port(port, baud) == 'gps':
+                    logger.info(f"[GPS] Found GPS on {port} @ {baud}")
+                    return baud
             except Exception as e:
                 logger.debug(f"[GPS] Error trying {port} @ {baud}: {e}")
         return None
@@ -203,44 +279,57 @@ class GPSMonitorThread(QThread):
         1. 速度心跳：每個迭代都檢查，不只依賴空行 timeout
         2. RMC 看門狗：超過 10 秒沒收到任何有效 RMC → 強制重連
         3. Serial flush：每 60 秒清空輸入緩衝區，避免殘留垃圾數據
+        
+        讀取方式：一次取走 in_waiting 內所有位元組，依換行切分後逐行處理，
+        殘留的不完整片段留到下一輪，避免同一批抵達的 GGA/RMC 只處理到一行。
         """
         ser = None
-        last_speed_emit_time = time.time()
-        last_rmc_time = time.time()
+        self._last_speed_emit_time = time.time()
+        self._last_rmc_time = time.time()
         last_flush_time = time.time()
-        last_speed_parse_time = time.time()  # 上次成功解析速度的時間
+        self._last_speed_parse_time = time.time()  # 上次成功解析速度的時間
         SPEED_TIMEOUT = 3.0      # 3 秒沒收到速度就 emit 0
         RMC_WATCHDOG = 10.0     # 10 秒沒收到有效 RMC → 視為連線異常
         FLUSH_INTERVAL = 30.0    # 每 30 秒清空 serial 輸入緩衝區
         SPEED_PARSE_WATCHDOG = 30.0  # 30 秒速度沒更新 → 強制 soft reset
+        rx_buf = bytearray()  # 尚未湊成完整一行的殘留位元組
+        sel = None
+        fd = None
+        handle_line = self._handle_nmea_line  # 熱迴圈內避免重複屬性查找
         
         try:
             with _serial_lock:
                 ser = serial.Serial(self._current_port, self.baud_rate, timeout=1.0)
+                # POSIX：直接在 fd 上 select，有資料才醒來並一次 os.read 取走
+                # （Windows 的 pyserial 不支援 fileno()，呼叫會丟出例外，沿用 ser.read）
+                if os.name == 'posix':
+                    fd = ser.fileno()
+                    sel = selectors.DefaultSelector()
+                    sel.register(fd, selectors.EVENT_READ)
                 while self.running:
                     now = time.time()
                     
                     # === 速度心跳檢查（每個迭代都檢查，不限空行） ===
-                    if now - last_speed_emit_time > SPEED_TIMEOUT:
-                        self.gps_speed_changed.emit(0.0)
-                        last_speed_emit_time = now
+                    if now - self._last_speed_emit_time > SPEED_TIMEOUT:
+                        self._queue_speed(0.0)
+                        self._last_speed_emit_time = now
                         logger.debug("[GPS] Speed heartbeat: no speed for %.1fs, emitting 0.0", SPEED_TIMEOUT)
                     
                     # === RMC 看門狗：長時間沒收到 RMC = 連線退化 ===
-                    if now - last_rmc_time > RMC_WATCHDOG:
-                        logger.warning("[GPS] RMC watchdog: no valid RMC for %.1fs, forcing reconnect", now - last_rmc_time)
+                    if now - self._last_rmc_time > RMC_WATCHDOG:
+                        logger.warning("[GPS] RMC watchdog: no valid RMC for %.1fs, forcing reconnect", now - self._last_rmc_time)
                         return False  # 觸發上層重連邏輯
                     
                     # === 速度解析看門狗：RMC 正常但速度卡住的守護 ===
-                    # 現象：RMC 有進來（last_rmc_time 不斷更新），但速度解析連續 30 秒無更新
+                    # 現象：RMC 有進來（_last_rmc_time 不斷更新），但速度解析連續 30 秒無更新
                     # 代表 CH340 FIFO 或 GPS 模組內部緩衝區邏輯卡死，必須觸發 USB unbind/bind
-                    if now - last_speed_parse_time > SPEED_PARSE_WATCHDOG:
+                    if now - self._last_speed_parse_time > SPEED_PARSE_WATCHDOG:
                         logger.warning("[GPS] Speed parse watchdog: no valid speed for %.1fs (RMC OK), "
-                                       "triggering USB unbind/bind!", now - last_speed_parse_time)
+                                       "triggering USB unbind/bind!", now - self._last_speed_parse_time)
                         if self._usb_reset_by_unbind_bind():
-                            last_rmc_time = time.time()
-                            last_speed_parse_time = time.time()
-                            last_speed_emit_time = time.time()
+                            self._last_rmc_time = time.time()
+                            self._last_speed_parse_time = time.time()
+                            self._last_speed_emit_time = time.time()
                             logger.info("[GPS] USB unbind/bind succeeded, continuing")
                         else:
                             logger.warning("[GPS] USB unbind/bind failed, forcing reconnect")
@@ -250,6 +339,7 @@ class GPSMonitorThread(QThread):
                     if now - last_flush_time > FLUSH_INTERVAL:
                         try:
                             ser.reset_input_buffer()
+                            rx_buf.clear()
                             last_flush_time = now
                             logger.debug("[GPS] Flushed serial input buffer")
                         except Exception:
@@ -264,9 +354,10 @@ class GPSMonitorThread(QThread):
                             ser.reset_output_buffer()
                         except Exception:
                             pass
+                        rx_buf.clear()
                         # 等待 GPS 模組清理內部狀態（NMEA 輸出重新同步）
                         time.sleep(0.5)
-                        last_rmc_time = time.time()  # 重置看門狗
+                        self._last_rmc_time = time.time()  # 重置看門狗
                         self._last_ubx_reset_time = time.time()
                         self._soft_reset_requested = False
                         self._usb_reset_count += 1  # 記錄一次軟 reset（無論如何都算）
@@ -279,113 +370,45 @@ class GPSMonitorThread(QThread):
                             # USB reset後需要回到 run() 重掃描，所以 return False 觸發外層重連
                             if self._usb_reset_by_unbind_bind():
                                 # USB reset 成功，回到 read_loop 繼續
-                                last_rmc_time = time.time()
-                                last_speed_emit_time = time.time()
+                                self._last_rmc_time = time.time()
+                                self._last_speed_emit_time = time.time()
                                 logger.info("[GPS] USB unbind/bind succeeded, continuing read loop")
                             else:
                                 # USB reset 失敗，強制重連
                                 logger.warning("[GPS] USB unbind/bind failed, will reconnect")
                                 return False
                     
-                    line = ser.readline()
-                    if not line:
-                        continue
-                        
-                    try:
-                        line_str = line.decode('ascii', errors='ignore').strip()
-                        
-                        # 跳過空行
-                        if not line_str:
+                    # 一次取走目前緩衝區內所有資料（沒資料時最多等 1 秒）
+                    if sel is not None:
+                        if not sel.select(timeout=1.0):
                             continue
-                        
-                        # 識別並跳過 Radar 數據
-                        if 'LR:' in line_str and 'RF:' in line_str:
-                            logger.warning(f"[GPS] Detected Radar data on {self._current_port}, need to rescan")
-                            return False
-                        
-                        # 解析 GPS Fix 狀態
-                        is_fixed = False
-                        has_status = False
-                        
-                        gga_quality = None
-                        rmc_status = None
-                        
-                        if line_str.startswith('$GNGGA') or line_str.startswith('$GPGGA'):
-                            parts = line_str.split(',')
-                            if len(parts) >= 7:
-                                try:
-                                    gga_quality = int(parts[6])
-                                except (ValueError, IndexError):
-                                    pass
-                                
-                        if line_str.startswith('$GNRMC') or line_str.startswith('$GPRMC'):
-                            parts = line_str.split(',')
-                            # RMC checksum 驗證：至少要有 status + 速度欄位
-                            if len(parts) >= 3:
-                                rmc_status = parts[2]
-                                has_status = True
-                                last_rmc_time = time.time()  # 更新 RMC 看門狗
-                                
-                                # Parse Speed (Field 7, in Knots) — 加強空值檢查
-                                speed_parsed = False
-                                if len(parts) >= 8 and parts[7].strip():
-                                    try:
-                                        speed_knots = float(parts[7])
-                                        speed_kmh = speed_knots * 1.852
-                                        self.gps_speed_changed.emit(speed_kmh)
-                                        last_speed_emit_time = time.time()
-                                        last_speed_parse_time = time.time()  # 重置速度解析看門狗
-                                        speed_parsed = True
-                                    except (ValueError, IndexError):
-                                        logger.debug(f"[GPS] Invalid speed field in RMC: '{parts[7]}'")
-                                
-                                # RMC status='A' 但速度欄位無效 → 模組可能退化，emit 0
-                                if not speed_parsed and rmc_status == 'A' and len(parts) >= 8:
-                                    logger.warning(f"[GPS] RMC active but speed field invalid: '{parts[7]}', emitting 0")
-                                    self.gps_speed_changed.emit(0.0)
-                                    last_speed_emit_time = time.time()
-                                
-                                # Parse Position (Fields 3-6: lat, N/S, lon, E/W)
-                                if len(parts) >= 7:
-                                    try:
-                                        lat_raw = parts[3]
-                                        lat_dir = parts[4]
-                                        lon_raw = parts[5]
-                                        lon_dir = parts[6]
-                                        
-                                        if lat_raw and lon_raw:
-                                            lat_deg = float(lat_raw[:2])
-                                            lat_min = float(lat_raw[2:])
-                                            lat = lat_deg + lat_min / 60.0
-                                            if lat_dir == 'S':
-                                                lat = -lat
-                                            
-                                            lon_deg = float(lon_raw[:3])
-                                            lon_min = float(lon_raw[3:])
-                                            lon = lon_deg + lon_min / 60.0
-                                            if lon_dir == 'W':
-                                                lon = -lon
-                                            
-                                            if self._last_lat != lat or self._last_lon != lon:
-                                                self._last_lat = lat
-                                                self._last_lon = lon
-                                                self.gps_position_changed.emit(lat, lon)
-                                    except (ValueError, IndexError):
-                                        pass
-                        
-                        # Fix 狀態判斷
-                        if gga_quality is not None and rmc_status is not None:
-                            is_fixed = (gga_quality >= 1 and rmc_status == 'A')
-                        elif rmc_status is not None:
-                            is_fixed = (rmc_status == 'A')
-                        elif gga_quality is not None:
-                            is_fixed = (gga_quality >= 1)
-                        
-                        if has_status:
-                            self._update_status(is_fixed)
-                            
-                    except ValueError:
-                        pass
+                        try:
+                            chunk = os.read(fd, 4096)
+                        except BlockingIOError:
+                            continue
+                        if not chunk:
+                            # 可讀卻讀不到資料 = 裝置已移除（與 pyserial 行為一致）
+                            raise serial.SerialException('device reports readiness to read but returned no data')
+                    else:
+                        chunk = ser.read(ser.in_waiting or 1)
+                        if not chunk:
+                            continue
+                    rx_buf += chunk
+                    if b'\n' not in chunk:
+                        # 長時間沒有換行 = 雜訊或錯誤 baud，避免緩衝區無限成長
+                        if len(rx_buf) > _RX_BUF_LIMIT:
+                            rx_buf.clear()
+                        continue
+                    
+                    *lines, tail = bytes(rx_buf).split(b'\n')
+                    rx_buf = bytearray(tail)
+                    
+                    for line in lines:
+                        try:
+                            if not handle_line(line):
+                                return False
+                        except ValueError:
+                            pass
         except serial.SerialException as e:
             if "timeout" not in str(e).lower():
                 logger.error(f"[GPS] Serial error: {e}")
@@ -394,6 +417,8 @@ class GPSMonitorThread(QThread):
             logger.error(f"[GPS] Error: {e}")
             return False
         finally:
+            if sel is not None:
+                sel.close()
             if ser is not None:
                 try:
                     if ser.is_open:
@@ -403,10 +428,103 @@ class GPSMonitorThread(QThread):
             
         return True
 
-    def stop(self):
-        """停止監控並釋放資源"""
+    def _handle_nmea_line(self, line):
+        """處理一行 NMEA 語句（原始 bytes）
+        
+        以 line[1:6] 查表分派，GGA/GSV/GSA/VTG 等用不到的語句不做 decode/split。
+        
+        Returns:
+            False 表示偵測到非 GPS（Radar）資料，需要重新掃描；其他情況 True
+        """
+        parser = self._nmea_parsers.get(line[1:6])
+        if parser is not None:
+            # checksum 不符 = 傳輸損毀，直接丟棄，避免錯誤 status/座標觸發信號
+            if not _nmea_checksum_ok(line):
+                logger.debug(f"[GPS] NMEA checksum mismatch, dropping: {line[:20]!r}")
+                return True
+            parser(line.decode('ascii', errors='ignore').strip())
+            return True
+        
+        # 識別並跳過 Radar 數據
+        if b'LR:' in line and b'RF:' in line:
+            logger.warning(f"[GPS] Detected Radar data on {self._current_port}, need to rescan")
+            return False
+        return True
+
+    def _parse_rmc(self, line_str):
+        """解析 RMC：狀態、速度與座標，並更新 Fix 狀態"""
+        # 只需要 Field 2~7（status、座標、速度），其餘欄位不拆
+        parts = line_str.split(',', 8)
+        # 至少要有 status 欄位（checksum 已在分派前驗證）
+        if len(parts) < 3:
+            return
+        rmc_status = parts[2]
+        now = time.time()  # 同一語句的看門狗時間戳共用一次取樣
+        self._last_rmc_time = now  # 更新 RMC 看門狗
+        
+        # Parse Speed (Field 7, in Knots) — float() 本身會拒絕空字串/空白
+        speed_parsed = False
+        if len(parts) >= 8:
+            try:
+                speed_kmh = float(parts[7]) * 1.852
+                self._queue_speed(speed_kmh)
+                self._last_speed_emit_time = now
+                self._last_speed_parse_time = now  # 重置速度解析看門狗
+                speed_parsed = True
+            except ValueError:
+                logger.debug(f"[GPS] Invalid speed field in RMC: '{parts[7]}'")
+        
+        # RMC status='A' 但速度欄位無效 → 模組可能退化，emit 0
+        if not speed_parsed and rmc_status == 'A' and len(parts) >= 8:
+            logger.warning(f"[GPS] RMC active but speed field invalid: '{parts[7]}', emitting 0")
+            self._queue_speed(0.0)
+            self._last_speed_emit_time = now
+        
+        # Parse Position (Fields 3-6: lat, N/S, lon, E/W)
+        if len(parts) >= 7:
+            try:
+                lat_raw = parts[3]
+                lat_dir = parts[4]
+                lon_raw = parts[5]
+                lon_dir = parts[6]
+                
+                # 原始欄位與上一筆完全相同（靜止時很常見）→ 不必重新換算
+                raw_pos = (lat_raw, lat_dir, lon_raw, lon_dir)
+                if lat_raw and lon_raw and raw_pos != self._last_raw_pos:
+                    self._last_raw_pos = raw_pos
+                    # ddmm.mmmm：度數部分為整數，只需一次 float 解析分鐘
+                    lat = int(lat_raw[:2]) + float(lat_raw[2:]) / 60.0
+                    if lat_dir == 'S':
+                        lat = -lat
+                    
+                    lon = int(lon_raw[:3]) + float(lon_raw[3:]) / 60.0
+                    if lon_dir == 'W':
+                        lon = -lon
+                    
+                    if self._position_moved(lat, lon):
+                        self._last_lat = lat
+                        self._last_lon = lon
+                        self._cos_lat2 = math.cos(math.radians(lat)) ** 2
+                        self._queue_position(lat, lon)
+            except (ValueError, IndexError):
+                pass
+        
+        # Fix 狀態判斷：以 RMC status 為準（GGA 與 RMC 分屬不同語句）
+        self._update_status(rmc_status == 'A')
+
+    def stop(self, timeout_ms=None):
+        """停止監控並釋放資源
+
+        timeout_ms 為 None 時等待執行緒結束；否則最多等待 timeout_ms 毫秒就返回，
+        執行緒會在下一次檢查 running 旗標時自行結束並關閉 serial port。
+        """
         self.running = False
-        self.wait() # 等待執行緒結束
+        self._emit_timer.stop()
+        if timeout_ms is None:
+            self.wait() # 等待執行緒結束
+        elif not self.wait(timeout_ms):
+            logger.info("[GPS] Monitor thread stopping in background.")
+            return
         logger.info("[GPS] Monitor thread stopped.")
 
     def inject_external_gps(self, lat: float, lon: float, speed: float, bearing: float, timestamp: str):
@@ -469,8 +587,56 @@ class GPSMonitorThread(QThread):
         if self._last_lat != lat or self._last_lon != lon:
             self._last_lat = lat
             self._last_lon = lon
+            self._last_raw_pos = None  # 內部 GPS 下一筆 RMC 需重新換算
             self.gps_position_changed.emit(lat, lon)
 
+    def _log_throttled(self, level, key, msg):
+        """同一類訊息在 _LOG_THROTTLE_SEC 內只記錄一次（斷線重連迴圈不洗版）"""
+        now = time.monotonic()
+        if now - self._log_times.get(key, -_LOG_THROTTLE_SEC) >= _LOG_THROTTLE_SEC:
+            self._log_times[key] = now
+            logger.log(level, msg)
+
+    def _queue_speed(self, speed_kmh):
+        """記錄最新速度，交由主執行緒合併發射"""
+        with self._pending_lock:
+            self._pending_speed = speed_kmh
+            schedule = not self._flush_scheduled
+            self._flush_scheduled = True
+        if schedule:
+            self._flush_requested.emit()
+
+    def _queue_position(self, lat, lon):
+        """記錄最新座標，交由主執行緒合併發射"""
+        with self._pending_lock:
+            self._pending_pos = (lat, lon)
+            schedule = not self._flush_scheduled
+            self._flush_scheduled = True
+        if schedule:
+            self._flush_requested.emit()
+
+    def _flush_pending(self):
+        """（主執行緒）發射 250ms 內累積的最新速度/座標"""
+        with self._pending_lock:
+            speed, self._pending_speed = self._pending_speed, None
+            pos, self._pending_pos = self._pending_pos, None
+            self._flush_scheduled = False
+        if speed is not None:
+            self.gps_speed_changed.emit(speed)
+        if pos is not None:
+            self.gps_position_changed.emit(*pos)
+
+    def _position_moved(self, lat, lon):
+        """座標位移是否超過門檻（過濾靜止時的 GPS 漂移雜訊）
+
+        以等距近似計算：經度差乘上 cos²(lat) 換算成與緯度相同尺度。
+        """
+        if self._last_lat is None or self._last_lon is None:
+            return True
+        dlat = lat - self._last_lat
+        dlon = lon - self._last_lon
+        return dlat * dlat + dlon * dlon * self._cos_lat2 > _POSITION_EPSILON_DEG2
+
     def _update_status(self, is_fixed):
         # 若正在使用外部 MQTT GPS，且內部 GPS 有 fix，立即切換回內部
         if is_fixed and self._using_external_gps:
@@ -738,3 +904,155 @@ class RadarMonitorThread(QThread):
     def stop(self):
         self.running = False
         self.wait()
+
+
+class NetworkMonitorThread(QThread):
+    """
+    網路 / 服務健康監控執行緒
+    - 常駐單一執行緒，每 5 秒檢查一次是否連網：
+      以 UDP connect 確認有路由（不送出封包），連線中每 30 秒、或路由狀態改變時
+      才做一次 TCP 握手確認真的能連到外部主機
+    - 每 60 秒通知主執行緒做一次服務健康檢查（Spotify / MQTT 重連）
+    - 取代原本每次檢測都新建 threading.Thread 的做法
+    """
+    network_status_checked = pyqtSignal(bool)  # is_connected
+    service_check_due = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self._stop_event = threading.Event()
+        self._connected = False
+        self._had_route = None
+        self._next_tcp_check = 0.0
+
+    def run(self):
+        if self._stop_event.wait(_NETWORK_FIRST_CHECK_DELAY):
+            return
+        next_service_check = time.monotonic() + _SERVICE_HEALTH_INTERVAL
+        while not self._stop_event.is_set():
+            self.network_status_checked.emit(self._check_network())
+            now = time.monotonic()
+            if now >= next_service_check:
+                next_service_check = now + _SERVICE_HEALTH_INTERVAL
+                self.service_check_due.emit()
+            self._stop_event.wait(_NETWORK_CHECK_INTERVAL)
+
+    def _check_network(self):
+        """路由消失立即判定離線；有路由時依間隔決定是否重做 TCP 確認"""
+        has_route = self._has_route()
+        now = time.monotonic()
+        if not has_route:
+            self._connected = False
+        elif (not self._connected or has_route != self._had_route
+                or now >= self._next_tcp_check):
+            self._connected = self._check_connection()
+            self._next_tcp_check = now + _NETWORK_TCP_RECHECK_INTERVAL
+        self._had_route = has_route
+        return self._connected
+
+    @staticmethod
+    def _has_route():
+        """UDP connect 只查路由表，不會送出任何封包"""
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            try:
+                sock.connect(_NETWORK_PROBE_HOSTS[0])
+            finally:
+                sock.close()
+            return True
+        except OSError:
+            return False
+
+    @staticmethod
+    def _check_connection():
+        for host in _NETWORK_PROBE_HOSTS:
+            try:
+                sock = socket.create_connection(host, timeout=3)
+                sock.close()
+                return True
+            except OSError:
+                continue
+        return False
+
+    def stop(self):
+        self._stop_event.set()
+        self.wait()
+
+
+class TelemetryPublisher(QThread):
+    """
+    MQTT 遙測發布執行緒
+    - paho 的 publish() 需要取得 client 內部鎖（與網路執行緒競爭），網路卡住時
+      可能連帶卡住 UI；改由此執行緒代為發布
+    - 佇列只保留最新的少量 payload，滿了就丟掉最舊的一筆（遙測只在乎最新值）；
+      丟掉的若是 retained 發布，retain 旗標會轉給新放入的那筆
+    """
+
+    def __init__(self, maxsize=2):
+        super().__init__()
+        self._queue = queue.Queue(maxsize=maxsize)
+        self.running = False
+
+    def submit(self, client, topic, payload, retain=True):
+        """主執行緒呼叫：放入待發布的 payload，不阻塞"""
+        self._put_latest((client, topic, payload, retain))
+
+    def _put_latest(self, item):
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    dropped = self._queue.get_nowait()
+                except queue.Empty:
+                    continue
+                # 被丟掉的是 retained 發布時，改由較新的這筆帶上 retain，
+                # 否則 broker 上的 retained 訊息要再等一整個間隔才會更新
+                if item is not None and dropped is not None and dropped[3] and not item[3]:
+                    item = item[:3] + (True,)
+
+    def run(self):
+        self.running = True
+        while self.running:
+            item = self._queue.get()
+            if item is None:
+                break
+            client, topic, payload, retain = item
+            try:
+                client.publish(topic, payload, qos=0, retain=retain)
+            except Exception as e:
+                logger.error(f"[TelemetryPublisher] 發布失敗: {e}")
+
+    def stop(self):
+        self.running = False
+        self._put_latest(None)  # 喚醒阻塞中的 get()
+        self.wait()
+
+
+class BackgroundTaskSignals(QObject):
+    """BackgroundTask 的完成通知（QRunnable 本身不是 QObject，無法帶 signal）"""
+    finished = pyqtSignal(str, object)  # (tag, result)；發生例外時 result 為 None
+
+
+class BackgroundTask(QRunnable):
+    """
+    在全域 QThreadPool 執行一次性的阻塞工作（例如 Spotify 初始化）
+    - 重用執行緒池中的執行緒，不必每次建立新的 threading.Thread
+    - 完成後以 signals.finished 通知，接收端在主執行緒處理結果
+    """
+
+    def __init__(self, tag, fn, *args):
+        super().__init__()
+        self.tag = tag
+        self._fn = fn
+        self._args = args
+        self.signals = BackgroundTaskSignals()
+
+    def run(self):
+        try:
+            result = self._fn(*self._args)
+        except Exception as e:
+            logger.error(f"[BackgroundTask] {self.tag} 失敗: {e}")
+            result = None
+        self.signals.finished.emit(self.tag, result)
@@ -613,7 +613,7 @@ def unified_receiver(bus, db, signals):
                         
                         # 記錄來源
                         data_store["OBD"]["rpm"] = raw_rpm
-                        data_store["OBD"]["last_update"] = time.time()
+                        data_store["OBD"]["last_update"] = time.monotonic()
                         
                         # 緩存平滑值，節流更新 UI
                         last_rpm_value = current_rpm_smoothed / 1000.0
@@ -641,7 +641,7 @@ def unified_receiver(bus, db, signals):
                         
                         data_store["OBD"]["speed"] = raw_speed
                         data_store["OBD"]["speed_smoothed"] = current_speed_smoothed
-                        data_store["OBD"]["last_update"] = time.time()
+                        data_store["OBD"]["last_update"] = time.monotonic()
                         
                         # 套用校正係數後更新 UI（依據速度模式）
                         mode = speed_sync_mode